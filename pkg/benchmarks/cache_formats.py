@@ -0,0 +1,149 @@
+"""Benchmark of the storage formats of the control center cache.
+
+Compares the time to save and load a whole cache, and the size of the cache file,
+for the YAML, binary and SQLite backends of `controlman._cache_backend`.
+
+By default, a synthetic cache resembling that of a typical repository is used,
+dominated by the large SPDX license texts (`text_xml`) stored in the `license` type.
+An existing cache file (in YAML or binary format) can be used instead.
+
+Usage:
+
+    python benchmarks/cache_formats.py [--cache PATH] [--repeat N]
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import argparse
+import random
+import string
+import tempfile
+import time
+
+from controlman import _cache_backend, date
+
+
+def synthetic_cache(seed: int = 0) -> dict:
+    """Create a cache with the types and typical sizes of items of a real repository cache."""
+    rng = random.Random(seed)
+    timestamp = date.to_timestamp(date.from_now())
+
+    def text(n_words: int) -> str:
+        return " ".join(
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10))) for _ in range(n_words)
+        )
+
+    def item(data) -> dict:
+        return {"timestamp": timestamp, "data": data}
+
+    licenses = {}
+    for idx in range(8):
+        paragraphs = "".join(f"<p>{text(80)}</p>\n" for _ in range(60))
+        licenses[f"License-{idx}"] = item(
+            {
+                "id": f"License-{idx}",
+                "name": text(5),
+                "text_xml": f"<SPDXLicenseCollection><license>{paragraphs}</license></SPDXLicenseCollection>",
+                "header_xml": f"<standardLicenseHeader>{text(60)}</standardLicenseHeader>",
+                "osi_approved": rng.random() < 0.5,
+                "url_reference": [f"https://example.com/{text(1)}" for _ in range(3)],
+            }
+        )
+    users = {
+        str(idx): item(
+            {
+                "id": idx,
+                "login": text(1),
+                "name": text(2),
+                "bio": text(20),
+                "blog": f"https://{text(1)}.com",
+                "company": text(2),
+                "location": text(2),
+                "socials": {"orcid": {"id": "0000-0000-0000-0000", "url": "https://orcid.org/"}},
+                **{f"{text(1)}_url": f"https://api.github.com/{text(1)}" for _ in range(20)},
+            }
+        )
+        for idx in range(30)
+    }
+    dois = {
+        f"10.1000/{idx}": item(
+            {
+                "doi": f"10.1000/{idx}",
+                "title": text(12),
+                "abstract": text(200),
+                "authors": [text(2) for _ in range(6)],
+                "date_tuple": [2020, 1, 1],
+            }
+        )
+        for idx in range(40)
+    }
+    return {
+        "license": licenses,
+        "user": users,
+        "orcid": {"0000-0000-0000-0000": item(list(dois))},
+        "doi": dois,
+        "python": {"releases": item([f"3.{minor}.{patch}" for minor in range(14) for patch in range(20)])},
+        "repo": {"discussion_categories": item([{"id": text(1), "name": text(2)} for _ in range(8)])},
+    }
+
+
+def items_of(cache: dict):
+    for typ, typ_items in cache.items():
+        for key, item in typ_items.items():
+            yield typ, key, item
+
+
+def benchmark(cache: dict, dirpath: Path, repeat: int) -> dict[str, dict[str, float]]:
+    results = {}
+    for name, filename in (
+        ("yaml", ".metadata_cache.yaml"),
+        ("binary", ".metadata_cache.bin"),
+        ("sqlite", ".metadata_cache.sqlite"),
+    ):
+        path = dirpath / filename
+        save_times = []
+        load_times = []
+        for _ in range(repeat):
+            path.unlink(missing_ok=True)
+            start = time.perf_counter()
+            if name == "sqlite":
+                backend = _cache_backend.SQLiteCacheBackend(path=path)
+                backend.update(items_of(cache))
+                backend.commit()
+            else:
+                class_ = _cache_backend.DictCacheBackend if name == "yaml" else _cache_backend.BinaryCacheBackend
+                backend = class_(data=cache, path=path)
+                backend.commit()
+            save_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            if name == "sqlite":
+                loaded = list(_cache_backend.SQLiteCacheBackend(path=path).items())
+            else:
+                loaded = list(items_of(_cache_backend.read_file(path)))
+            load_times.append(time.perf_counter() - start)
+            assert len(loaded) == len(list(items_of(cache)))
+        results[name] = {
+            "save_ms": min(save_times) * 1000,
+            "load_ms": min(load_times) * 1000,
+            "size_kb": backend.file_size() / 1024,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cache", type=Path, help="Path to an existing cache file to use.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of repetitions; the fastest is reported.")
+    args = parser.parse_args()
+    cache = _cache_backend.read_file(args.cache) if args.cache else synthetic_cache()
+    with tempfile.TemporaryDirectory() as dirpath:
+        results = benchmark(cache, Path(dirpath), repeat=args.repeat)
+    print(f"{'Format':<8}{'Save (ms)':>12}{'Load (ms)':>12}{'Size (KB)':>12}")
+    for name, result in results.items():
+        print(f"{name:<8}{result['save_ms']:>12.1f}{result['load_ms']:>12.1f}{result['size_kb']:>12.1f}")
+    return
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark of the on-disk snapshots of the processed schema registries.
+
+Compares the startup cost of the schema registries in fresh interpreters,
+with the snapshots removed before each run (i.e., the registries are built
+from the bundled YAML schema files) against loading them from existing snapshots
+(see `controlman.data_validator._load_registry_snapshot`).
+
+For each run, the time to get both registry variants (after and before template substitution)
+is measured within the interpreter, along with the wall time of the whole process
+(interpreter startup, importing `controlman.data_validator`, and getting the registries).
+Snapshots are written to a temporary cache directory, leaving the user cache untouched.
+
+Usage:
+
+    python benchmarks/schema_registry.py [--repeat N]
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+CHILD_CODE = """
+import time
+from controlman import data_validator
+start = time.perf_counter()
+data_validator._get_registry(before_substitution=False)
+data_validator._get_registry(before_substitution=True)
+print(time.perf_counter() - start)
+"""
+
+
+def run_child(cache_dir: Path) -> tuple[float, float]:
+    """Get both registries in a fresh interpreter; return the registry and total process times."""
+    env = os.environ | {"XDG_CACHE_HOME": str(cache_dir)}
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_CODE], env=env, capture_output=True, text=True, check=True
+    )
+    process_time = time.perf_counter() - start
+    return float(result.stdout.strip().splitlines()[-1]), process_time
+
+
+def benchmark(cache_dir: Path, repeat: int) -> dict[str, dict[str, float]]:
+    snapshot_dir = cache_dir / "controlman" / "schema"
+    results = {}
+    for name, remove_snapshots in (("build", True), ("snapshot", False)):
+        registry_times = []
+        process_times = []
+        for _ in range(repeat):
+            if remove_snapshots:
+                shutil.rmtree(snapshot_dir, ignore_errors=True)
+            registry_time, process_time = run_child(cache_dir)
+            registry_times.append(registry_time)
+            process_times.append(process_time)
+        if remove_snapshots and not any(snapshot_dir.glob("registry-*.pickle")):
+            raise RuntimeError(f"No registry snapshots were written to '{snapshot_dir}'.")
+        results[name] = {
+            "registry_ms": min(registry_times) * 1000,
+            "process_ms": min(process_times) * 1000,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Number of repetitions; the fastest is reported.")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        results = benchmark(Path(cache_dir), repeat=args.repeat)
+    print(f"{'Mode':<12}{'Registries (ms)':>18}{'Process (ms)':>16}")
+    for name, result in results.items():
+        print(f"{name:<12}{result['registry_ms']:>18.1f}{result['process_ms']:>16.1f}")
+    return
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""Benchmark of the memoized validators of `controlman.data_validator`.
+
+Compares the time of repeated `validate()` calls with a cold validator cache,
+i.e., with the transformed schemas, validators and compiled validation functions
+created anew for each call (as before they were memoized), against a warm cache,
+where they are created once and reused for the life of the process.
+
+A synthetic control center configuration resembling that of a typical repository is used.
+It is validated against the `main` schema before template substitution
+(as done when loading the configuration files), and each of its team members
+is validated against the `entity` schema (as done by `controlman.data_helper.fill_entity`).
+The schema registries are built before timing in both cases,
+and the digests of validated sections are cleared before each call,
+so that unchanged sections are validated again every time.
+
+The semantic checks of `controlman.data_validator.DataValidator` are also timed on the same
+configuration, once with only the checks that were enabled before the cross-references were indexed
+(`dir_paths`, `branch_names` and `trove_classifiers`), and once with all checks
+(`DataValidator.validate`), to compare their added time to that of the schema validation.
+
+Usage:
+
+    python benchmarks/validator_cache.py [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import random
+import string
+import time
+
+from controlman import data_validator
+
+
+def synthetic_config(seed: int = 0, n_members: int = 12, n_forms: int = 10) -> dict:
+    """Create a control center configuration with the sections and typical sizes of a real repository."""
+    rng = random.Random(seed)
+
+    def word() -> str:
+        return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+
+    def text(n_words: int) -> str:
+        return " ".join(word() for _ in range(n_words))
+
+    team = {
+        f"member_{idx}": {
+            "name": {"first": word().title(), "last": word().title()},
+            "email": {"id": f"{word()}@example.com"},
+            "affiliation": text(4),
+            "bio": text(25),
+            "city": word().title(),
+        }
+        for idx in range(n_members)
+    }
+    release_commits = {
+        commit_id: {"type": commit_id, "type_description": text(6), "description": text(15)}
+        for commit_id in ("major", "minor", "patch", "post", "docs", "refactor", "ci", "build", "test", "chore")
+    }
+    dev_commits = {
+        commit_id: {"type": commit_id, "type_description": text(6), "description": text(15)}
+        for commit_id in ("fix", "feat", "change", "deprecate", "remove", "security", "perf", "style", "typo")
+    }
+    labels = {
+        group: {
+            "prefix": f"{group.title()}: ",
+            "color": "#" + "".join(rng.choices("0123456789abcdef", k=6)),
+            "label": {
+                label_id: {"suffix": label_id, "name": f"{group.title()}: {label_id}", "description": text(10)}
+                for label_id in (f"{word()}_{idx}" for idx in range(n_forms))
+            },
+        }
+        for group in ("type", "subtype", "priority", "scope")
+    }
+    labels["single"] = {
+        label_id: {"name": label_id.title(), "color": "#000000", "description": text(8)}
+        for label_id in ("duplicate", "invalid", "question", "wontfix")
+    }
+    type_labels = list(labels["type"]["label"])
+    subtype_labels = list(labels["subtype"]["label"])
+    forms = []
+    for idx in range(n_forms):
+        body = [
+            {"type": "markdown", "attributes": {"value": text(40)}},
+            {
+                "type": "dropdown",
+                "id": "version",
+                "attributes": {"label": "Version", "description": text(10), "multiple": True, "options": ["1.0", "2.0"]},
+                "validations": {"required": True},
+            },
+        ]
+        for elem_idx in range(6):
+            body.append(
+                {
+                    "type": "textarea",
+                    "id": f"field_{elem_idx}",
+                    "attributes": {"label": f"{text(3)} {elem_idx}", "description": text(20), "placeholder": text(10)},
+                    "validations": {"required": elem_idx < 3},
+                }
+            )
+        forms.append(
+            {
+                "id": f"form_{idx}",
+                "commit": list(release_commits)[idx % len(release_commits)],
+                "id_labels": [["type", type_labels[idx]], ["subtype", subtype_labels[idx]]],
+                "labels": [["status", "triage"]],
+                "name": text(3),
+                "description": text(12),
+                "body": body,
+                "processed_body": "\n\n".join(f"### Field {elem_idx}\n\n{{field_{elem_idx}}}" for elem_idx in range(6)),
+            }
+        )
+    member_ids = list(team)
+    return {
+        "name": "SyntheticProject",
+        "title": text(6),
+        "abstract": text(120),
+        "keywords": [text(2) for _ in range(10)],
+        "team": team,
+        "citation": {
+            "cff": {
+                "message": text(12),
+                "title": text(6),
+                "type": "software",
+                "authors": [{"id": member_id} for member_id in member_ids[:4]],
+                "contacts": [{"id": member_ids[0]}],
+            },
+        },
+        "commit": {"release": release_commits, "dev": dev_commits},
+        "label": labels,
+        "issue": {"forms": forms},
+    }
+
+
+def clear_validators() -> None:
+    """Remove all memoized schemas, validators and compiled functions, keeping the registries."""
+    for cache in (
+        data_validator._VALIDATORS,
+        data_validator._SUBSCHEMA_VALIDATORS,
+        data_validator._COMPILERS,
+        data_validator._DEFAULT_PLANS,
+        data_validator._SECTION_VALIDATORS,
+    ):
+        cache.clear()
+    return
+
+
+def time_call(func, repeat: int, cold: bool) -> float:
+    """Get the fastest time of a call, with the validator cache cleared before each call if `cold`."""
+    times = []
+    for _ in range(repeat):
+        if cold:
+            clear_validators()
+        data_validator._SECTION_DIGESTS.clear()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def benchmark(config: dict, repeat: int) -> dict[str, dict[str, float]]:
+
+    def validate_config():
+        data_validator.validate(data=copy.deepcopy(config), schema="main", before_substitution=True)
+        return
+
+    def validate_entity():
+        data_validator.validate(data=copy.deepcopy(entity), schema="entity", before_substitution=True)
+        return
+
+    entity = next(iter(config["team"].values()))
+    data_validator._get_registry(before_substitution=False)
+    data_validator._get_registry(before_substitution=True)
+    results = {}
+    for name, func in (("main", validate_config), ("entity", validate_entity)):
+        results[name] = {
+            "cold_ms": time_call(func, repeat=repeat, cold=True) * 1000,
+            "warm_ms": time_call(func, repeat=repeat, cold=False) * 1000,
+        }
+    return results
+
+
+def benchmark_semantic(config: dict, repeat: int) -> dict[str, float]:
+
+    def validate_before():
+        validator = data_validator.DataValidator(data=data)
+        validator.dir_paths()
+        validator.branch_names()
+        validator.trove_classifiers()
+        return
+
+    def validate_after():
+        data_validator.DataValidator(data=data).validate()
+        return
+
+    data = copy.deepcopy(config)
+    data_validator.validate(data=data, schema="main", before_substitution=True)
+    return {
+        "before_ms": time_call(validate_before, repeat=repeat, cold=False) * 1000,
+        "after_ms": time_call(validate_after, repeat=repeat, cold=False) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="Number of repetitions; the fastest is reported.")
+    args = parser.parse_args()
+    config = synthetic_config()
+    results = benchmark(config, repeat=args.repeat)
+    print(f"{'Schema':<8}{'Cold (ms)':>12}{'Warm (ms)':>12}{'Speedup':>10}")
+    for name, result in results.items():
+        speedup = result["cold_ms"] / result["warm_ms"]
+        print(f"{name:<8}{result['cold_ms']:>12.2f}{result['warm_ms']:>12.2f}{speedup:>9.1f}x")
+    semantic = benchmark_semantic(config, repeat=args.repeat)
+    print()
+    print(f"{'Semantic checks':<18}{'Time (ms)':>12}{'Of main (warm)':>16}")
+    for name, key in (("before", "before_ms"), ("after", "after_ms")):
+        share = semantic[key] / results["main"]["warm_ms"]
+        print(f"{name:<18}{semantic[key]:>12.2f}{share:>15.1%}")
+    return
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,9 @@ def manager(
     github_token: str | None = None,
     future_versions: dict[str, str] | None = None,
     control_center_path: str | None = None,
+    fail_fast: bool = False,
+    max_workers: int | None = 1,
+    memory_cache: bool = False,
 ):
     if isinstance(repo, (str, _Path)):
         repo = _Git(path=repo)
@@ -50,9 +53,54 @@ def manager(
         data_main=data_main,
         github_token=github_token,
         future_versions=future_versions,
+        fail_fast=fail_fast,
+        max_workers=max_workers,
+        memory_cache=memory_cache,
     )
 
 
+def warm_cache(
+    repo: _Git | _Path | str,
+    data_before: _ps.NestedDict | None = None,
+    github_token: str | None = None,
+    control_center_path: str | None = None,
+    max_workers: int = 8,
+) -> dict[str, int]:
+    """Retrieve all web data needed for generating the control center data into the cache.
+
+    Data is retrieved concurrently, so that a subsequent data generation
+    does not need to send any web requests.
+
+    Parameters
+    ----------
+    repo
+        Git manager or path of the repository.
+    data_before
+        Previous control center metadata of the repository.
+        If not provided, it is read from the repository's metadata file.
+    github_token
+        GitHub token to authenticate requests with.
+    control_center_path
+        Relative path to the control center directory,
+        when the repository has no metadata file yet.
+    max_workers
+        Maximum number of concurrent requests.
+
+    Returns
+    -------
+    dict[str, int]
+        Number of keys that were already cached (`cached`),
+        retrieved (`fetched`), and failed to be retrieved (`failed`).
+    """
+    center_manager = manager(
+        repo=repo,
+        data_before=data_before,
+        github_token=github_token,
+        control_center_path=control_center_path,
+    )
+    return center_manager.warm_cache(max_workers=max_workers)
+
+
 def from_json_file(
     repo_path: str | _Path,
     filepath: str = const.FILEPATH_METADATA,
@@ -75,7 +123,7 @@ def from_json_file(
         data = _ps.read.json_from_file(path=_Path(repo_path) / filepath)
     except _ps.exception.read.PySerialsReadException as e:
         raise _exception.load.ControlManInvalidMetadataError(cause=e, filepath=filepath) from None
-    _data_validator.validate(data=data)
+    _validate_metadata(data)
     return _ps.NestedDict(data)
 
 
@@ -94,7 +142,7 @@ def from_json_file_at_commit(
         raise _exception.load.ControlManInvalidMetadataError(
             cause=e, filepath=filepath, commit_hash=commit_hash
         ) from None
-    _data_validator.validate(data=data)
+    _validate_metadata(data)
     return _ps.NestedDict(data)
 
 
@@ -117,10 +165,23 @@ def from_json_string(data: str) -> _ps.NestedDict:
         data = _ps.read.json_from_string(data=data)
     except _ps.exception.read.PySerialsReadException as e:
         raise _exception.load.ControlManInvalidMetadataError(e) from None
-    _data_validator.validate(data=data)
+    _validate_metadata(data)
     return _ps.NestedDict(data)
 
 
+def _validate_metadata(data: dict) -> None:
+    """Validate project metadata, unless its fingerprint shows it is unchanged since its generation.
+
+    Metadata files are only written after passing the final validation,
+    so when both the schema fingerprint and the content digest match,
+    validating again would not change or reject anything.
+    """
+    if _data_validator.has_valid_fingerprint(data):
+        return
+    _data_validator.validate(data=data)
+    return
+
+
 def read_changelog(
     repo_path: str | _Path,
     filepath: str = const.FILEPATH_CHANGELOG,
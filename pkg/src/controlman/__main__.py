@@ -0,0 +1,48 @@
+"""Command-line interface of ControlMan.
+
+Usage:
+
+    python -m controlman warm-cache [--repo PATH] [--github-token TOKEN] [--max-workers N]
+"""
+
+import argparse as _argparse
+import os as _os
+
+import controlman
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _argparse.ArgumentParser(prog="controlman", description="ControlMan command-line interface.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    parser_warm = subparsers.add_parser(
+        "warm-cache",
+        help="Retrieve all web data needed for generating the control center data into the cache.",
+    )
+    parser_warm.add_argument("--repo", default=".", help="Path to the repository (default: current directory).")
+    parser_warm.add_argument(
+        "--control-center-path",
+        help="Relative path to the control center directory, when the repository has no metadata file yet.",
+    )
+    parser_warm.add_argument(
+        "--github-token",
+        default=_os.environ.get("GITHUB_TOKEN"),
+        help="GitHub token to authenticate requests with (default: the GITHUB_TOKEN environment variable).",
+    )
+    parser_warm.add_argument(
+        "--max-workers", type=int, default=8, help="Maximum number of concurrent requests (default: 8)."
+    )
+    args = parser.parse_args(argv)
+    if args.command == "warm-cache":
+        counts = controlman.warm_cache(
+            repo=args.repo,
+            github_token=args.github_token,
+            control_center_path=args.control_center_path,
+            max_workers=args.max_workers,
+        )
+        print(f"Cached: {counts['cached']}, retrieved: {counts['fetched']}, failed: {counts['failed']}")
+        return 1 if counts["failed"] else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,516 @@
+"""Storage backends of the control center cache.
+
+A backend stores cached items, i.e., dictionaries with a `timestamp` and the cached `data`,
+under a cache type and a key within that type (see `controlman.cache_manager.CacheManager`).
+Items may also have an `accessed` timestamp of their last retrieval.
+Retention, eviction, logging and validation of the cache are handled by the cache manager;
+backends only read, write and delete items.
+All backend methods are thread-safe.
+
+Persisted caches can be shared by concurrent processes (e.g., parallel jobs on the same runner).
+Backends therefore merge their changes into the persisted cache on commit, instead of overwriting it:
+an item is only replaced or deleted when the change is based on data at least as recent
+as the persisted item, so that items added or refreshed by other processes are kept.
+"""
+
+from __future__ import annotations as _annotations
+
+from typing import Iterable as _Iterable, Iterator as _Iterator, NamedTuple as _NamedTuple
+from contextlib import contextmanager as _contextmanager
+from pathlib import Path as _Path
+import functools as _functools
+import gzip as _gzip
+import json as _json
+import os as _os
+import sqlite3 as _sqlite3
+import tempfile as _tempfile
+import threading as _threading
+import types as _types
+import zlib as _zlib
+
+import pyserials as _ps
+
+from controlman import date as _date
+
+try:
+    import fcntl as _fcntl
+except ImportError:  # Not available on Windows
+    _fcntl = None
+
+
+# Seconds to wait for other processes to release a lock on an SQLite cache database
+SQLITE_BUSY_TIMEOUT = 60
+# Header of cache files in the binary format, followed by a one-byte format version
+BINARY_MAGIC = b"CMCACHE"
+BINARY_VERSION = 1
+
+
+def _synchronized(method):
+    """Decorate a backend method to run while holding the lock of the backend.
+
+    Generators are exhausted while holding the lock.
+    """
+    @_functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            result = method(self, *args, **kwargs)
+            if isinstance(result, _types.GeneratorType):
+                result = iter(list(result))
+        return result
+    return wrapper
+
+
+class EntryInfo(_NamedTuple):
+    """Metadata of a cached item."""
+    typ: str
+    key: str
+    timestamp: str
+    accessed: str | None
+    size: int
+    """Size of the serialized data in bytes."""
+
+
+class CacheBackend:
+    """Base class for cache storage backends."""
+
+    _path: _Path | None = None
+
+    def get(self, typ: str, key: str) -> dict | None:
+        """Get a cached item, or `None` if it does not exist."""
+        raise NotImplementedError
+
+    def set(self, typ: str, key: str, item: dict) -> None:
+        """Add or replace a cached item."""
+        raise NotImplementedError
+
+    def touch(self, typ: str, key: str, timestamp: str) -> None:
+        """Record the time of the last retrieval of a cached item."""
+        raise NotImplementedError
+
+    def delete(self, keys: _Iterable[tuple[str, str]]) -> None:
+        """Delete cached items, given as tuples of type and key."""
+        raise NotImplementedError
+
+    def items(self) -> _Iterator[tuple[str, str, dict]]:
+        """Iterate over all cached items as tuples of type, key and item."""
+        raise NotImplementedError
+
+    def entries(self) -> _Iterator[EntryInfo]:
+        """Iterate over the metadata of all cached items, without loading their data."""
+        raise NotImplementedError
+
+    def commit(self) -> None:
+        """Persist all changes made since the last commit."""
+        raise NotImplementedError
+
+    def compact(self) -> None:
+        """Reclaim unused storage space. Changes must be committed first."""
+        return
+
+    def file_size(self) -> int:
+        """Size of the persisted cache in bytes."""
+        if not (self._path and self._path.is_file()):
+            return 0
+        return self._path.stat().st_size
+
+
+class DictCacheBackend(CacheBackend):
+    """Cache held in a dictionary, and written as a single YAML file on commit.
+
+    On commit, the file is locked, items added or refreshed in the file since it was read
+    are merged into the cache, and the cache is written to a temporary file
+    that then atomically replaces the original file.
+    Readers thus never see a partially written file.
+
+    Parameters
+    ----------
+    data
+        Cache data, as a mapping of types to mappings of keys to items.
+    path
+        Path to the YAML file. If `None`, the cache is only held in memory.
+    """
+
+    def __init__(self, data: dict | None = None, path: _Path | None = None):
+        self._data = data if data is not None else {}
+        self._path = path
+        self._lock = _threading.RLock()
+        # Timestamps of deleted items, to avoid restoring them from the file on commit
+        self._deleted: dict[tuple[str, str], str] = {}
+        return
+
+    @_synchronized
+    def get(self, typ: str, key: str) -> dict | None:
+        return self._data.get(typ, {}).get(key)
+
+    @_synchronized
+    def set(self, typ: str, key: str, item: dict) -> None:
+        self._data.setdefault(typ, {})[key] = item
+        self._deleted.pop((typ, key), None)
+        return
+
+    @_synchronized
+    def touch(self, typ: str, key: str, timestamp: str) -> None:
+        self._data[typ][key]["accessed"] = timestamp
+        return
+
+    @_synchronized
+    def delete(self, keys: _Iterable[tuple[str, str]]) -> None:
+        for typ, key in keys:
+            item = self._data.get(typ, {}).pop(key, None)
+            if item:
+                self._deleted[(typ, key)] = item["timestamp"]
+            if not self._data.get(typ, True):
+                self._data.pop(typ)
+        return
+
+    @_synchronized
+    def items(self) -> _Iterator[tuple[str, str, dict]]:
+        for typ, typ_items in self._data.items():
+            for key, item in typ_items.items():
+                yield typ, key, item
+
+    @_synchronized
+    def entries(self) -> _Iterator[EntryInfo]:
+        for typ, key, item in self.items():
+            yield EntryInfo(
+                typ=typ,
+                key=key,
+                timestamp=item["timestamp"],
+                accessed=item.get("accessed"),
+                size=data_size(item["data"]),
+            )
+
+    @_synchronized
+    def commit(self) -> None:
+        if not self._path:
+            return
+        with _file_lock(self._path):
+            self._merge(self._read_file())
+            _write_file_atomic(self._path, self._serialize())
+        self._deleted = {}
+        return
+
+    def _serialize(self) -> bytes:
+        """Serialize the cache to the content of the cache file."""
+        return _ps.write.to_yaml_string(data=self._data).encode("utf-8")
+
+    def _read_file(self) -> dict:
+        """Read the current content of the cache file, ignoring missing or corrupted files."""
+        if not self._path.is_file():
+            return {}
+        try:
+            return read_file(self._path)
+        except ValueError:
+            return {}
+
+    def _merge(self, data: dict) -> None:
+        """Merge items of the cache file that are newer than the corresponding items in memory."""
+        for typ, typ_items in data.items():
+            if not isinstance(typ_items, dict):
+                continue
+            for key, item in typ_items.items():
+                try:
+                    timestamp = _date.from_timestamp(item["timestamp"])
+                except (TypeError, KeyError, ValueError):
+                    continue
+                current = self._data.get(typ, {}).get(key)
+                reference = current["timestamp"] if current else self._deleted.get((typ, key))
+                if reference is None or timestamp > _date.from_timestamp(reference):
+                    self._data.setdefault(typ, {})[key] = item
+                elif current and item.get("accessed") and (
+                    not current.get("accessed") or _timestamp_ge(item["accessed"], current["accessed"])
+                ):
+                    current["accessed"] = item["accessed"]
+        return
+
+
+class BinaryCacheBackend(DictCacheBackend):
+    """Cache held in a dictionary, and written as a single compressed binary file on commit.
+
+    The file consists of `BINARY_MAGIC`, a one-byte format version (`BINARY_VERSION`),
+    and the gzip-compressed JSON serialization of the cache.
+    Since the cache is dominated by large strings (e.g., license texts),
+    this is much smaller, and much faster to read and write, than the YAML file.
+    """
+
+    def _serialize(self) -> bytes:
+        return encode_binary(self._data)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Cache stored in an SQLite database, with one row per item.
+
+    Items are read by key without loading the rest of the cache,
+    and only changed items are written.
+    Changes, along with retrieval times recorded by `touch`,
+    are held in memory and written in a single short transaction on `commit`,
+    so that the database is not locked for other processes in the meantime.
+    The database uses write-ahead logging, so that readers and the writer do not block each other.
+
+    Parameters
+    ----------
+    path
+        Path to the database file. The file and its parent directories are created if needed.
+
+    Raises
+    ------
+    sqlite3.DatabaseError
+        If the file exists but is not a valid cache database.
+    """
+
+    def __init__(self, path: _Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._pending: dict[tuple[str, str], dict] = {}
+        self._deleted: dict[tuple[str, str], str] = {}
+        self._accessed: dict[tuple[str, str], str] = {}
+        self._lock = _threading.RLock()
+        self._connection = _sqlite3.connect(path, timeout=SQLITE_BUSY_TIMEOUT, check_same_thread=False)
+        self._connection.create_function("timestamp_ge", 2, _timestamp_ge, deterministic=True)
+        try:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "type TEXT NOT NULL, key TEXT NOT NULL, timestamp TEXT NOT NULL, data TEXT NOT NULL, "
+                "accessed TEXT, "
+                "PRIMARY KEY (type, key)"
+                ") WITHOUT ROWID"
+            )
+            columns = {row[1] for row in self._connection.execute("PRAGMA table_info(cache)")}
+            if "accessed" not in columns:
+                self._connection.execute("ALTER TABLE cache ADD COLUMN accessed TEXT")
+            self._connection.commit()
+        except _sqlite3.DatabaseError:
+            self._connection.close()
+            raise
+        return
+
+    @_synchronized
+    def get(self, typ: str, key: str) -> dict | None:
+        if (typ, key) in self._pending:
+            return self._pending[(typ, key)]
+        if (typ, key) in self._deleted:
+            return
+        row = self._connection.execute(
+            "SELECT timestamp, data FROM cache WHERE type = ? AND key = ?", (typ, key)
+        ).fetchone()
+        if row is None:
+            return
+        return {"timestamp": row[0], "data": _json.loads(row[1])}
+
+    @_synchronized
+    def set(self, typ: str, key: str, item: dict) -> None:
+        self._pending[(typ, key)] = item
+        self._deleted.pop((typ, key), None)
+        return
+
+    @_synchronized
+    def touch(self, typ: str, key: str, timestamp: str) -> None:
+        self._accessed[(typ, key)] = timestamp
+        return
+
+    @_synchronized
+    def delete(self, keys: _Iterable[tuple[str, str]]) -> None:
+        for typ, key in keys:
+            item = self.get(typ, key)
+            self._pending.pop((typ, key), None)
+            if item:
+                self._deleted[(typ, key)] = item["timestamp"]
+        return
+
+    @_synchronized
+    def items(self) -> _Iterator[tuple[str, str, dict]]:
+        for typ, key, timestamp, data, accessed in self._connection.execute(
+            "SELECT type, key, timestamp, data, accessed FROM cache"
+        ):
+            if (typ, key) in self._pending or (typ, key) in self._deleted:
+                continue
+            item = {"timestamp": timestamp, "data": _json.loads(data)}
+            if accessed:
+                item["accessed"] = accessed
+            yield typ, key, item
+        for (typ, key), item in self._pending.items():
+            yield typ, key, item
+
+    @_synchronized
+    def entries(self) -> _Iterator[EntryInfo]:
+        for typ, key, timestamp, accessed, size in self._connection.execute(
+            "SELECT type, key, timestamp, accessed, length(CAST(data AS BLOB)) FROM cache"
+        ):
+            if (typ, key) in self._pending or (typ, key) in self._deleted:
+                continue
+            yield EntryInfo(
+                typ=typ,
+                key=key,
+                timestamp=timestamp,
+                accessed=self._accessed.get((typ, key), accessed),
+                size=size,
+            )
+        for (typ, key), item in self._pending.items():
+            yield EntryInfo(
+                typ=typ,
+                key=key,
+                timestamp=item["timestamp"],
+                accessed=self._accessed.get((typ, key), item.get("accessed")),
+                size=data_size(item["data"]),
+            )
+
+    @_synchronized
+    def commit(self) -> None:
+        """Write all changes in a single transaction.
+
+        Items are only replaced if they are at least as recent as the stored ones,
+        and only deleted if they have not been replaced by a more recent item in the meantime.
+        """
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._connection.executemany(
+                "INSERT INTO cache (type, key, timestamp, data, accessed) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (type, key) DO UPDATE SET "
+                "timestamp = excluded.timestamp, data = excluded.data, "
+                "accessed = coalesce(excluded.accessed, cache.accessed) "
+                "WHERE timestamp_ge(excluded.timestamp, cache.timestamp)",
+                (
+                    (typ, key, item["timestamp"], _dump(item["data"]), item.get("accessed"))
+                    for (typ, key), item in self._pending.items()
+                ),
+            )
+            self._connection.executemany(
+                "DELETE FROM cache WHERE type = ? AND key = ? AND timestamp_ge(?, timestamp)",
+                ((typ, key, timestamp) for (typ, key), timestamp in self._deleted.items()),
+            )
+            self._connection.executemany(
+                "UPDATE cache SET accessed = ? "
+                "WHERE type = ? AND key = ? AND (accessed IS NULL OR timestamp_ge(?, accessed))",
+                ((timestamp, typ, key, timestamp) for (typ, key), timestamp in self._accessed.items()),
+            )
+        except BaseException:
+            self._connection.rollback()
+            raise
+        self._connection.commit()
+        self._pending = {}
+        self._deleted = {}
+        self._accessed = {}
+        return
+
+    @_synchronized
+    def file_size(self) -> int:
+        size = super().file_size()
+        path_wal = self._path.with_name(f"{self._path.name}-wal")
+        if path_wal.is_file():
+            size += path_wal.stat().st_size
+        return size
+
+    @_synchronized
+    def compact(self) -> None:
+        self._connection.execute("VACUUM")
+        # Move the vacuumed database from the write-ahead log into the database file
+        self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return
+
+    @_synchronized
+    def update(self, items: _Iterator[tuple[str, str, dict]]) -> None:
+        """Add or replace multiple items."""
+        for typ, key, item in items:
+            self.set(typ, key, item)
+        return
+
+
+def read_file(path: _Path) -> dict:
+    """Read a cache file, detecting whether it is in the binary or the YAML format.
+
+    Raises
+    ------
+    ValueError
+        If the file is corrupted or not a cache file.
+    """
+    content = path.read_bytes()
+    if content.startswith(BINARY_MAGIC):
+        return decode_binary(content)
+    try:
+        data = _ps.read.yaml_from_string(data=content.decode("utf-8"))
+    except (UnicodeDecodeError, _ps.exception.read.PySerialsReadException) as e:
+        raise ValueError(f"Cache file '{path}' is not a valid YAML file.") from e
+    if data is None:
+        return {}
+    if not isinstance(data, dict):
+        raise ValueError(f"Cache file '{path}' does not contain a mapping.")
+    return data
+
+
+def encode_binary(data: dict) -> bytes:
+    """Serialize cache data to the binary format."""
+    payload = _gzip.compress(_dump(data).encode("utf-8"), compresslevel=6, mtime=0)
+    return BINARY_MAGIC + bytes([BINARY_VERSION]) + payload
+
+
+def decode_binary(content: bytes) -> dict:
+    """Deserialize cache data from the binary format.
+
+    Raises
+    ------
+    ValueError
+        If the content is corrupted, or in an unsupported version of the format.
+    """
+    header_length = len(BINARY_MAGIC) + 1
+    if len(content) < header_length or not content.startswith(BINARY_MAGIC):
+        raise ValueError("Content is not in the binary cache format.")
+    version = content[header_length - 1]
+    if version != BINARY_VERSION:
+        raise ValueError(f"Unsupported binary cache format version {version}.")
+    try:
+        data = _json.loads(_gzip.decompress(content[header_length:]))
+    except (OSError, EOFError, _zlib.error, ValueError) as e:
+        raise ValueError("Binary cache content is corrupted.") from e
+    if not isinstance(data, dict):
+        raise ValueError("Binary cache content does not contain a mapping.")
+    return data
+
+
+@_contextmanager
+def _file_lock(path: _Path) -> _Iterator[None]:
+    """Hold an exclusive advisory lock on a lock file next to the given file.
+
+    Where advisory locks are not supported (i.e., on Windows), no lock is acquired.
+    """
+    if _fcntl is None:
+        yield
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(f"{path.name}.lock"), "a") as lock_file:
+        _fcntl.flock(lock_file, _fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            _fcntl.flock(lock_file, _fcntl.LOCK_UN)
+    return
+
+
+def _write_file_atomic(path: _Path, content: bytes) -> None:
+    """Write a file via a temporary file in the same directory, which then replaces the file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, path_temp = _tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with _os.fdopen(fd, "wb") as file:
+            file.write(content)
+            file.flush()
+            _os.fsync(file.fileno())
+        _os.replace(path_temp, path)
+    except BaseException:
+        _Path(path_temp).unlink(missing_ok=True)
+        raise
+    return
+
+
+def _timestamp_ge(timestamp: str, other: str) -> bool:
+    """Whether a timestamp is at least as recent as another."""
+    return _date.from_timestamp(timestamp) >= _date.from_timestamp(other)
+
+
+def data_size(data) -> int:
+    """Size of cached data in bytes, as serialized in the cache."""
+    return len(_dump(data).encode("utf-8"))
+
+
+def _dump(data) -> str:
+    return _json.dumps(data, ensure_ascii=False, separators=(",", ":"))
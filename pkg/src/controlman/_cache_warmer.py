@@ -0,0 +1,268 @@
+"""Concurrent warm-up of the control center cache.
+
+`warm` determines the cache keys of all data that is retrieved from the web
+when generating the control center data (see `controlman.center_manager.CenterManager.generate_data`),
+and retrieves the data of all keys missing from the cache concurrently,
+so that the generation itself does not need to send any web requests.
+
+Keys are read from the control center configuration files and the previous metadata;
+data whose keys are only known after generation (e.g., users added in the current changes
+that do not yet have a GitHub ID) is still retrieved during generation.
+"""
+
+from __future__ import annotations as _annotations
+
+from typing import Any as _Any, Callable as _Callable, Iterator as _Iterator, TYPE_CHECKING as _TYPE_CHECKING
+from concurrent import futures as _futures
+from pathlib import Path as _Path
+import functools as _functools
+
+import pylinks as _pl
+from pylinks.exception.api import WebAPIError as _WebAPIError
+import pyserials as _ps
+import mdit as _mdit
+from loggerman import logger as _logger
+from licenseman import spdx as _spdx
+
+from controlman import const as _const, exception as _exception
+from controlman import data_helper as _data_helper, data_loader as _data_loader
+from controlman.data_gen.python import fetch_python_releases as _fetch_python_releases
+
+if _TYPE_CHECKING:
+    from gittidy import Git
+    from controlman.cache_manager import CacheManager
+
+
+_Task = tuple[str, _Any, _Callable[[], _Any]]
+
+
+def warm(
+    path_cc: _Path,
+    data_before: dict,
+    cache_manager: CacheManager,
+    github_api: _pl.api.GitHub,
+    git: Git,
+    max_workers: int = 8,
+) -> dict[str, int]:
+    """Retrieve all missing or expired web data needed for generating the control center data into the cache.
+
+    External configurations (`!ext` tags) are retrieved first,
+    since the other keys depend on the loaded configurations.
+    Publications of ORCID users are retrieved once their list of DOIs is known.
+    The cache is saved afterward.
+
+    Parameters
+    ----------
+    path_cc
+        Path to the control center directory.
+    data_before
+        Previous control center metadata of the repository.
+    cache_manager
+        Cache to fill.
+    github_api
+        GitHub API instance used to retrieve users, Python releases and discussion categories.
+        Discussion categories are only retrieved when it is authenticated.
+    git
+        Git manager of the repository.
+    max_workers
+        Maximum number of concurrent requests.
+
+    Returns
+    -------
+    dict[str, int]
+        Number of keys that were already cached (`cached`),
+        retrieved (`fetched`), and failed to be retrieved (`failed`),
+        including those with recently cached failures (see `CacheManager.get_failure`).
+    """
+    counts = dict.fromkeys(("cached", "fetched", "failed"), 0)
+    with cache_manager.http_cache():
+        _run(_extension_tasks(path_cc), cache_manager=cache_manager, max_workers=max_workers, counts=counts)
+        try:
+            data = _data_loader.load(path_cc=path_cc, cache_manager=cache_manager)
+        except _exception.ControlManException:
+            _logger.warning(
+                "Cache Warm-Up",
+                "Failed to load the control center configurations; "
+                "only keys from the previous metadata are retrieved.",
+                _logger.traceback(),
+            )
+            data = {}
+        _run(
+            _data_tasks(data=data, data_before=data_before, github_api=github_api, git=git),
+            cache_manager=cache_manager,
+            max_workers=max_workers,
+            counts=counts,
+        )
+    cache_manager.save()
+    _logger.success(
+        "Cache Warm-Up",
+        f"Found {counts['cached']} keys in the cache, retrieved {counts['fetched']}, "
+        f"and failed to retrieve {counts['failed']}.",
+    )
+    return counts
+
+
+def _run(
+    tasks: list[_Task],
+    cache_manager: CacheManager,
+    max_workers: int,
+    counts: dict[str, int],
+) -> None:
+    """Retrieve the data of all tasks whose keys are not cached, and add them to the cache.
+
+    Data is retrieved in worker threads, but only added to the cache in the calling thread.
+    """
+    pending: dict[_futures.Future, tuple[str, _Any]] = {}
+    seen = set()
+
+    def submit(new_tasks: list[_Task]) -> None:
+        for typ, key, fetch in new_tasks:
+            if (typ, key) in seen:
+                continue
+            seen.add((typ, key))
+            value = cache_manager.get(typ, key)
+            if value:
+                counts["cached"] += 1
+                submit(_followup_tasks(typ, value))
+                continue
+            if cache_manager.get_failure(typ, key):
+                # Not retried until the cached failure expires
+                counts["failed"] += 1
+                continue
+            pending[executor.submit(fetch)] = (typ, key)
+        return
+
+    with _futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="controlman-cache-warm") as executor:
+        submit(tasks)
+        while pending:
+            done, _ = _futures.wait(pending, return_when=_futures.FIRST_COMPLETED)
+            for future in done:
+                typ, key = pending.pop(future)
+                try:
+                    value = future.result()
+                except Exception as e:
+                    if isinstance(e, _WebAPIError):
+                        cache_manager.set_failure(typ, key, e)
+                    counts["failed"] += 1
+                    _logger.warning(
+                        _mdit.inline_container("Cache Warm-Up for ", _mdit.element.code_span(f"{typ}.{key}")),
+                        "Failed to retrieve data.",
+                        _logger.traceback(),
+                    )
+                    continue
+                cache_manager.set(typ, key, value)
+                counts["fetched"] += 1
+                submit(_followup_tasks(typ, value))
+    return
+
+
+def _extension_tasks(path_cc: _Path) -> list[_Task]:
+    """Get tasks for all external configurations (`!ext` tags) in the control center configuration files."""
+
+    def collect_tag(loader, node) -> None:
+        tag_values.append(loader.construct_scalar(node))
+        return
+
+    tag_values = []
+    for filepath in _data_loader.config_filepaths(path_cc):
+        if not filepath.read_text().strip():
+            continue
+        try:
+            _ps.read.yaml_from_file(
+                path=filepath,
+                safe=True,
+                constructors={_const.CC_EXTENSION_TAG: collect_tag},
+            )
+        except _ps.exception.read.PySerialsReadException:
+            # Invalid files are reported when loading the configurations
+            continue
+    return [
+        ("extension", tag_value, _functools.partial(_data_loader.fetch_external_data, tag_value=tag_value))
+        for tag_value in tag_values if tag_value
+    ]
+
+
+def _data_tasks(data: dict, data_before: dict, github_api: _pl.api.GitHub, git: Git) -> list[_Task]:
+    """Get tasks for all other web data, given the loaded configurations and the previous metadata."""
+    tasks = []
+    for source in (data, data_before):
+        for entity in _iter_entities(source):
+            github = entity.get("github")
+            if isinstance(github, dict) and github.get("rest_id"):
+                user_id = github["rest_id"]
+                tasks.append(
+                    ("user", user_id, _functools.partial(_data_helper.fetch_github_user, github_api, user_id=user_id))
+                )
+            orcid = entity.get("orcid")
+            if isinstance(orcid, dict) and orcid.get("get_pubs") and orcid.get("user"):
+                tasks.append(("orcid", orcid["user"], _functools.partial(_fetch_orcid_dois, orcid["user"])))
+    for source in (data, data_before):
+        expression = (source.get("license") or {}).get("expression")
+        if not isinstance(expression, str) or "${{" in expression:
+            continue
+        try:
+            license_ids, _ = _spdx.expression.license_ids(expression)
+            exception_ids, _ = _spdx.expression.exception_ids(expression)
+        except Exception:
+            # Invalid expressions are reported during data generation
+            continue
+        for spdx_ids, func in ((license_ids, _spdx.license), (exception_ids, _spdx.exception)):
+            tasks.extend(
+                ("license", spdx_id, _functools.partial(_fetch_spdx, func, spdx_id)) for spdx_id in spdx_ids
+            )
+        break
+    if data.get("pkg") or data_before.get("pkg"):
+        tasks.append(("python", "releases", _functools.partial(_fetch_python_releases, github_api)))
+    if github_api.authenticated:
+        repo_address = git.get_remote_repo_name(
+            remote_name="origin",
+            remote_purpose="push",
+            fallback_name=False,
+            fallback_purpose=False,
+        )
+        if repo_address:
+            tasks.append(
+                (
+                    "repo",
+                    "discussion_categories",
+                    _functools.partial(_fetch_discussion_categories, github_api, *repo_address),
+                )
+            )
+    return tasks
+
+
+def _followup_tasks(typ: str, value: _Any) -> list[_Task]:
+    """Get tasks for data whose keys are given by the data of another key."""
+    if typ != "orcid":
+        return []
+    return [("doi", doi, _functools.partial(_fetch_doi, doi)) for doi in value]
+
+
+def _iter_entities(data: _Any) -> _Iterator[dict]:
+    """Iterate over all objects in the data that have GitHub or ORCID accounts."""
+    if isinstance(data, list):
+        for elem in data:
+            yield from _iter_entities(elem)
+    if not isinstance(data, dict):
+        return
+    if isinstance(data.get("github"), dict) or isinstance(data.get("orcid"), dict):
+        yield data
+    for value in data.values():
+        yield from _iter_entities(value)
+    return
+
+
+def _fetch_orcid_dois(orcid_id: str) -> list[str]:
+    return _pl.api.orcid(orcid_id=orcid_id).doi
+
+
+def _fetch_doi(doi: str) -> dict:
+    return _pl.api.doi(doi=doi).curated
+
+
+def _fetch_spdx(func: _Callable, spdx_id: str) -> dict:
+    return func(spdx_id).raw_data
+
+
+def _fetch_discussion_categories(github_api: _pl.api.GitHub, username: str, repo_name: str) -> list[dict]:
+    return github_api.user(username).repo(repo_name).discussion_categories()
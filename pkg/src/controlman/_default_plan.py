@@ -0,0 +1,291 @@
+"""Fill default values from JSON schemas into instances without validating them.
+
+For each schema, a plan is derived once from the registry:
+for every subschema, an ordered list of steps that add the default values of its properties
+and apply the plans of its subschemas to the corresponding parts of the instance.
+Applying a plan is then a plain walk over the instance.
+
+The plan follows the same keywords as default filling during validation
+(see `controlman.data_validator._DefaultFillingValidator`), in the same order.
+Since nothing is validated, alternative subschemas (`anyOf`, `oneOf`) are selected
+by the JSON type of the instance, i.e., the first alternative accepting the instance's type is applied.
+This matches validation for the bundled schemas, whose alternatives differ in type
+(e.g., the object schemas and template strings in the `anyOf` clauses added by `modify_schema`).
+The `if` conditions of `if`-`then`-`else` clauses are evaluated by validating the instance.
+Any remaining defaults are filled by the final validation.
+"""
+
+from typing import Any as _Any, Callable as _Callable
+import copy as _copy
+import re as _re
+
+from jsonschema import _utils as _jsonschema_utils
+import referencing as _referencing
+from referencing import jsonschema as _referencing_jsonschema
+
+from controlman._schema_compiler import SchemaCompiler as _SchemaCompiler
+
+
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+
+class DefaultPlan:
+    """Default-value plans of all schemas in a registry.
+
+    Plans of subschemas are shared between all schemas applied by the same instance,
+    so one instance should be used per schema registry.
+
+    Parameters
+    ----------
+    registry
+        Registry used to resolve references.
+    compiler
+        Compiler of the same registry, used to evaluate `if` conditions.
+    """
+
+    def __init__(self, registry: _referencing.Registry, compiler: _SchemaCompiler):
+        self._registry = registry
+        self._compiler = compiler
+        self._steps: dict[int, list[_Callable[[_Any], None]]] = {}
+        # Planned schemas are kept alive so that their IDs remain unique.
+        self._schemas: list = []
+        return
+
+    def apply(self, schema: dict | bool, instance: _Any) -> None:
+        """Fill the default values of a schema into an instance, in place.
+
+        Parameters
+        ----------
+        schema
+            Root schema.
+        instance
+            Instance of the root schema.
+        """
+        steps = self._steps.get(id(schema))
+        if steps is None:
+            resolver = self._registry.resolver_with_root(
+                _referencing_jsonschema.DRAFT202012.create_resource(schema)
+            )
+            steps = self._plan(schema, resolver)
+        _apply(steps, instance)
+        return
+
+    def _plan(self, schema: dict | bool, resolver: _referencing._core.Resolver) -> list[_Callable[[_Any], None]]:
+        """Get the steps of a subschema, planning it on first request.
+
+        The (initially empty) list of steps is registered before planning,
+        so that recursive references end up at the same list.
+        """
+        if not isinstance(schema, dict):
+            return []
+        steps = self._steps.get(id(schema))
+        if steps is not None:
+            return steps
+        steps = self._steps[id(schema)] = []
+        self._schemas.append(schema)
+        for keyword, value in schema.items():
+            planner = getattr(self, f"_plan_{keyword.removeprefix('$')}", None)
+            if planner is None:
+                continue
+            try:
+                step = planner(value, schema, resolver)
+            except _referencing.exceptions.Unresolvable:
+                continue
+            if step:
+                steps.append(step)
+        return steps
+
+    def _descend(self, subschema: dict | bool, resolver: _referencing._core.Resolver):
+        if isinstance(subschema, dict):
+            resolver = resolver.in_subresource(_referencing_jsonschema.DRAFT202012.create_resource(subschema))
+        return self._plan(subschema, resolver)
+
+    def _plan_ref(self, ref, schema, resolver):
+        resolved = resolver.lookup(ref)
+        steps = self._plan(resolved.contents, resolved.resolver)
+
+        def step(instance):
+            _apply(steps, instance)
+            return
+
+        return step
+
+    def _plan_properties(self, properties, schema, resolver):
+        defaults = [
+            (prop, subschema["default"], isinstance(subschema["default"], _IMMUTABLE_TYPES))
+            for prop, subschema in properties.items()
+            if isinstance(subschema, dict) and "default" in subschema
+        ]
+        children = [(prop, self._descend(subschema, resolver)) for prop, subschema in properties.items()]
+
+        def step(instance):
+            if not isinstance(instance, dict):
+                return
+            for prop, default, immutable in defaults:
+                if prop not in instance:
+                    instance[prop] = default if immutable else _copy.deepcopy(default)
+            for prop, steps in children:
+                if steps and prop in instance:
+                    _apply(steps, instance[prop])
+            return
+
+        return step
+
+    def _plan_patternProperties(self, pattern_properties, schema, resolver):
+        children = [
+            (_re.compile(pattern), self._descend(subschema, resolver))
+            for pattern, subschema in pattern_properties.items()
+        ]
+
+        def step(instance):
+            if not isinstance(instance, dict):
+                return
+            for regex, steps in children:
+                if not steps:
+                    continue
+                for key, value in instance.items():
+                    if regex.search(key):
+                        _apply(steps, value)
+            return
+
+        return step
+
+    def _plan_additionalProperties(self, additional_properties, schema, resolver):
+        if not isinstance(additional_properties, dict):
+            return
+        steps = self._descend(additional_properties, resolver)
+
+        def step(instance):
+            if not (steps and isinstance(instance, dict)):
+                return
+            for key in list(_jsonschema_utils.find_additional_properties(instance, schema)):
+                _apply(steps, instance[key])
+            return
+
+        return step
+
+    def _plan_prefixItems(self, prefix_items, schema, resolver):
+        children = [self._descend(subschema, resolver) for subschema in prefix_items]
+
+        def step(instance):
+            if not isinstance(instance, list):
+                return
+            for item, steps in zip(instance, children):
+                _apply(steps, item)
+            return
+
+        return step
+
+    def _plan_items(self, items, schema, resolver):
+        if not isinstance(items, dict):
+            return
+        prefix = len(schema.get("prefixItems", []))
+        steps = self._descend(items, resolver)
+
+        def step(instance):
+            if not (steps and isinstance(instance, list)):
+                return
+            for item in instance[prefix:]:
+                _apply(steps, item)
+            return
+
+        return step
+
+    def _plan_allOf(self, all_of, schema, resolver):
+        children = [self._descend(subschema, resolver) for subschema in all_of]
+
+        def step(instance):
+            for steps in children:
+                _apply(steps, instance)
+            return
+
+        return step
+
+    def _plan_anyOf(self, alternatives, schema, resolver):
+        children = [
+            (_accepted_types(subschema, resolver, set()), self._descend(subschema, resolver))
+            for subschema in alternatives
+        ]
+
+        def step(instance):
+            instance_types = _instance_types(instance)
+            for accepted_types, steps in children:
+                if accepted_types is None or not accepted_types.isdisjoint(instance_types):
+                    _apply(steps, instance)
+                    break
+            return
+
+        return step
+
+    _plan_oneOf = _plan_anyOf
+
+    def _plan_if(self, if_schema, schema, resolver):
+        condition = self._compiler.compile(if_schema, resolver)
+        then_steps = self._descend(schema["then"], resolver) if "then" in schema else []
+        else_steps = self._descend(schema["else"], resolver) if "else" in schema else []
+
+        def step(instance):
+            _apply(then_steps if condition(instance, False) else else_steps, instance)
+            return
+
+        return step
+
+
+def _apply(steps: list[_Callable[[_Any], None]], instance: _Any) -> None:
+    for step in steps:
+        step(instance)
+    return
+
+
+def _instance_types(instance: _Any) -> tuple[str, ...]:
+    """Get the names of all JSON types of an instance."""
+    if isinstance(instance, dict):
+        return ("object",)
+    if isinstance(instance, list):
+        return ("array",)
+    if isinstance(instance, str):
+        return ("string",)
+    if isinstance(instance, bool):
+        return ("boolean",)
+    if instance is None:
+        return ("null",)
+    if isinstance(instance, int) or isinstance(instance, float) and instance.is_integer():
+        return ("integer", "number")
+    if isinstance(instance, float):
+        return ("number",)
+    return ()
+
+
+def _accepted_types(
+    schema: dict | bool,
+    resolver: _referencing._core.Resolver,
+    visited: set[int],
+) -> frozenset[str] | None:
+    """Get the JSON types accepted by a schema, or `None` if they cannot be determined."""
+    if schema is True:
+        return None
+    if not isinstance(schema, dict):
+        return frozenset()
+    if id(schema) in visited:
+        return None
+    visited.add(id(schema))
+    if "type" in schema:
+        types = schema["type"]
+        return frozenset([types] if isinstance(types, str) else types)
+    if "const" in schema:
+        return frozenset(_instance_types(schema["const"]))
+    if "enum" in schema:
+        return frozenset(typ for value in schema["enum"] for typ in _instance_types(value))
+    if "$ref" in schema:
+        try:
+            resolved = resolver.lookup(schema["$ref"])
+        except _referencing.exceptions.Unresolvable:
+            return None
+        return _accepted_types(resolved.contents, resolved.resolver, visited)
+    for keyword in ("anyOf", "oneOf"):
+        if keyword in schema:
+            alternatives = [_accepted_types(subschema, resolver, visited) for subschema in schema[keyword]]
+            if any(types is None for types in alternatives):
+                return None
+            return frozenset().union(*alternatives)
+    return None
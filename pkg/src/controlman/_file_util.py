@@ -1,6 +1,11 @@
+import os as _os
+from pathlib import Path as _Path
+
 import pkgdata as _pkgdata
 import pyserials as _ps
 
+from controlman import const as _const
+
 
 _data_dir_path = _pkgdata.get_package_path_from_caller(top_level=True) / "_data"
 
@@ -19,3 +24,14 @@ def get_package_datafile(path: str) -> str | dict | list:
     if full_path.suffix == ".yaml":
         return _ps.read.yaml_from_string(data=data, safe=True)
     return data
+
+
+def get_user_cache_dir() -> _Path:
+    """Get the path to ControlMan's user-level cache directory.
+
+    This is the `controlman` directory under `$XDG_CACHE_HOME`,
+    or under `~/.cache` when the environment variable is not set.
+    The directory is not created.
+    """
+    cache_root = _os.environ.get("XDG_CACHE_HOME") or _Path.home() / ".cache"
+    return _Path(cache_root) / _const.DIRNAME_USER_CACHE
@@ -0,0 +1,191 @@
+"""Transport-level cache of HTTP responses with conditional revalidation.
+
+All web requests sent by `pylinks` (i.e., via `pylinks.http.request`, which includes all its web API calls)
+within `enable` are sent through sessions with a mounted `CachingHTTPAdapter`.
+Other users of `requests` in the process are not affected.
+Responses to successful GET requests that carry an `ETag` or `Last-Modified` header
+are stored in a cache backend.
+When the same request is sent again, it is sent as a conditional request
+with `If-None-Match`/`If-Modified-Since` headers; if the server responds with
+`304 Not Modified`, the stored response is returned instead,
+without transferring the body again (for GitHub, such responses also do not count against the rate limit).
+
+Freshness of the data itself is still decided by `controlman.cache_manager.CacheManager`;
+requests only reach this layer when the corresponding cached data is missing or expired,
+so stored responses are always revalidated.
+"""
+
+from __future__ import annotations as _annotations
+
+from typing import Iterator as _Iterator, TYPE_CHECKING as _TYPE_CHECKING
+from contextlib import contextmanager as _contextmanager
+import base64 as _base64
+import hashlib as _hashlib
+import threading as _threading
+
+import requests as _requests
+from requests import adapters as _adapters, structures as _structures, utils as _requests_utils
+from pylinks import http as _pylinks_http
+
+from controlman import date as _date
+
+if _TYPE_CHECKING:
+    from controlman._cache_backend import CacheBackend
+
+
+CACHE_TYPE = "http"
+
+_lock = _threading.Lock()
+_active_modules: list[_CachedRequestsModule] = []
+_original_requests_module = _pylinks_http.requests
+# Headers describing the transferred body, which do not apply to the stored (decoded) body
+_TRANSFER_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+class CachingHTTPAdapter(_adapters.HTTPAdapter):
+    """HTTP transport adapter that stores GET responses and revalidates them conditionally.
+
+    Parameters
+    ----------
+    backend
+        Cache backend to store the responses in, under the type `CACHE_TYPE`.
+    """
+
+    def __init__(self, backend: CacheBackend, **kwargs):
+        super().__init__(**kwargs)
+        self._backend = backend
+        return
+
+    def send(self, request: _requests.PreparedRequest, stream: bool = False, **kwargs) -> _requests.Response:
+        if request.method != "GET" or stream:
+            return super().send(request, stream=stream, **kwargs)
+        key = _cache_key(request)
+        item = self._backend.get(CACHE_TYPE, key)
+        entry = item["data"] if item else None
+        if entry:
+            if entry["headers"].get("etag"):
+                request.headers["If-None-Match"] = entry["headers"]["etag"]
+            if entry["headers"].get("last-modified"):
+                request.headers["If-Modified-Since"] = entry["headers"]["last-modified"]
+        response = super().send(request, stream=stream, **kwargs)
+        if response.status_code == 304 and entry:
+            # Update stored headers (e.g., `Date`, `Cache-Control`) with those of the revalidation response
+            entry["headers"] |= _stored_headers(response)
+            self._store(key, entry)
+            return self._build_response(request, entry, connection_response=response)
+        if response.status_code == 200 and (
+            response.headers.get("ETag") or response.headers.get("Last-Modified")
+        ):
+            self._store(
+                key,
+                {
+                    "url": request.url,
+                    "status": response.status_code,
+                    "reason": response.reason,
+                    "headers": _stored_headers(response),
+                    "body": _base64.b64encode(response.content).decode("ascii"),
+                },
+            )
+        return response
+
+    def _store(self, key: str, entry: dict) -> None:
+        item = {"timestamp": _date.to_timestamp(_date.from_now()), "data": entry}
+        self._backend.set(CACHE_TYPE, key, item)
+        return
+
+    def _build_response(
+        self,
+        request: _requests.PreparedRequest,
+        entry: dict,
+        connection_response: _requests.Response,
+    ) -> _requests.Response:
+        response = _requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry["reason"]
+        response.headers = _structures.CaseInsensitiveDict(entry["headers"])
+        response.encoding = _requests_utils.get_encoding_from_headers(response.headers)
+        response._content = _base64.b64decode(entry["body"])
+        response.url = connection_response.url
+        response.request = request
+        response.connection = self
+        connection_response.close()
+        return response
+
+
+class _CachedRequestsModule:
+    """Stand-in for the `requests` module used by `pylinks.http`, sending requests through cached sessions.
+
+    `pylinks.http.request` calls `requests.request`, which sends each request in a new session.
+    Instead, each thread gets its own session (as sessions are not thread-safe),
+    with the caching adapter mounted for HTTP(S) URLs.
+    All other attributes are those of the `requests` module.
+    """
+
+    def __init__(self, adapter: CachingHTTPAdapter):
+        self._adapter = adapter
+        self._local = _threading.local()
+        self._sessions: list[_requests.Session] = []
+        self._sessions_lock = _threading.Lock()
+        return
+
+    def __getattr__(self, name: str):
+        return getattr(_requests, name)
+
+    def request(self, method: str, url: str, **kwargs) -> _requests.Response:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = _requests.Session()
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session.request(method=method, url=url, **kwargs)
+
+    def close(self) -> None:
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions = []
+        self._adapter.close()
+        return
+
+
+@_contextmanager
+def enable(backend: CacheBackend) -> _Iterator[CachingHTTPAdapter]:
+    """Send all requests of `pylinks` within the context through sessions with a caching adapter.
+
+    Contexts can be nested; the innermost one is used.
+    """
+    adapter = CachingHTTPAdapter(backend=backend)
+    requests_module = _CachedRequestsModule(adapter=adapter)
+    with _lock:
+        _active_modules.append(requests_module)
+        _pylinks_http.requests = requests_module
+    try:
+        yield adapter
+    finally:
+        with _lock:
+            _active_modules.remove(requests_module)
+            _pylinks_http.requests = _active_modules[-1] if _active_modules else _original_requests_module
+        requests_module.close()
+    return
+
+
+def _stored_headers(response: _requests.Response) -> dict[str, str]:
+    """Get the headers of a response to store, with lowercase names."""
+    return {
+        name.lower(): value for name, value in response.headers.items() if name.lower() not in _TRANSFER_HEADERS
+    }
+
+
+def _cache_key(request: _requests.PreparedRequest) -> str:
+    """Get the cache key of a request.
+
+    Responses may depend on the credentials of the request (e.g., private data on GitHub),
+    so a digest of the `Authorization` header is part of the key.
+    """
+    authorization = request.headers.get("Authorization")
+    if not authorization:
+        return request.url
+    digest = _hashlib.sha256(authorization.encode()).hexdigest()[:16]
+    return f"{request.url} {digest}"
@@ -0,0 +1,431 @@
+"""Compile JSON schemas into specialized validation functions.
+
+The generic `jsonschema` validators dispatch every keyword of every subschema at runtime,
+creating new validator objects for each descent.
+Here, each subschema is instead translated once into the source code of a Python function
+that checks exactly the keywords of that subschema, and fills in default values
+in the same way as `controlman.data_validator._DefaultFillingValidator`.
+Subschemas using keywords that are not compiled are delegated to the generic validator.
+
+Each generated function has the signature `(instance, full: bool) -> bool`,
+returning whether the instance is valid.
+With `full` set, all keywords and subschemas are evaluated (like `jsonschema`'s `iter_errors`),
+otherwise evaluation stops at the first error (like `jsonschema`'s `is_valid`).
+Keywords and subschemas are evaluated in exactly the same order and with the same
+short-circuiting as in `jsonschema`, so that the same default values are filled in.
+The functions only determine validity; error reports are still created by the generic validator.
+"""
+
+from typing import Any as _Any, Callable as _Callable
+from collections.abc import Mapping as _Mapping, Sequence as _Sequence
+import copy as _copy
+import numbers as _numbers
+import re as _re
+
+import jsonschema as _jsonschema
+from jsonschema import _utils as _jsonschema_utils
+import referencing as _referencing
+from referencing import jsonschema as _referencing_jsonschema
+
+
+_TYPE_CHECKS = {
+    "array": "isinstance(inst, list)",
+    "boolean": "isinstance(inst, bool)",
+    "integer": "(isinstance(inst, int) and not isinstance(inst, bool) or isinstance(inst, float) and inst.is_integer())",
+    "null": "inst is None",
+    "number": "(isinstance(inst, _Number) and not isinstance(inst, bool))",
+    "object": "isinstance(inst, dict)",
+    "string": "isinstance(inst, str)",
+}
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+_FAIL = ["if not full:", "    return False", "ok = False"]
+
+
+class _UnsupportedSchema(Exception):
+    """Raised when a subschema cannot be compiled and must be delegated to the generic validator."""
+
+
+class SchemaCompiler:
+    """Compiler of JSON schemas into specialized validation-plus-default-filling functions.
+
+    Compiled subschemas are shared between all schemas compiled by the same instance,
+    so one compiler should be used per schema registry.
+
+    Parameters
+    ----------
+    registry
+        Registry used to resolve references.
+    validator_class
+        Default-filling `jsonschema` validator class the compiled functions mirror,
+        used for subschemas that cannot be compiled.
+        Validators of this class are created without a format checker,
+        so the `format` keyword is not checked.
+    """
+
+    def __init__(self, registry: _referencing.Registry, validator_class: type[_jsonschema.protocols.Validator]):
+        self._registry = registry
+        self._validator_class = validator_class
+        self._namespace: dict[str, _Any] = {
+            "_Number": _numbers.Number,
+            "_deepcopy": _copy.deepcopy,
+            "_equal": _jsonschema_utils.equal,
+            "_uniq": _unique_items,
+            "_find_additional_properties": _jsonschema_utils.find_additional_properties,
+            "_true": lambda inst, full: True,
+            "_false": lambda inst, full: False,
+        }
+        self._function_names: dict[int, str] = {}
+        self._pending: list[tuple[str, dict, _referencing._core.Resolver]] = []
+        # Compiled schemas are kept alive so that their IDs remain unique.
+        self._schemas: list = []
+        self._count = 0
+        return
+
+    def compile(
+        self, schema: dict | bool, resolver: _referencing._core.Resolver | None = None
+    ) -> _Callable[[_Any, bool], bool]:
+        """Get the validation function of a schema, compiling it on first request.
+
+        Parameters
+        ----------
+        schema
+            Root schema to compile.
+        resolver
+            Resolver for references in the schema.
+            Defaults to a resolver of the registry with the schema as root resource.
+        """
+        name = self._function_names.get(id(schema))
+        if name is not None:
+            return self._namespace[name]
+        if resolver is None:
+            resolver = self._registry.resolver_with_root(
+                _referencing_jsonschema.DRAFT202012.create_resource(schema)
+            )
+        name = self._function_name(schema, resolver)
+        lines = []
+        while self._pending:
+            function_name, subschema, subschema_resolver = self._pending.pop()
+            lines.extend(self._compile_function(function_name, subschema, subschema_resolver))
+        if lines:
+            code = compile("\n".join(lines), "<controlman-compiled-schema>", "exec")
+            exec(code, self._namespace)
+        return self._namespace[name]
+
+    def _function_name(self, schema: dict | bool, resolver: _referencing._core.Resolver) -> str:
+        """Get the name of the function validating a subschema, scheduling its compilation if new."""
+        if schema is True:
+            return "_true"
+        if schema is False:
+            return "_false"
+        name = self._function_names.get(id(schema))
+        if name is None:
+            name = self._function_names[id(schema)] = f"_v{len(self._function_names)}"
+            self._schemas.append(schema)
+            self._pending.append((name, schema, resolver))
+        return name
+
+    def _descend(self, subschema: dict | bool, resolver: _referencing._core.Resolver) -> str:
+        if isinstance(subschema, dict):
+            resolver = resolver.in_subresource(_referencing_jsonschema.DRAFT202012.create_resource(subschema))
+        return self._function_name(subschema, resolver)
+
+    def _const(self, value: _Any) -> str:
+        """Add a constant to the namespace of the generated code and return its name."""
+        name = f"_c{self._count}"
+        self._count += 1
+        self._namespace[name] = value
+        return name
+
+    def _compile_function(self, name: str, schema: dict, resolver: _referencing._core.Resolver) -> list[str]:
+        body = ["ok = True"]
+        try:
+            for keyword, value in schema.items():
+                if keyword not in self._validator_class.VALIDATORS or keyword == "format":
+                    continue
+                method = getattr(self, f"_keyword_{keyword.removeprefix('$')}", None)
+                if method is None:
+                    raise _UnsupportedSchema(keyword)
+                body.extend(method(value, schema, resolver))
+        except (_UnsupportedSchema, _referencing.exceptions.Unresolvable):
+            validator = self._validator_class(schema, registry=self._registry, _resolver=resolver)
+            validator_name = self._const(validator)
+            body = [
+                "if full:",
+                f"    return not list({validator_name}.iter_errors(inst))",
+                f"return {validator_name}.is_valid(inst)",
+            ]
+        else:
+            body.append("return ok")
+        return [f"def {name}(inst, full):", *_indent(body), ""]
+
+    def _keyword_ref(self, ref, schema, resolver):
+        resolved = resolver.lookup(ref)
+        function = self._function_name(resolved.contents, resolved.resolver)
+        return [f"if not {function}(inst, full):", *_indent(_FAIL)]
+
+    def _keyword_type(self, types, schema, resolver):
+        types = [types] if isinstance(types, str) else types
+        if any(typ not in _TYPE_CHECKS for typ in types):
+            raise _UnsupportedSchema("type")
+        condition = " or ".join(_TYPE_CHECKS[typ] for typ in types)
+        return [f"if not ({condition}):", *_indent(_FAIL)]
+
+    def _keyword_enum(self, enums, schema, resolver):
+        if all(isinstance(each, str) for each in enums):
+            # `equal` compares strings with `==`, so membership can be checked by hash.
+            return [f"if not (isinstance(inst, str) and inst in {self._const(frozenset(enums))}):", *_indent(_FAIL)]
+        return [f"if all(not _equal(each, inst) for each in {self._const(enums)}):", *_indent(_FAIL)]
+
+    def _keyword_const(self, const, schema, resolver):
+        return [f"if not _equal(inst, {self._const(const)}):", *_indent(_FAIL)]
+
+    def _keyword_required(self, required, schema, resolver):
+        lines = []
+        for prop in required:
+            lines.extend([f"if {self._const(prop)} not in inst:", *_indent(_FAIL)])
+        return ["if isinstance(inst, dict):", *_indent(lines)] if lines else []
+
+    def _keyword_properties(self, properties, schema, resolver):
+        defaults = []
+        checks = []
+        for prop, subschema in properties.items():
+            prop_name = self._const(prop)
+            if isinstance(subschema, dict) and "default" in subschema:
+                default = subschema["default"]
+                value = (
+                    self._const(default) if isinstance(default, _IMMUTABLE_TYPES)
+                    else f"_deepcopy({self._const(default)})"
+                )
+                defaults.extend([f"if {prop_name} not in inst:", f"    inst[{prop_name}] = {value}"])
+            function = self._descend(subschema, resolver)
+            if function == "_true":
+                continue
+            checks.extend(
+                [
+                    f"if {prop_name} in inst and not {function}(inst[{prop_name}], full):",
+                    *_indent(_FAIL),
+                ]
+            )
+        lines = defaults + checks
+        return ["if isinstance(inst, dict):", *_indent(lines)] if lines else []
+
+    def _keyword_patternProperties(self, pattern_properties, schema, resolver):
+        lines = []
+        for pattern, subschema in pattern_properties.items():
+            regex = self._const(_re.compile(pattern))
+            function = self._descend(subschema, resolver)
+            lines.extend(
+                [
+                    "for _k, _v in inst.items():",
+                    f"    if {regex}.search(_k) and not {function}(_v, full):",
+                    *_indent(_FAIL, 2),
+                ]
+            )
+        return ["if isinstance(inst, dict):", *_indent(lines)] if lines else []
+
+    def _keyword_additionalProperties(self, additional_properties, schema, resolver):
+        if isinstance(additional_properties, dict):
+            function = self._descend(additional_properties, resolver)
+            lines = [
+                f"for _k in set(_find_additional_properties(inst, {self._const(schema)})):",
+                f"    if not {function}(inst[_k], full):",
+                *_indent(_FAIL, 2),
+            ]
+        elif not additional_properties:
+            lines = [
+                f"if set(_find_additional_properties(inst, {self._const(schema)})):",
+                *_indent(_FAIL),
+            ]
+        else:
+            return []
+        return ["if isinstance(inst, dict):", *_indent(lines)]
+
+    def _keyword_propertyNames(self, property_names, schema, resolver):
+        function = self._descend(property_names, resolver)
+        return [
+            "if isinstance(inst, dict):",
+            "    for _k in inst:",
+            f"        if not {function}(_k, full):",
+            *_indent(_FAIL, 3),
+        ]
+
+    def _keyword_prefixItems(self, prefix_items, schema, resolver):
+        lines = []
+        for index, subschema in enumerate(prefix_items):
+            function = self._descend(subschema, resolver)
+            lines.extend([f"if len(inst) > {index} and not {function}(inst[{index}], full):", *_indent(_FAIL)])
+        return ["if isinstance(inst, list):", *_indent(lines)] if lines else []
+
+    def _keyword_items(self, items, schema, resolver):
+        prefix = len(schema.get("prefixItems", []))
+        if items is False:
+            lines = [f"if len(inst) > {prefix}:", *_indent(_FAIL)]
+        elif isinstance(items, dict):
+            function = self._descend(items, resolver)
+            lines = [
+                f"for _i in range({prefix}, len(inst)):",
+                f"    if not {function}(inst[_i], full):",
+                *_indent(_FAIL, 2),
+            ]
+        else:
+            return []
+        return ["if isinstance(inst, list):", *_indent(lines)]
+
+    def _keyword_contains(self, contains, schema, resolver):
+        function = self._descend(contains, resolver)
+        min_contains = self._const(schema.get("minContains", 1))
+        max_contains = (
+            self._const(schema["maxContains"]) if "maxContains" in schema else "len(inst)"
+        )
+        return [
+            "if isinstance(inst, list):",
+            "    _matches = 0",
+            f"    _max = {max_contains}",
+            "    for _v in inst:",
+            f"        if {function}(_v, False):",
+            "            _matches += 1",
+            "            if _matches > _max:",
+            *_indent(_FAIL, 4),
+            "                break",
+            "    else:",
+            f"        if _matches < {min_contains}:",
+            *_indent(_FAIL, 3),
+        ]
+
+    def _keyword_allOf(self, all_of, schema, resolver):
+        lines = []
+        for subschema in all_of:
+            function = self._descend(subschema, resolver)
+            lines.extend([f"if not {function}(inst, full):", *_indent(_FAIL)])
+        return lines
+
+    def _keyword_anyOf(self, any_of, schema, resolver):
+        functions = [self._descend(subschema, resolver) for subschema in any_of]
+        condition = " or ".join(f"{function}(inst, True)" for function in functions) or "False"
+        return [f"if not ({condition}):", *_indent(_FAIL)]
+
+    def _keyword_oneOf(self, one_of, schema, resolver):
+        functions = [self._descend(subschema, resolver) for subschema in one_of]
+        return [
+            "_rest = ()",
+            f"_subschemas = ({', '.join(functions)},)",
+            "for _i, _f in enumerate(_subschemas):",
+            "    if _f(inst, True):",
+            "        _rest = _subschemas[_i + 1:]",
+            "        break",
+            "else:",
+            *_indent(_FAIL),
+            "if [_f for _f in _rest if _f(inst, False)]:",
+            *_indent(_FAIL),
+        ]
+
+    def _keyword_not(self, not_schema, schema, resolver):
+        function = self._descend(not_schema, resolver)
+        return [f"if {function}(inst, False):", *_indent(_FAIL)]
+
+    def _keyword_if(self, if_schema, schema, resolver):
+        function = self._descend(if_schema, resolver)
+        lines = [f"if {function}(inst, False):"]
+        if "then" in schema:
+            then_function = self._descend(schema["then"], resolver)
+            lines.extend([f"    if not {then_function}(inst, full):", *_indent(_FAIL, 2)])
+        else:
+            lines.append("    pass")
+        if "else" in schema:
+            else_function = self._descend(schema["else"], resolver)
+            lines.extend(["else:", f"    if not {else_function}(inst, full):", *_indent(_FAIL, 2)])
+        return lines
+
+    def _keyword_dependentRequired(self, dependent_required, schema, resolver):
+        lines = []
+        for prop, dependency in dependent_required.items():
+            for each in dependency:
+                lines.extend(
+                    [
+                        f"if {self._const(prop)} in inst and {self._const(each)} not in inst:",
+                        *_indent(_FAIL),
+                    ]
+                )
+        return ["if isinstance(inst, dict):", *_indent(lines)] if lines else []
+
+    def _keyword_uniqueItems(self, unique_items, schema, resolver):
+        if not unique_items:
+            return []
+        return ["if isinstance(inst, list) and not _uniq(inst):", *_indent(_FAIL)]
+
+    def _keyword_minLength(self, value, schema, resolver):
+        return _size_check("isinstance(inst, str)", "<", self._const(value))
+
+    def _keyword_maxLength(self, value, schema, resolver):
+        return _size_check("isinstance(inst, str)", ">", self._const(value))
+
+    def _keyword_minItems(self, value, schema, resolver):
+        return _size_check("isinstance(inst, list)", "<", self._const(value))
+
+    def _keyword_maxItems(self, value, schema, resolver):
+        return _size_check("isinstance(inst, list)", ">", self._const(value))
+
+    def _keyword_minProperties(self, value, schema, resolver):
+        return _size_check("isinstance(inst, dict)", "<", self._const(value))
+
+    def _keyword_maxProperties(self, value, schema, resolver):
+        return _size_check("isinstance(inst, dict)", ">", self._const(value))
+
+    def _keyword_minimum(self, value, schema, resolver):
+        return _number_check("<", self._const(value))
+
+    def _keyword_maximum(self, value, schema, resolver):
+        return _number_check(">", self._const(value))
+
+    def _keyword_exclusiveMinimum(self, value, schema, resolver):
+        return _number_check("<=", self._const(value))
+
+    def _keyword_exclusiveMaximum(self, value, schema, resolver):
+        return _number_check(">=", self._const(value))
+
+    def _keyword_pattern(self, pattern, schema, resolver):
+        regex = self._const(_re.compile(pattern))
+        return [f"if isinstance(inst, str) and not {regex}.search(inst):", *_indent(_FAIL)]
+
+
+def _unique_items(container: list) -> bool:
+    """Check whether all elements of an array are unique, with the same result as `jsonschema._utils.uniq`.
+
+    For elements that cannot be sorted (e.g., objects), `uniq` compares all pairs of elements.
+    Instead, these are converted to hashable keys that are equal exactly when
+    the elements are equal according to `jsonschema._utils.equal`.
+    """
+    try:
+        sorted(_jsonschema_utils.unbool(element) for element in container)
+    except (NotImplementedError, TypeError):
+        try:
+            keys = [_equality_key(element) for element in container]
+        except TypeError:
+            return _jsonschema_utils.uniq(container)
+        return len(set(keys)) == len(keys)
+    return _jsonschema_utils.uniq(container)
+
+
+def _equality_key(value: _Any):
+    if isinstance(value, str):
+        return "str", value
+    if isinstance(value, bool):
+        return "bool", value
+    if isinstance(value, _Sequence):
+        return "sequence", tuple(_equality_key(element) for element in value)
+    if isinstance(value, _Mapping):
+        return "mapping", frozenset((key, _equality_key(element)) for key, element in value.items())
+    hash(value)
+    return "other", value
+
+
+def _size_check(type_check: str, operator: str, limit: str) -> list[str]:
+    return [f"if {type_check} and len(inst) {operator} {limit}:", *_indent(_FAIL)]
+
+
+def _number_check(operator: str, limit: str) -> list[str]:
+    return [f"if {_TYPE_CHECKS['number']} and inst {operator} {limit}:", *_indent(_FAIL)]
+
+
+def _indent(lines: list[str], level: int = 1) -> list[str]:
+    return [f"{'    ' * level}{line}" for line in lines]
@@ -1,5 +1,12 @@
+from typing import Any as _Any, Callable as _Callable, Iterable as _Iterable, Literal as _Literal
+from concurrent.futures import Future as _Future, ThreadPoolExecutor as _ThreadPoolExecutor
+from collections import OrderedDict as _OrderedDict
 from pathlib import Path as _Path
+import copy as _copy
 import datetime as _datetime
+import sqlite3 as _sqlite3
+import threading as _threading
+import time as _time
 
 
 from loggerman import logger as _logger
@@ -8,20 +15,120 @@ import mdit as _mdit
 
 from controlman import exception as _exception, const as _const
 from controlman import data_validator as _data_validator
+from controlman import _cache_backend, _file_util, _http_cache
 from controlman import date
 
+
+class _MemoryCache:
+    """Process-wide LRU cache of items, shared by all `CacheManager` instances using it.
+
+    Items are copied on the way in and out,
+    so that callers cannot modify the items seen by other cache managers.
+    """
+
+    def __init__(self, max_items: int):
+        self.max_items = max_items
+        self._items: _OrderedDict[tuple[str, str], dict] = _OrderedDict()
+        self._lock = _threading.Lock()
+        return
+
+    def get(self, typ: str, key: str) -> dict | None:
+        with self._lock:
+            item = self._items.get((typ, key))
+            if item is None:
+                return
+            self._items.move_to_end((typ, key))
+        return _copy.deepcopy(item)
+
+    def set(self, typ: str, key: str, item: dict) -> None:
+        item = _copy.deepcopy(item)
+        with self._lock:
+            self._items[(typ, key)] = item
+            self._items.move_to_end((typ, key))
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+        return
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+        return
+
+
+_MEMORY_CACHE = _MemoryCache(max_items=2048)
+# Repository-independent cache types that are shared via the in-memory cache tier;
+# other types (e.g., `repo`, `http` or `failure`) are always specific to their cache manager.
+MEMORY_CACHE_TYPES = ("user", "orcid", "doi", "python", "license", "extension")
+# Maximum number of threads refreshing stale items in the background
+_REFRESH_MAX_WORKERS = 4
+# Cache type of failed retrievals (negative cache items)
+FAILURE_TYPE = "failure"
+# Counters of cache statistics (see `CacheManager.stats`)
+STATS_COUNTERS = ("hits", "misses", "expirations", "sets", "bytes_read", "bytes_written", "fetch_seconds")
+
+
 class CacheManager:
+    """Cache of data from web APIs and other online sources.
+
+    Parameters
+    ----------
+    path_local_cache
+        Path to the local cache directory of the repository.
+        If not provided, the cache is only held in memory.
+    retention_hours
+        Number of hours to keep each type of cached data.
+    backend
+        Storage backend of the cache file;
+        either an SQLite database (default), a single YAML file,
+        or a single compressed binary file (see `controlman._cache_backend.BinaryCacheBackend`).
+        When using SQLite or the binary file and no such cache exists yet,
+        an existing YAML cache file is migrated into a new cache and then removed.
+    limits
+        Maximum number of items (`max_items`) and total size of data in bytes (`max_bytes`)
+        to keep for each type of cached data.
+        When exceeded, the least recently used items are evicted on `save`.
+    memory_cache
+        Use the process-wide in-memory cache tier, shared by all cache managers that use it.
+        Items are looked up there first, with the same retention hours,
+        and items retrieved from or added to this cache are also added there.
+        This avoids reading and fetching repository-independent data (e.g., users or licenses)
+        again for each repository processed in the same process.
+        Only the types in `MEMORY_CACHE_TYPES` are shared;
+        all other types are repository-specific and always read from the cache manager's own storage.
+    global_types
+        Cache types that do not depend on the repository (e.g., `user` or `license`).
+        These are stored in an SQLite database in the global cache directory
+        shared by all repositories on the machine, instead of the local cache of the repository,
+        so that new clones of any repository can use them right away.
+        Items of these types that are still in a local cache are ignored and expire there.
+    path_global_cache
+        Path to the global cache directory.
+        Defaults to ControlMan's user-level cache directory (see `controlman._file_util.get_user_cache_dir`).
+    revalidate_types
+        Cache types using a stale-while-revalidate policy.
+        When an expired item of these types is requested with a `refresh` function (see `get`),
+        the expired data is returned immediately, and the function is called in a background thread
+        to fetch the up-to-date data, which is added to the cache before it is saved.
+        Expired items of these types are not removed on `save`, but only evicted by `limits`,
+        so that they remain available when a refresh fails or is not requested.
+    """
 
     def __init__(
         self,
         path_local_cache: _Path | str | None = None,
         retention_hours: dict[str, float] | None = None,
+        backend: _Literal["sqlite", "yaml", "binary"] = "sqlite",
+        limits: dict[str, dict[str, int]] | None = None,
+        memory_cache: bool = False,
+        global_types: _Iterable[str] = (),
+        path_global_cache: _Path | str | None = None,
+        revalidate_types: _Iterable[str] = (),
     ):
 
-        def log_msg_new_cache(reason: str | None = None, traceback: bool = False):
+        def log_msg_new_cache(reason: str | None = None, traceback: bool = False, path: _Path | None = None):
             msg = _mdit.inline_container(
                 "The provided filepath ",
-                _mdit.element.code_span(str(self._path)),
+                _mdit.element.code_span(str(path or self._path)),
                 f" for control center cache {reason}. ",
                 "Initialized a new cache.",
             ) if reason else "No filepath provided for control center cache. Initialized a new cache."
@@ -31,41 +138,157 @@ class CacheManager:
             _logger.warning(log_title, *log_content, stack_up=1)
             return
 
+        def log_msg_loaded(path: _Path):
+            _logger.success(
+                log_title,
+                _mdit.inline_container(
+                    "Loaded control center cache from ",
+                    _mdit.element.code_span(str(path)),
+                )
+            )
+            return
+
+        def log_msg_migrated(path_from: _Path):
+            _logger.success(
+                log_title,
+                _mdit.inline_container(
+                    "Migrated control center cache from ",
+                    _mdit.element.code_span(str(path_from)),
+                    " to ",
+                    _mdit.element.code_span(str(self._path)),
+                    ".",
+                )
+            )
+            return
+
+        def read_file(path: _Path) -> dict:
+            if not path.is_file():
+                log_msg_new_cache("does not exist", path=path)
+                return {}
+            try:
+                cache = _cache_backend.read_file(path)
+            except (OSError, ValueError):
+                log_msg_new_cache("is corrupted", traceback=True, path=path)
+                return {}
+            try:
+                _data_validator.validate(
+                    data=cache,
+                    schema="cache",
+                )
+            except _exception.ControlManException:
+                log_msg_new_cache("is invalid", traceback=True, path=path)
+                return {}
+            log_msg_loaded(path)
+            return cache
+
+        def open_sqlite(path: _Path) -> tuple[_cache_backend.SQLiteCacheBackend, bool]:
+            """Open an SQLite cache, and whether it is new (as opposed to loaded or recreated)."""
+            is_new = not path.is_file()
+            try:
+                backend = _cache_backend.SQLiteCacheBackend(path=path)
+            except _sqlite3.DatabaseError:
+                if is_new:
+                    raise
+                log_msg_new_cache("is corrupted", traceback=True, path=path)
+                path.unlink()
+                return _cache_backend.SQLiteCacheBackend(path=path), False
+            if not is_new:
+                log_msg_loaded(path)
+            return backend, is_new
+
         log_title = "Cache Initialization"
 
-        self._cache = {}
         self._retention_hours = retention_hours or {}
+        self._limits = limits or {}
+        self._memory_cache = memory_cache
+        self._revalidate_types = set(revalidate_types)
+        self._refresh_executor: _ThreadPoolExecutor | None = None
+        self._refreshes: dict[tuple[str, str], _Future] = {}
+        self._stats: dict[str, dict[str, int | float]] = {}
+        # Times of unsuccessful retrievals, to measure the time spent fetching the data before it is set
+        self._miss_times: dict[tuple[str, str], float] = {}
 
-        if path_local_cache:
-            self._path = _Path(path_local_cache).resolve() / _const.DIRNAME_LOCAL_REPODYNAMICS / _const.FILENAME_METADATA_CACHE
-            if not self._path.is_file():
-                log_msg_new_cache("does not exist")
+        self._global_types = set(global_types)
+        self._path_global = None
+        self._global_backend = None
+        if self._global_types:
+            path_global = _Path(
+                path_global_cache or _file_util.get_user_cache_dir()
+            ).resolve() / _const.FILENAME_METADATA_CACHE_DB
+            try:
+                self._global_backend, is_new = open_sqlite(path_global)
+            except (OSError, _sqlite3.Error):
+                _logger.warning(
+                    log_title,
+                    _mdit.inline_container(
+                        "Could not open the global control center cache at ",
+                        _mdit.element.code_span(str(path_global)),
+                        ". Cache types ",
+                        ", ".join(f"'{typ}'" for typ in sorted(self._global_types)),
+                        " are stored in the local cache instead.",
+                    ),
+                    _logger.traceback(),
+                )
+                self._global_types = set()
             else:
-                try:
-                    self._cache = _ps.read.yaml_from_file(path=self._path)
-                except _ps.exception.read.PySerialsReadException as e:
-                    log_msg_new_cache("is corrupted", traceback=True)
-                try:
-                    _data_validator.validate(
-                        data=self._cache,
-                        schema="cache",
-                    )
-                except _exception.ControlManException:
-                    log_msg_new_cache("is invalid", traceback=True)
-                else:
-                    _logger.success(
-                        log_title,
-                        _mdit.inline_container(
-                            "Loaded control center cache from ",
-                            _mdit.element.code_span(str(self._path)),
-                        )
-                    )
-        else:
+                self._path_global = path_global
+                if is_new:
+                    log_msg_new_cache("does not exist", path=path_global)
+
+        if not path_local_cache:
             self._path = None
+            self._backend = _cache_backend.DictCacheBackend()
             log_msg_new_cache()
+            return
+        dirpath = _Path(path_local_cache).resolve() / _const.DIRNAME_LOCAL_REPODYNAMICS
+        path_yaml = dirpath / _const.FILENAME_METADATA_CACHE
+        if backend == "yaml":
+            self._path = path_yaml
+            self._backend = _cache_backend.DictCacheBackend(data=read_file(path_yaml), path=path_yaml)
+            return
+        if backend == "binary":
+            self._path = dirpath / _const.FILENAME_METADATA_CACHE_BIN
+            if self._path.is_file() or not path_yaml.is_file():
+                self._backend = _cache_backend.BinaryCacheBackend(data=read_file(self._path), path=self._path)
+                return
+            # One-time migration from the YAML cache file
+            self._backend = _cache_backend.BinaryCacheBackend(data=read_file(path_yaml), path=self._path)
+            self._backend.commit()
+            path_yaml.unlink()
+            log_msg_migrated(path_yaml)
+            return
+        self._path = dirpath / _const.FILENAME_METADATA_CACHE_DB
+        self._backend, is_new = open_sqlite(self._path)
+        if not is_new:
+            return
+        if not path_yaml.is_file():
+            log_msg_new_cache("does not exist")
+            return
+        # One-time migration from the YAML cache file
+        yaml_cache = read_file(path_yaml)
+        self._backend.update(
+            (typ, key, item) for typ, typ_items in yaml_cache.items() for key, item in typ_items.items()
+        )
+        self._backend.commit()
+        path_yaml.unlink()
+        log_msg_migrated(path_yaml)
         return
 
-    def get(self, typ: str, key: str):
+    def get(self, typ: str, key: str, refresh: _Callable[[], _Any] | None = None):
+        """Get the data of a cached item, or `None` if it is not cached or has expired.
+
+        Parameters
+        ----------
+        typ
+            Cache type of the item.
+        key
+            Key of the item.
+        refresh
+            Function fetching the up-to-date data of the item.
+            If the item has expired and its type uses the stale-while-revalidate policy,
+            the expired data is returned, and this function is called in a background thread.
+            It must be thread-safe, and must not use the cache manager.
+        """
         log_title = _mdit.inline_container(
             "Cache Retrieval for ", _mdit.element.code_span(f"{typ}.{key}")
         )
@@ -78,18 +301,46 @@ class CacheManager:
                     ". Skipped cache retrieval."
                 )
             )
+            self._record_miss(typ, key)
             return
-        item = self._cache.get(typ, {}).get(key)
+        if self._use_memory_cache(typ):
+            item = _MEMORY_CACHE.get(typ, key)
+            if item and not self._is_expired(typ, item["timestamp"]):
+                self._count(typ, "hits")
+                _logger.info(
+                    log_title,
+                    "Item found in memory.",
+                    _mdit.element.code_block(_ps.write.to_yaml_string(item["data"]), language="yaml")
+                )
+                return item["data"]
+        backend = self._get_backend(typ)
+        item = backend.get(typ, key)
         if not item:
+            self._record_miss(typ, key)
             _logger.info(log_title, "Item not found.")
             return
+        self._count(typ, "bytes_read", _cache_backend.data_size(item["data"]))
         timestamp = item.get("timestamp")
         if timestamp and self._is_expired(typ, timestamp):
+            self._count(typ, "expirations")
+            if refresh and typ in self._revalidate_types:
+                self._schedule_refresh(typ, key, refresh)
+                _logger.info(
+                    log_title,
+                    f"Item expired; returned stale item and scheduled a refresh.\n- Timestamp: {timestamp}",
+                    _mdit.element.code_block(_ps.write.to_yaml_string(item["data"]), language="yaml")
+                )
+                return item["data"]
+            self._miss_times[(typ, key)] = _time.perf_counter()
             _logger.info(
                 log_title,
                 f"Item expired.\n- Timestamp: {timestamp}\n- Retention Hours: {self._retention_hours}"
             )
             return
+        self._count(typ, "hits")
+        backend.touch(typ, key, date.to_timestamp(date.from_now()))
+        if self._use_memory_cache(typ) and timestamp:
+            _MEMORY_CACHE.set(typ, key, item)
         _logger.info(
             log_title,
             "Item found.",
@@ -99,10 +350,17 @@ class CacheManager:
 
     def set(self, typ: str, key: str, value: dict | list | str | int | float | bool):
         new_item = {
-            "timestamp": date.to_internal(date.from_now()),
+            "timestamp": date.to_timestamp(date.from_now()),
             "data": value,
         }
-        self._cache.setdefault(typ, {})[key] = new_item
+        self._get_backend(typ).set(typ, key, new_item)
+        if self._use_memory_cache(typ):
+            _MEMORY_CACHE.set(typ, key, new_item)
+        self._count(typ, "sets")
+        self._count(typ, "bytes_written", _cache_backend.data_size(value))
+        miss_time = self._miss_times.pop((typ, key), None)
+        if miss_time is not None:
+            self._count(typ, "fetch_seconds", _time.perf_counter() - miss_time)
         _logger.info(
             _mdit.inline_container(
             "Cache Set for ",
@@ -112,29 +370,219 @@ class CacheManager:
         )
         return
 
+    def get_failure(self, typ: str, key: str) -> dict | None:
+        """Get the recorded failure of the retrieval of an item, if it has not expired.
+
+        Failures are kept for the retention hours of the `failure` cache type;
+        when these are not defined or zero, failures are not recorded.
+
+        Returns
+        -------
+        dict | None
+            The type name (`kind`) and message (`message`) of the error,
+            and the time of the failure (`timestamp`).
+        """
+        if not self._retention_hours.get(FAILURE_TYPE):
+            return
+        return self.get(FAILURE_TYPE, f"{typ}:{key}")
+
+    def set_failure(self, typ: str, key: str, error: Exception) -> None:
+        """Record a failed retrieval of an item, so that it is not retried until the failure expires."""
+        if not self._retention_hours.get(FAILURE_TYPE):
+            return
+        message_lines = [line.strip() for line in str(error).splitlines() if line.strip()]
+        self.set(
+            FAILURE_TYPE,
+            f"{typ}:{key}",
+            {
+                "kind": type(error).__name__,
+                "message": message_lines[0][:500] if message_lines else "",
+                "timestamp": date.to_timestamp(date.from_now()),
+            },
+        )
+        return
+
+    def stats(self) -> dict[str, dict[str, int | float]]:
+        """Get statistics of the usage of the cache since the cache manager was created.
+
+        Returns
+        -------
+        dict[str, dict[str, int | float]]
+            For each cache type that was used, a mapping of the counters in `STATS_COUNTERS`:
+            - `hits`: Retrievals returning unexpired items (from memory or storage).
+            - `misses`: Retrievals of items that did not exist.
+            - `expirations`: Retrievals of expired items,
+              including those returned under the stale-while-revalidate policy.
+            - `sets`: Added or replaced items.
+            - `bytes_read`: Size of serialized data of items retrieved from storage.
+            - `bytes_written`: Size of serialized data of added or replaced items.
+            - `fetch_seconds`: Time between unsuccessful retrievals of items and adding them,
+              i.e., the time spent fetching missing and expired data.
+        """
+        return {typ: dict(counters) for typ, counters in sorted(self._stats.items())}
+
     def save(self):
+        """Add refreshed items, remove expired and evicted items, and persist the cache."""
         log_title = "Cache Save"
-        if self._path:
-            _ps.write.to_yaml_file(
-                data=self._cache,
-                path=self._path,
-                make_dirs=True,
+        self._finish_refreshes()
+        if self._stats:
+            _logger.info(
+                "Cache Statistics",
+                _mdit.element.code_block(_ps.write.to_yaml_string(self.stats()), language="yaml"),
             )
+        if not self._path:
+            _logger.warning(
+                log_title,
+                "No filepath provided for control center cache. Skipped saving cache."
+            )
+        for path, backend in self._persisted_backends():
+            count_removed, size_removed = self._prune(backend)
+            backend.commit()
             _logger.success(
                 log_title,
                 _mdit.inline_container(
                     "Saved control center cache to ",
-                    _mdit.element.code_span(str(self._path)),
+                    _mdit.element.code_span(str(path)),
+                    f" after removing {count_removed} expired or evicted items ({size_removed} bytes).",
                 )
             )
-        else:
-            _logger.warning(
-                log_title,
-                "No filepath provided for control center cache. Skipped saving cache."
+        return
+
+    def compact(self) -> dict[str, int]:
+        """Remove expired and evicted items, persist the cache, and reclaim unused storage space.
+
+        Both the local and the global cache are compacted.
+
+        Returns
+        -------
+        dict[str, int]
+            Number of removed items (`removed_items`) and their data size in bytes (`removed_bytes`),
+            and the total size of the cache files in bytes before (`file_bytes_before`)
+            and after (`file_bytes_after`) compaction.
+        """
+        result = dict.fromkeys(("removed_items", "removed_bytes", "file_bytes_before", "file_bytes_after"), 0)
+        backends = self._persisted_backends()
+        if not self._path:
+            backends.insert(0, (None, self._backend))
+        for path, backend in backends:
+            result["file_bytes_before"] += backend.file_size()
+            count_removed, size_removed = self._prune(backend)
+            result["removed_items"] += count_removed
+            result["removed_bytes"] += size_removed
+            if path:
+                backend.commit()
+                backend.compact()
+            result["file_bytes_after"] += backend.file_size()
+        _logger.success(
+            "Cache Compaction",
+            "Compacted control center cache.",
+            _mdit.element.code_block(_ps.write.to_yaml_string(result), language="yaml"),
+        )
+        return result
+
+    def http_cache(self):
+        """Context manager caching the HTTP responses of all web requests sent by `pylinks` within it.
+
+        Responses are stored in this cache and revalidated conditionally when requested again
+        (see `controlman._http_cache`).
+        """
+        return _http_cache.enable(self._backend)
+
+    def _use_memory_cache(self, typ: str) -> bool:
+        return self._memory_cache and typ in MEMORY_CACHE_TYPES
+
+    def _count(self, typ: str, counter: str, amount: int | float = 1) -> None:
+        counters = self._stats.setdefault(typ, dict.fromkeys(STATS_COUNTERS, 0))
+        counters[counter] += amount
+        return
+
+    def _record_miss(self, typ: str, key: str) -> None:
+        self._count(typ, "misses")
+        self._miss_times[(typ, key)] = _time.perf_counter()
+        return
+
+    def _schedule_refresh(self, typ: str, key: str, refresh: _Callable[[], _Any]) -> None:
+        if (typ, key) in self._refreshes:
+            return
+        if not self._refresh_executor:
+            self._refresh_executor = _ThreadPoolExecutor(
+                max_workers=_REFRESH_MAX_WORKERS, thread_name_prefix="controlman-cache-refresh"
             )
+        self._refreshes[(typ, key)] = self._refresh_executor.submit(refresh)
+        return
+
+    def _finish_refreshes(self) -> None:
+        """Wait for all background refreshes, and add the refreshed data to the cache.
+
+        Items whose refresh failed are kept as they are,
+        so that they can still be returned (and refreshed again) in later runs.
+        """
+        for (typ, key), future in self._refreshes.items():
+            try:
+                value = future.result()
+            except Exception:
+                _logger.warning(
+                    _mdit.inline_container("Cache Refresh for ", _mdit.element.code_span(f"{typ}.{key}")),
+                    "Failed to refresh stale item.",
+                    _logger.traceback(),
+                )
+                continue
+            self.set(typ, key, value)
+        self._refreshes = {}
+        if self._refresh_executor:
+            self._refresh_executor.shutdown()
+            self._refresh_executor = None
         return
 
+    def _get_backend(self, typ: str) -> _cache_backend.CacheBackend:
+        """Get the backend storing items of a cache type."""
+        return self._global_backend if typ in self._global_types else self._backend
+
+    def _persisted_backends(self) -> list[tuple[_Path, _cache_backend.CacheBackend]]:
+        """Get the paths and backends of all caches that are persisted to files."""
+        backends = [(self._path, self._backend)] if self._path else []
+        if self._global_backend:
+            backends.append((self._path_global, self._global_backend))
+        return backends
+
+    def _prune(self, backend: _cache_backend.CacheBackend) -> tuple[int, int]:
+        """Delete expired items, and evict the least recently used items of types exceeding their limits.
+
+        Items of types without retention hours are never considered expired.
+        Expired items of types using the stale-while-revalidate policy are also kept,
+        until they are refreshed or evicted by the limits of their type.
+
+        Returns
+        -------
+        tuple[int, int]
+            Number of deleted items and their total data size in bytes.
+        """
+        to_delete = []
+        kept: dict[str, list] = {}
+        for entry in backend.entries():
+            if (
+                entry.typ in self._retention_hours
+                and entry.typ not in self._revalidate_types
+                and self._is_expired(entry.typ, entry.timestamp)
+            ):
+                to_delete.append(entry)
+            elif entry.typ in self._limits:
+                kept.setdefault(entry.typ, []).append(entry)
+        for typ, entries in kept.items():
+            max_items = self._limits[typ].get("max_items")
+            max_bytes = self._limits[typ].get("max_bytes")
+            entries.sort(key=lambda entry: date.from_timestamp(entry.accessed or entry.timestamp), reverse=True)
+            total_size = 0
+            for idx, entry in enumerate(entries):
+                total_size += entry.size
+                if (max_items is not None and idx >= max_items) or (
+                    max_bytes is not None and total_size > max_bytes
+                ):
+                    to_delete.append(entry)
+        backend.delete((entry.typ, entry.key) for entry in to_delete)
+        return len(to_delete), sum(entry.size for entry in to_delete)
+
     def _is_expired(self, typ: str, timestamp: str) -> bool:
         time_delta = _datetime.timedelta(hours=self._retention_hours[typ])
-        exp_date = date.from_internal(timestamp) + time_delta
+        exp_date = date.from_timestamp(timestamp) + time_delta
         return exp_date <= _datetime.datetime.now(tz=_datetime.UTC)
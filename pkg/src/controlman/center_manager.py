@@ -26,6 +26,7 @@ from controlman import data_validator as _data_validator
 from controlman.reporter import ControlCenterReporter as _ControlCenterReporter
 from controlman.changelog_manager import ChangelogManager
 from controlman import data_helper as _helper
+from controlman import _cache_warmer
 
 
 class CenterManager:
@@ -38,6 +39,9 @@ class CenterManager:
         data_main: _ps.NestedDict,
         github_token: str | None = None,
         future_versions: dict[str, str | _PEP440SemVer] | None = None,
+        fail_fast: bool = False,
+        max_workers: int | None = 1,
+        memory_cache: bool = False,
     ):
         self._git: _Git = git_manager
         self._path_cc = cc_path
@@ -46,11 +50,18 @@ class CenterManager:
         self._github_token = github_token
         self._github_api = _pylinks.api.github(token=github_token)
         self._future_vers = future_versions or {}
+        self._fail_fast = fail_fast
+        self._max_workers = max_workers
 
         self._path_root = self._git.repo_path
         relpath_local_cache = self._data_before.get("local.cache.path")
         path_local_cache = None
         retention_hours = self._data_before.get("control.cache.retention_hours", {})
+        cache_backend = self._data_before.get("control.cache.backend", "sqlite")
+        cache_global_types = self._data_before.get(
+            "control.cache.global_types", ["user", "orcid", "doi", "python", "license"]
+        )
+        cache_revalidate_types = self._data_before.get("control.cache.stale_while_revalidate", [])
         if relpath_local_cache:
             path_local_cache = self._path_root / relpath_local_cache
             path_local_config = path_local_cache / const.FILENAME_LOCAL_CONFIG
@@ -60,11 +71,19 @@ class CenterManager:
                         local_config = _ps.read.yaml_from_file(path=path_local_config, safe=True)
                     except _ps.exception.read.PySerialsInvalidDataError as e:
                         raise _load_exception.ControlManInvalidConfigFileDataError(cause=e) from None
-                    _data_validator.validate(data=local_config, schema="local")
+                    _data_validator.validate(data=local_config, schema="local", fail_fast=self._fail_fast)
                     retention_hours = local_config.get("retention_hours", {})
+                    cache_backend = local_config.get("backend", cache_backend)
+                    cache_global_types = local_config.get("global_types", cache_global_types)
+                    cache_revalidate_types = local_config.get("stale_while_revalidate", cache_revalidate_types)
         self._cache_manager: CacheManager = CacheManager(
             path_local_cache=path_local_cache,
             retention_hours=retention_hours,
+            backend=cache_backend,
+            limits=self._data_before.get("control.cache.limits", {}),
+            memory_cache=memory_cache,
+            global_types=cache_global_types,
+            revalidate_types=cache_revalidate_types,
         )
         self._hook_manager = _HookManager(
             dir_path=self._path_cc / const.DIRNAME_CC_HOOK,
@@ -87,7 +106,7 @@ class CenterManager:
     def load(self) -> _ps.NestedDict:
         if self._data_raw:
             return self._data_raw
-        with _logger.sectioning("Config Files Load"):
+        with _logger.sectioning("Config Files Load"), self._cache_manager.http_cache():
             full_data = _data_loader.load(
                 path_cc=self._path_cc,
                 cache_manager=self._cache_manager,
@@ -95,7 +114,13 @@ class CenterManager:
         with _logger.sectioning("CCA Load Hooks"):
             self._hook_manager.generate(const.FUNCNAME_CC_HOOK_LOAD, data=full_data)
         with _logger.sectioning("Post-Load Data Validation"):
-            _data_validator.validate(data=full_data, source="source", before_substitution=True)
+            _data_validator.validate(
+                data=full_data,
+                source="source",
+                before_substitution=True,
+                fail_fast=self._fail_fast,
+                max_workers=self._max_workers,
+            )
         with _logger.sectioning("CCA Load Validation Hooks"):
             self._hook_manager.generate(const.FUNCNAME_CC_HOOK_LOAD_VALID, data=full_data)
         code_context_call = {
@@ -122,6 +147,11 @@ class CenterManager:
                     github_api=self._github_api,
                     cache_manager=self._cache_manager,
                 ),
+                "fill_entities": _functools.partial(
+                    _helper.fill_entities,
+                    github_api=self._github_api,
+                    cache_manager=self._cache_manager,
+                ),
             },
             code_context_partial={
                 "team_members_with_role_types": _helper.team_members_with_role_types,
@@ -138,7 +168,7 @@ class CenterManager:
         if self._data:
             return self._data
         self.load()
-        with _logger.sectioning("Dynamic Data Generation"):
+        with _logger.sectioning("Dynamic Data Generation"), self._cache_manager.http_cache():
             data = _data_gen.generate(
                 git_manager=self._git,
                 cache_manager=self._cache_manager,
@@ -153,12 +183,23 @@ class CenterManager:
                 const.FUNCNAME_CC_HOOK_AUGMENT,
                 data,
             )
-        with _logger.sectioning("Post-Generation Data Validation"):
-            # Validate again to fill default values that depend on generated data
+        with _logger.sectioning("Post-Generation Default Values"):
+            # Fill default values that depend on generated data
             # Example: A key may be referencing `team.owner.email.url`, which has a default
             # value based on `team.owner.email.id`. But since `team.owner` is generated
             # dynamically, the default value for `team.owner.email.url` is not set in the initial validation.
-            _data_validator.validate(data=data(), source="source", before_substitution=True)
+            if self._hook_manager.has_hook(const.FUNCNAME_CC_HOOK_AUGMENT_VALID):
+                # Validation hooks expect validated data
+                _data_validator.validate(
+                    data=data(),
+                    source="source",
+                    before_substitution=True,
+                    fail_fast=self._fail_fast,
+                    max_workers=self._max_workers,
+                )
+            else:
+                # The data is validated once after template resolution
+                _data_validator.fill_defaults(data=data(), before_substitution=True)
         with _logger.sectioning("CCA Augmentation Validation Hooks"):
             self._hook_manager.generate(
                 const.FUNCNAME_CC_HOOK_AUGMENT_VALID,
@@ -179,7 +220,9 @@ class CenterManager:
             )
         data = _ps.NestedDict(_ps.update.remove_keys(data(), const.RELATIVE_TEMPLATE_KEYS))
         with _logger.sectioning("Final Data Validation"):
-            _data_validator.validate(data=data(), source="source")
+            _data_validator.validate(
+                data=data(), source="source", fail_fast=self._fail_fast, max_workers=self._max_workers
+            )
         with _logger.sectioning("CCA Templating Validation Hooks"):
             self._hook_manager.generate(
                 const.FUNCNAME_CC_HOOK_TEMPLATE_VALID,
@@ -189,6 +232,21 @@ class CenterManager:
         self._cache_manager.save()
         return self._data
 
+    def warm_cache(self, max_workers: int = 8) -> dict[str, int]:
+        """Retrieve all missing or expired web data needed by `generate_data` into the cache.
+
+        See `controlman._cache_warmer.warm` for details.
+        """
+        with _logger.sectioning("Cache Warm-Up"):
+            return _cache_warmer.warm(
+                path_cc=self._path_cc,
+                data_before=self._data_before(),
+                cache_manager=self._cache_manager,
+                github_api=self._github_api,
+                git=self._git,
+                max_workers=max_workers,
+            )
+
     def generate_files(self) -> list[_GeneratedFile]:
         if self._files:
             return self._files
@@ -221,14 +279,26 @@ class CenterManager:
             )
         return self._changes, files, dirs
 
-    def report(self) -> _ControlCenterReporter:
+    def report(self, cache_stats: bool = False) -> _ControlCenterReporter:
+        """Create a report of the changes.
+
+        Parameters
+        ----------
+        cache_stats
+            Add statistics of the cache usage (see `CacheManager.stats`) to the report.
+        """
         self.compare()
         return _ControlCenterReporter(
             metadata=self._changes,
             files=self._files,
             dirs=self._dirs,
+            cache_stats=self._cache_manager.stats() if cache_stats else None,
         )
 
+    def cache_stats(self) -> dict[str, dict[str, int | float]]:
+        """Get statistics of the cache usage; see `controlman.cache_manager.CacheManager.stats`."""
+        return self._cache_manager.stats()
+
     def apply_changes(self) -> None:
         """Apply changes to dynamic repository files."""
 
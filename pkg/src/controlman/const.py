@@ -9,12 +9,16 @@ DIRPATH_CC_DEFAULT = ".control"
 
 DIRNAME_LOCAL_REPORT = "reports"
 DIRNAME_LOCAL_REPODYNAMICS = "RepoDynamics"
+DIRNAME_USER_CACHE = "controlman"
+DIRNAME_USER_CACHE_SCHEMA = "schema"
 
 FILEPATH_METADATA = ".github/.repodynamics/metadata.json"
 FILEPATH_CHANGELOG = ".github/.repodynamics/changelog.json"
 FILEPATH_CONTRIBUTORS = ".github/.repodynamics/contributors.json"
 FILEPATH_VARIABLES = ".github/.repodynamics/variables.json"
 FILENAME_METADATA_CACHE = ".metadata_cache.yaml"
+FILENAME_METADATA_CACHE_DB = ".metadata_cache.sqlite"
+FILENAME_METADATA_CACHE_BIN = ".metadata_cache.bin"
 FILENAME_LOCAL_CONFIG = "config.yaml"
 
 DIRNAME_CC_HOOK = "hooks"
@@ -6,6 +6,7 @@ import mdit as _mdit
 from licenseman import spdx as _spdx
 
 from controlman import data_helper as _helper
+from controlman import data_validator as _validator
 from controlman.cache_manager import CacheManager
 from controlman import exception as _exception
 from controlman import date
@@ -86,16 +87,16 @@ class MainDataGenerator:
         )
         ccm_repo.setdefault("url", {})["home"] = repo_info["html_url"]
         self._data["team.owner.github"] = {"id": repo_info["owner"]["login"], "rest_id": repo_info["owner"]["id"]}
+        self._fill_defaults("repo")
         return
 
     def _team(self) -> None:
         self._data.fill("team")
-        for person_id in self._data["team"].keys():
-            _helper.fill_entity(
-                entity=self._data[f"team.{person_id}"],
-                github_api=self._gh_api,
-                cache_manager=self._cache,
-            )
+        _helper.fill_entities(
+            entities=self._data["team"],
+            github_api=self._gh_api,
+            cache_manager=self._cache,
+        )
         return
 
     def _license(self):
@@ -155,11 +156,13 @@ class MainDataGenerator:
                 path_header = normalize_license_filename(
                     user_data_path.get("header_plain", f"COPYRIGHT-{spdx_id}.md")
                 )
-                source_data = self._cache.get("license", spdx_id)
+                source_data = self._cache.get(
+                    "license", spdx_id, refresh=lambda func=func, spdx_id=spdx_id: func(spdx_id).raw_data
+                )
                 if source_data:
                     licence = class_(source_data)
                 else:
-                    licence = func(spdx_id)
+                    licence = _helper.fetch_web_data("license", spdx_id, lambda: func(spdx_id), self._cache)
                     self._cache.set("license", spdx_id, licence.raw_data)
                 header_xml = (licence.header_xml_str or "") if spdx_typ == "license" else ""
                 out_data = {
@@ -200,20 +203,20 @@ class MainDataGenerator:
                     raise_duplicates=False,
                     raise_type_mismatch=True,
                 )
+        self._fill_defaults("license")
         return
 
     def _discussion_categories(self):
-        discussions_info = self._cache.get("repo", f"discussion_categories")
-        if discussions_info:
-            return
-        if not self._gh_api.authenticated:
-            _logger.notice(
-                "GitHub Discussion Categories",
-                "GitHub token not provided. Cannot get discussions categories."
-            )
-            return
-        discussions_info = self._gh_api_repo.discussion_categories()
-        self._cache.set("repo", f"discussions_categories", discussions_info)
+        discussions_info = self._cache.get("repo", "discussion_categories")
+        if not discussions_info:
+            if not self._gh_api.authenticated:
+                _logger.notice(
+                    "GitHub Discussion Categories",
+                    "GitHub token not provided. Cannot get discussions categories."
+                )
+                return
+            discussions_info = self._gh_api_repo.discussion_categories()
+            self._cache.set("repo", "discussion_categories", discussions_info)
         discussion = self._data.setdefault("discussion.category", {})
         for category in discussions_info:
             category_obj = discussion.setdefault(category["slug"], {})
@@ -224,6 +227,19 @@ class MainDataGenerator:
             category_obj["updated_at"] = date.to_internal(date.from_github(category["updatedAt"]))
             category_obj["is_answerable"] = category["isAnswerable"]
             category_obj["description"] = category["description"]
+        self._fill_defaults("discussion")
+        return
+
+    def _fill_defaults(self, path: str) -> None:
+        """Fill the default values of a generated subtree of the data.
+
+        The generated data is validated along with the rest of the data after generation.
+        """
+        _validator.fill_defaults(
+            data=self._data(),
+            path=path,
+            before_substitution=True,
+        )
         return
 
     def _vars(self):
@@ -33,19 +33,12 @@ class PythonDataGenerator:
     def _package_python_versions(self) -> None:
 
         def get_python_releases():
-            release_versions = self._cache.get("python", "releases")
+            release_versions = self._cache.get(
+                "python", "releases", refresh=lambda: fetch_python_releases(self._github_api)
+            )
             if release_versions:
                 return release_versions
-            release_versions = self._github_api.user("python").repo("cpython").semantic_versions(tag_prefix="v")
-            live_versions = []
-            for version in release_versions:
-                version_tuple = tuple(map(int, version.split(".")))
-                if version_tuple[0] < 2:
-                    continue
-                if version_tuple[0] == 2 and version_tuple[1] < 3:
-                    continue
-                live_versions.append(version)
-            live_versions = sorted(live_versions, key=lambda x: tuple(map(int, x.split("."))))
+            live_versions = fetch_python_releases(self._github_api)
             self._cache.set("python", "releases", live_versions)
             return live_versions
 
@@ -102,3 +95,20 @@ class PythonDataGenerator:
         if self._data["test"]:
             self._data["test.python.version.spec"] = spec_str
         return
+
+
+def fetch_python_releases(github_api: pylinks.api.GitHub) -> list[str]:
+    """Retrieve all released Python versions from 2.3 on, sorted in ascending order.
+
+    This is the data stored under the `releases` key of the `python` cache type.
+    """
+    release_versions = github_api.user("python").repo("cpython").semantic_versions(tag_prefix="v")
+    live_versions = []
+    for version in release_versions:
+        version_tuple = tuple(map(int, version.split(".")))
+        if version_tuple[0] < 2:
+            continue
+        if version_tuple[0] == 2 and version_tuple[1] < 3:
+            continue
+        live_versions.append(version)
+    return sorted(live_versions, key=lambda x: tuple(map(int, x.split("."))))
@@ -7,12 +7,14 @@ import re as _re
 
 from loggerman import logger as _logger
 import pylinks as _pl
+from pylinks.exception.api import WebAPIError as _WebAPIError
 import pyserials as _ps
 
 from controlman import data_validator as _validator
+from controlman import exception as _exception
 
 if _TYPE_CHECKING:
-    from typing import Sequence, Callable
+    from typing import Any, Sequence, Callable
     from controlman.cache_manager import CacheManager
 
 
@@ -142,48 +144,177 @@ def fill_entity(
     cache_manager: CacheManager | None = None,
 ) -> tuple[dict, dict | None]:
     """Fill all missing information in an `entity` object."""
+    github_user_info = _complete_entity(entity=entity, github_api=github_api, cache_manager=cache_manager)
+    _validator.validate(
+        data=entity,
+        schema="entity",
+        before_substitution=True,
+    )
+    entity_ = _ps.NestedDict(entity)
+    entity_.fill()
+    return entity_(), github_user_info
+
+
+def fill_entities(
+    entities: Sequence[dict] | dict[str, dict],
+    github_api: _pl.api.GitHub,
+    cache_manager: CacheManager | None = None,
+) -> list[tuple[dict, dict | None]]:
+    """Fill all missing information in multiple `entity` objects.
+
+    The entities are validated together in one batch,
+    which is considerably faster than filling them one by one with `fill_entity`.
+
+    Parameters
+    ----------
+    entities
+        The entities, either as a sequence, or as a mapping of entity IDs to entities
+        (e.g., the `team` data), in which case error reports refer to the entity IDs.
+    github_api
+        GitHub API instance used to retrieve user information.
+    cache_manager
+        Cache manager for retrieved user and publication data.
+
+    Returns
+    -------
+    list[tuple[dict, dict | None]]
+        For each entity, the filled entity and the retrieved GitHub user information (if any),
+        in the same order as the input entities.
+    """
+    entity_list = list(entities.values()) if isinstance(entities, dict) else list(entities)
+    github_user_infos = [
+        _complete_entity(entity=entity, github_api=github_api, cache_manager=cache_manager)
+        for entity in entity_list
+    ]
+    _validator.validate_batch(
+        data=entities,
+        schema="entity",
+        before_substitution=True,
+    )
+    out = []
+    for entity, github_user_info in zip(entity_list, github_user_infos):
+        entity_ = _ps.NestedDict(entity)
+        entity_.fill()
+        out.append((entity_(), github_user_info))
+    return out
+
+
+def fetch_web_data(
+    typ: str,
+    key: str,
+    fetch: Callable[[], Any],
+    cache_manager: CacheManager | None = None,
+):
+    """Retrieve data from the web, caching failed retrievals.
+
+    If a previous retrieval of the same data failed recently (see `CacheManager.get_failure`),
+    an error is raised right away, without sending any requests.
+    Otherwise, a failed retrieval is recorded in the cache before the error is re-raised.
+
+    Parameters
+    ----------
+    typ
+        Cache type of the data.
+    key
+        Cache key of the data.
+    fetch
+        Function retrieving the data.
+    cache_manager
+        Cache manager to record failures in.
+
+    Raises
+    ------
+    controlman.exception.data_gen.ControlManWebDataUnavailableError
+        If a previous retrieval failed recently.
+    pylinks.exception.api.WebAPIError
+        If the retrieval fails.
+    """
+    if not cache_manager:
+        return fetch()
+    failure = cache_manager.get_failure(typ, key)
+    if failure:
+        raise _exception.data_gen.ControlManWebDataUnavailableError(typ=typ, key=key, failure=failure)
+    try:
+        return fetch()
+    except _WebAPIError as e:
+        cache_manager.set_failure(typ, key, e)
+        raise
 
-    def _get_github_user(username: str | None = None, user_id: str | None = None) -> dict:
 
-        def add_social(name, user, url):
-            socials[name] = {"id": user, "url": url}
-            return
+def fetch_github_user(
+    github_api: _pl.api.GitHub,
+    username: str | None = None,
+    user_id: str | None = None,
+) -> dict:
+    """Retrieve the information and social accounts of a GitHub user, given either the username or ID.
+
+    This is the data stored in the `user` cache type.
+    """
+
+    def add_social(name, user, url):
+        socials[name] = {"id": user, "url": url}
+        return
+
+    user = github_api.user_from_id(user_id) if user_id else github_api.user(username)
+    user_info = user.info
+    if user_info["blog"] and "://" not in user_info["blog"]:
+        user_info["blog"] = f"https://{user_info['blog']}"
+    social_accounts_info = user.social_accounts
+    socials = {}
+    user_info["socials"] = socials
+    for account in social_accounts_info:
+        for provider, base_pattern, id_pattern in (
+            ("orcid", r'orcid.org/', r'([0-9]{4}-[0-9]{4}-[0-9]{4}-[0-9]{3}[0-9X]{1})(.*)'),
+            ("researchgate", r'researchgate.net/profile/', r'([a-zA-Z0-9_-]+)(.*)'),
+            ("linkedin", r'linkedin.com/in/', r'([a-zA-Z0-9_-]+)(.*)'),
+            ("twitter", r'twitter.com/', r'([a-zA-Z0-9_-]+)(.*)'),
+            ("twitter", r'x.com/', r'([a-zA-Z0-9_-]+)(.*)'),
+        ):
+            match = _re.search(rf"{base_pattern}{id_pattern}", account["url"])
+            if match:
+                add_social(
+                    provider,
+                    match.group(1),
+                    f"https://{base_pattern}{match.group(1)}{match.group(2)}"
+                )
+                break
+        else:
+            if account["provider"] != "generic":
+                add_social(account["provider"], None, account["url"])
+            else:
+                generics = socials.setdefault("generics", [])
+                generics.append(account["url"])
+                _logger.info(f"Unknown account", account['url'])
+    return user_info
+
+
+def _complete_entity(
+    entity: dict,
+    github_api: _pl.api.GitHub,
+    cache_manager: CacheManager | None = None,
+) -> dict | None:
+    """Add information retrieved from GitHub and ORCID to an `entity` object.
 
+    Returns
+    -------
+    dict | None
+        The retrieved GitHub user information, if the entity has a GitHub account.
+    """
+
+    def _get_github_user(username: str | None = None, user_id: str | None = None) -> dict:
         user_info = {}
         if user_id and cache_manager:
-            user_info = cache_manager.get("user", user_id)
+            user_info = cache_manager.get(
+                "user", user_id, refresh=lambda: fetch_github_user(github_api=github_api, user_id=user_id)
+            )
         if user_info:
             return user_info
-        user = github_api.user_from_id(user_id) if user_id else github_api.user(username)
-        user_info = user.info
-        if user_info["blog"] and "://" not in user_info["blog"]:
-            user_info["blog"] = f"https://{user_info['blog']}"
-        social_accounts_info = user.social_accounts
-        socials = {}
-        user_info["socials"] = socials
-        for account in social_accounts_info:
-            for provider, base_pattern, id_pattern in (
-                ("orcid", r'orcid.org/', r'([0-9]{4}-[0-9]{4}-[0-9]{4}-[0-9]{3}[0-9X]{1})(.*)'),
-                ("researchgate", r'researchgate.net/profile/', r'([a-zA-Z0-9_-]+)(.*)'),
-                ("linkedin", r'linkedin.com/in/', r'([a-zA-Z0-9_-]+)(.*)'),
-                ("twitter", r'twitter.com/', r'([a-zA-Z0-9_-]+)(.*)'),
-                ("twitter", r'x.com/', r'([a-zA-Z0-9_-]+)(.*)'),
-            ):
-                match = _re.search(rf"{base_pattern}{id_pattern}", account["url"])
-                if match:
-                    add_social(
-                        provider,
-                        match.group(1),
-                        f"https://{base_pattern}{match.group(1)}{match.group(2)}"
-                    )
-                    break
-            else:
-                if account["provider"] != "generic":
-                    add_social(account["provider"], None, account["url"])
-                else:
-                    generics = socials.setdefault("generics", [])
-                    generics.append(account["url"])
-                    _logger.info(f"Unknown account", account['url'])
+        user_info = fetch_web_data(
+            "user",
+            user_id or username,
+            lambda: fetch_github_user(github_api=github_api, username=username, user_id=user_id),
+            cache_manager=cache_manager,
+        )
         if cache_manager:
             cache_manager.set("user", user_info["id"], user_info)
         return user_info
@@ -191,18 +322,24 @@ def fill_entity(
     def get_orcid_publications(orcid_id: str) -> list[dict]:
         dois = []
         if cache_manager:
-            dois = cache_manager.get("orcid", orcid_id)
+            dois = cache_manager.get("orcid", orcid_id, refresh=lambda: _pl.api.orcid(orcid_id=orcid_id).doi)
         if not dois:
-            dois = _pl.api.orcid(orcid_id=orcid_id).doi
+            dois = fetch_web_data(
+                "orcid", orcid_id, lambda: _pl.api.orcid(orcid_id=orcid_id).doi, cache_manager=cache_manager
+            )
             if cache_manager:
                 cache_manager.set("orcid", orcid_id, dois)
         publications = []
         for doi in dois:
             publication_data = {}
             if cache_manager:
-                publication_data = cache_manager.get("doi", doi)
+                publication_data = cache_manager.get(
+                    "doi", doi, refresh=lambda doi=doi: _pl.api.doi(doi=doi).curated
+                )
             if not publication_data:
-                publication_data = _pl.api.doi(doi=doi).curated
+                publication_data = fetch_web_data(
+                    "doi", doi, lambda: _pl.api.doi(doi=doi).curated, cache_manager=cache_manager
+                )
                 if cache_manager:
                     cache_manager.set("doi", doi, publication_data)
             publications.append(publication_data)
@@ -258,14 +395,7 @@ def fill_entity(
                 entity[social_name] = social_data
     if "orcid" in entity and entity["orcid"].get("get_pubs"):
         entity["orcid"]["pubs"] = get_orcid_publications(orcid_id=entity["orcid"]["user"])
-    _validator.validate(
-        data=entity,
-        schema = "entity",
-        before_substitution = True
-    )
-    entity_ = _ps.NestedDict(entity)
-    entity_.fill()
-    return entity_(), github_user_info
+    return github_user_info
 
 
 
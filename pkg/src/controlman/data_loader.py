@@ -82,14 +82,81 @@ def load(
         return
 
     full_data = {}
-    hook_dir = path_cc / _const.DIRNAME_CC_HOOK
-    for path in sorted(path_cc.rglob('*'), key=lambda p: (p.parts, p)):
-        if hook_dir not in path.parents and path.is_file() and path.suffix.lower() in ['.yaml', '.yml']:
-            with _logger.sectioning(_mdit.element.code_span(str(path.relative_to(path_cc)))):
-                _load_file(filepath=path)
+    for path in config_filepaths(path_cc):
+        with _logger.sectioning(_mdit.element.code_span(str(path.relative_to(path_cc)))):
+            _load_file(filepath=path)
     return full_data
 
 
+def config_filepaths(path_cc: _Path) -> list[_Path]:
+    """Get the paths of all configuration files in the control center, in loading order."""
+    hook_dir = path_cc / _const.DIRNAME_CC_HOOK
+    return [
+        path for path in sorted(path_cc.rglob('*'), key=lambda p: (p.parts, p))
+        if hook_dir not in path.parents and path.is_file() and path.suffix.lower() in ['.yaml', '.yml']
+    ]
+
+
+def fetch_external_data(
+    tag_value: str,
+    tag_name: str = _const.CC_EXTENSION_TAG,
+    tag_constructor=None,
+):
+    """Retrieve the data of an external tag in a configuration file.
+
+    Parameters
+    ----------
+    tag_value
+        Value of the tag, i.e., the URL of a JSON, YAML or TOML file,
+        optionally followed by a space and a JSONPath expression selecting part of the data.
+    tag_name
+        Name of the tag.
+    tag_constructor
+        YAML constructor for the tags in retrieved YAML files.
+        Defaults to one retrieving their data with this function.
+
+    Raises
+    ------
+    pylinks.exception.api.WebAPIError
+        If the URL cannot be reached.
+    ValueError
+        If the file type is not supported, or the JSONPath expression does not match.
+    """
+
+    def construct_nested_tag(loader: _yaml.SafeConstructor, node: _yaml.ScalarNode):
+        return fetch_external_data(tag_value=loader.construct_scalar(node), tag_name=tag_name)
+
+    url, *jsonpath_expr = tag_value.split(' ', 1)
+    file_ext = url.split('.')[-1].lower()
+    data_raw_whole = _pl.http.request(
+        url=url,
+        verb="GET",
+        response_type="str",
+    )
+    if file_ext == "json":
+        data = _ps.read.json_from_string(data=data_raw_whole, strict=False)
+    elif file_ext in ("yaml", "yml"):
+        data = _ps.read.yaml_from_string(
+            data=data_raw_whole,
+            safe=True,
+            constructors={tag_name: tag_constructor or construct_nested_tag},
+        )
+    elif file_ext == "toml":
+        data = _ps.read.toml_from_string(data=data_raw_whole, as_dict=True)
+    else:
+        raise ValueError(f"Invalid file extension {file_ext} for URL {url}")
+    if jsonpath_expr:
+        try:
+            data = _ps.update.TemplateFiller().fill(
+                data=data,
+                template=jsonpath_expr,
+            )
+        except Exception as e:
+            raise ValueError(
+                f"No match found for JSONPath '{jsonpath_expr}' in the JSON data from '{url}'")
+    return data
+
+
 def _create_external_tag_constructor(
     filepath: _Path,
     file_content: str,
@@ -110,43 +177,31 @@ def _create_external_tag_constructor(
             cached_data = cache_manager.get(typ="extension", key=tag_value)
             if cached_data:
                 return cached_data
-        url, *jsonpath_expr = tag_value.split(' ', 1)
-        file_ext = url.split('.')[-1].lower()
+            failure = cache_manager.get_failure("extension", tag_value)
+            if failure:
+                raise _exception.ControlManUnreachableTagInConfigFileError(
+                    filepath=filepath,
+                    data=file_content,
+                    node=node,
+                    url=tag_value.split(' ', 1)[0],
+                    failure=failure,
+                )
         try:
-            data_raw_whole = _pl.http.request(
-                url=url,
-                verb="GET",
-                response_type="str",
+            data = fetch_external_data(
+                tag_value=tag_value,
+                tag_name=tag_name,
+                tag_constructor=load_external_data,
             )
         except _WebAPIError as e:
+            if cache_manager:
+                cache_manager.set_failure("extension", tag_value, e)
             raise _exception.ControlManUnreachableTagInConfigFileError(
                 filepath=filepath,
                 data=file_content,
                 node=node,
-                url=url,
+                url=tag_value.split(' ', 1)[0],
                 cause=e,
             ) from None
-        if file_ext == "json":
-            data = _ps.read.json_from_string(data=data_raw_whole, strict=False)
-        elif file_ext in ("yaml", "yml"):
-            data = _ps.read.yaml_from_string(
-                data=data_raw_whole,
-                safe=True,
-                constructors={tag_name: load_external_data},
-            )
-        elif file_ext == "toml":
-            data = _ps.read.toml_from_string(data=data_raw_whole, as_dict=True)
-        else:
-            raise ValueError(f"Invalid file extension {file_ext} for URL {url}")
-        if jsonpath_expr:
-            try:
-                data = _ps.update.TemplateFiller().fill(
-                    data=data,
-                    template=jsonpath_expr,
-                )
-            except Exception as e:
-                raise ValueError(
-                    f"No match found for JSONPath '{jsonpath_expr}' in the JSON data from '{url}'")
         if cache_manager:
             cache_manager.set(typ="extension", key=tag_value, value=data)
         return data
@@ -1,7 +1,17 @@
-from typing import Literal as _Literal
+from typing import Any as _Any, Literal as _Literal, Sequence as _Sequence
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
 from pathlib import Path as _Path
+from importlib import metadata as _metadata
+import atexit as _atexit
 import copy
+import hashlib as _hashlib
+import json as _json
+import multiprocessing as _multiprocessing
+import os as _os
+import pickle as _pickle
 import re as _re
+import tempfile as _tempfile
+from urllib import parse as _urlparse
 
 import trove_classifiers as _trove_classifiers
 import jsonschema as _jsonschema
@@ -13,11 +23,38 @@ import pyserials as _ps
 from mdit.data import schema as _mdit_schema
 from loggerman import logger as _logger
 
-from controlman import exception as _exception
+from controlman import exception as _exception, const as _const, _file_util
+from controlman._schema_compiler import SchemaCompiler as _SchemaCompiler
+from controlman._default_plan import DefaultPlan as _DefaultPlan
 
 
 _schema_dir_path = _pkgdata.get_package_path_from_caller(top_level=True) / "_data" / "schema"
 
+_REGISTRY_AFTER: _referencing.Registry | None = None
+_REGISTRY_BEFORE: _referencing.Registry | None = None
+_VALIDATORS: dict[tuple[str, bool], tuple[dict, _jsonschema.protocols.Validator, str]] = {}
+_SUBSCHEMA_VALIDATORS: dict[tuple[str, bool], _jsonschema.protocols.Validator] = {}
+_COMPILERS: dict[bool, _SchemaCompiler] = {}
+_DEFAULT_PLANS: dict[bool, _DefaultPlan] = {}
+_SECTION_VALIDATORS: dict[tuple[str, bool], _jsonschema.protocols.Validator | None] = {}
+_SECTION_DIGESTS: dict[tuple[str, bool], dict[str, str]] = {}
+_PROCESS_POOL: tuple[int | None, _ProcessPoolExecutor] | None = None
+_SCHEMA_FINGERPRINT: str | None = None
+
+# Distributions whose bundled schemas end up in the registries.
+_SCHEMA_DISTRIBUTIONS = ("ControlMan", "MDit", "JSONSchemata")
+_SPECIFICATIONS = {
+    spec.name: spec for spec in (
+        _referencing_jsonschema.DRAFT202012,
+        _referencing_jsonschema.DRAFT201909,
+        _referencing_jsonschema.DRAFT7,
+        _referencing_jsonschema.DRAFT6,
+        _referencing_jsonschema.DRAFT4,
+        _referencing_jsonschema.DRAFT3,
+        _referencing.Specification.OPAQUE,
+    )
+}
+
 
 def get_schema(
     schema: _Literal["main", "local", "cache", "entity", "variables", "changelog", "contributors"] = "main",
@@ -33,29 +70,57 @@ def validate(
     schema: _Literal["main", "local", "cache", "entity", "variables", "changelog", "contributors"] = "main",
     source: _Literal["source", "compiled"] = "compiled",
     before_substitution: bool = False,
+    fail_fast: bool = False,
+    max_workers: int | None = 1,
 ) -> None:
-    """Validate data against a schema."""
-    schema_dict = get_schema(schema=schema)
-    _js.edit.required_last(schema_dict)
-    if schema == "main":
-        _add_custom_keys(schema_dict)
-    if before_substitution:
-        schema_dict = modify_schema(schema_dict)["anyOf"][0]
-    try:
-        _ps.validate.jsonschema(
+    """Validate data against a schema.
+
+    Parameters
+    ----------
+    data
+        The data to validate. Default values are filled in place.
+    schema
+        Name of the schema.
+    source
+        Source of the data, used in error reports.
+    before_substitution
+        Whether the data may still contain unsubstituted templates.
+    fail_fast
+        Stop at the first error instead of collecting all errors.
+        The detailed error report is then only created when
+        the `report` (or `cause`) of the raised exception is requested.
+    max_workers
+        Maximum number of processes to validate the top-level sections of the data in parallel.
+        If `None`, all available CPUs are used.
+        With the default value of 1, or when the schema's sections cannot be validated independently
+        (see `_get_section_validator`), the data is validated in the current process.
+        Worker processes are spawned (i.e., they import ControlMan anew) on first use,
+        and reused for later calls with the same value.
+
+    Raises
+    ------
+    controlman.exception.load.ControlManSchemaValidationError
+        If the data is invalid against the schema.
+    """
+    schema_dict, validator, _ = _get_validator(schema=schema, before_substitution=before_substitution)
+    errors = _iter_section_errors(
+        schema=schema,
+        validator=validator,
+        instance=data,
+        before_substitution=before_substitution,
+        fail_fast=fail_fast,
+        max_workers=max_workers,
+    )
+    if errors:
+        _raise_validation_error(
+            errors=errors,
             data=data,
             schema=schema_dict,
-            validator=_jsonschema.Draft202012Validator,
-            registry=_registry_before if before_substitution else _registry_after,
-            fill_defaults=True,
-            iter_errors=True,
-        )
-    except _ps.exception.validate.PySerialsJsonSchemaValidationError as e:
-        raise _exception.load.ControlManSchemaValidationError(
+            validator=validator,
             source=source,
             before_substitution=before_substitution,
-            cause=e,
-        ) from None
+            fail_fast=fail_fast,
+        )
     if schema == "main" and not before_substitution:
         DataValidator(data=data, source=source).validate()
     _logger.success(
@@ -65,21 +130,632 @@ def validate(
     return
 
 
+def validate_batch(
+    data: _Sequence[dict] | dict[str, dict],
+    schema: _Literal["main", "local", "cache", "entity", "variables", "changelog", "contributors"] = "main",
+    source: _Literal["source", "compiled"] = "compiled",
+    before_substitution: bool = False,
+) -> None:
+    """Validate multiple instances against the same schema, and fill their defaults.
+
+    All instances are validated by the same compiled validator,
+    and the errors of all invalid instances are reported together.
+
+    Parameters
+    ----------
+    data
+        The instances, either as a sequence, or as a mapping of IDs to instances.
+        The path of each error starts with the index or ID of its instance.
+    schema
+        Name of the schema.
+    source
+        Source of the data, used in error reports.
+    before_substitution
+        Whether the data may still contain unsubstituted templates.
+
+    Raises
+    ------
+    controlman.exception.load.ControlManSchemaValidationError
+        If any of the instances is invalid.
+    """
+    schema_dict, validator, _ = _get_validator(schema=schema, before_substitution=before_substitution)
+    errors = []
+    for key, instance in (data.items() if isinstance(data, dict) else enumerate(data)):
+        instance_errors = _iter_errors(validator=validator, instance=instance, before_substitution=before_substitution)
+        for error in instance_errors:
+            error.path.appendleft(key)
+        errors.extend(instance_errors)
+    if errors:
+        _raise_validation_error(
+            errors=errors,
+            data=data if isinstance(data, dict) else list(data),
+            schema=schema_dict,
+            validator=validator,
+            source=source,
+            before_substitution=before_substitution,
+        )
+    if schema == "main" and not before_substitution:
+        for instance in (data.values() if isinstance(data, dict) else data):
+            DataValidator(data=instance, source=source).validate()
+    _logger.success(
+        "Validated Schema",
+        f"All {len(data)} instances have been successfully validated against the schema.",
+    )
+    return
+
+
+def validate_subtree(
+    data: dict,
+    path: str,
+    schema: _Literal["main", "local", "cache", "entity", "variables", "changelog", "contributors"] = "main",
+    source: _Literal["source", "compiled"] = "compiled",
+    before_substitution: bool = False,
+) -> None:
+    """Validate a subtree of the data against the corresponding subschema, and fill its defaults.
+
+    This is equivalent to the part of `validate` concerning the given subtree,
+    and is meant for revalidating data after only a part of it has been modified.
+    The subschema is located by following `properties`, `additionalProperties`,
+    `items` and `$ref` keywords (and the subschemas of `anyOf`, `allOf` and `oneOf`)
+    along the path, starting from the root schema.
+
+    Parameters
+    ----------
+    data
+        The complete data, i.e., the root instance of the schema.
+    path
+        Dot-separated path to the subtree, e.g., `team.owner` or `license.component`.
+        Indices of array elements are given as integers, e.g., `issue.forms.0`.
+    schema
+        Name of the root schema.
+    source
+        Source of the data, used in error reports.
+    before_substitution
+        Whether the data may still contain unsubstituted templates.
+
+    Raises
+    ------
+    controlman.exception.load.ControlManSchemaValidationError
+        If the subtree is invalid against its subschema.
+    """
+    instance, path_parts = _get_subtree(data=data, path=path)
+    validator = _get_subschema_validator(
+        schema=schema, before_substitution=before_substitution, path_parts=path_parts
+    )
+    errors = _iter_errors(validator=validator, instance=instance, before_substitution=before_substitution)
+    if errors:
+        for error in errors:
+            error.path.extendleft(reversed(path_parts))
+        _raise_validation_error(
+            errors=errors,
+            data=data,
+            schema=validator.schema,
+            validator=validator,
+            source=source,
+            before_substitution=before_substitution,
+            json_path=path,
+        )
+    _logger.success(
+        "Validated Schema",
+        f"The data at path '{path}' has been successfully validated against the schema.",
+    )
+    return
+
+
+def fill_defaults(
+    data: dict,
+    path: str | None = None,
+    schema: _Literal["main", "local", "cache", "entity", "variables", "changelog", "contributors"] = "main",
+    before_substitution: bool = False,
+) -> None:
+    """Fill the default values of a schema into the data, without validating it.
+
+    This fills the same default values as validation, using a plan precomputed once per schema
+    (see `controlman._default_plan`). It is meant for filling defaults that depend on
+    newly generated data, when the data is validated later anyway.
+
+    Parameters
+    ----------
+    data
+        The complete data, i.e., the root instance of the schema.
+    path
+        Dot-separated path to a subtree of the data (see `validate_subtree`),
+        to only fill the defaults in that subtree.
+    schema
+        Name of the root schema.
+    before_substitution
+        Whether the data may still contain unsubstituted templates.
+    """
+    plan = _get_default_plan(before_substitution=before_substitution)
+    if path is None:
+        schema_dict, _, _ = _get_validator(schema=schema, before_substitution=before_substitution)
+        plan.apply(schema=schema_dict, instance=data)
+        return
+    instance, path_parts = _get_subtree(data=data, path=path)
+    validator = _get_subschema_validator(
+        schema=schema, before_substitution=before_substitution, path_parts=path_parts
+    )
+    plan.apply(schema=validator.schema, instance=instance)
+    return
+
+
+def _get_subtree(data: dict, path: str) -> tuple[_Any, list[str | int]]:
+    """Get the subtree of the data at a dot-separated path, along with the parts of the path."""
+    path_parts = []
+    instance = data
+    for part in path.split("."):
+        if isinstance(instance, list):
+            part = int(part)
+        instance = instance[part]
+        path_parts.append(part)
+    return instance, path_parts
+
+
+def _get_subschema_validator(
+    schema: _Literal["main", "local", "cache", "entity", "variables", "changelog", "contributors"],
+    before_substitution: bool,
+    path_parts: list[str | int],
+) -> _jsonschema.protocols.Validator:
+    """Get the default-filling validator of the subschema at a data path, creating it on first request."""
+    ref = _subschema_ref(schema=schema, before_substitution=before_substitution, path_parts=path_parts)
+    key = (ref, before_substitution)
+    validator = _SUBSCHEMA_VALIDATORS.get(key)
+    if validator is None:
+        validator = _SUBSCHEMA_VALIDATORS[key] = _DefaultFillingValidator(
+            {"$ref": ref},
+            registry=_get_registry(before_substitution=before_substitution),
+        )
+    return validator
+
+
+def _iter_errors(
+    validator: _jsonschema.protocols.Validator,
+    instance,
+    before_substitution: bool,
+    fail_fast: bool = False,
+) -> list[_jsonschema.ValidationError]:
+    """Validate an instance and fill its defaults, returning all validation errors.
+
+    The instance is first validated by the compiled function of the validator's schema
+    (see `controlman._schema_compiler`), which fills the same defaults as the validator.
+    Only when the instance is invalid is the validator itself used, to collect the errors
+    (or only the first error, when `fail_fast` is set).
+    """
+    compiled = _get_compiler(before_substitution=before_substitution).compile(validator.schema)
+    if compiled(instance, False):
+        return []
+    return _collect_errors(validator=validator, instance=instance, fail_fast=fail_fast)
+
+
+def _collect_errors(
+    validator: _jsonschema.protocols.Validator,
+    instance,
+    fail_fast: bool = False,
+) -> list[_jsonschema.ValidationError]:
+    if not fail_fast:
+        return list(validator.iter_errors(instance))
+    error = next(validator.iter_errors(instance), None)
+    return [error] if error else []
+
+
+def _get_compiler(before_substitution: bool) -> _SchemaCompiler:
+    """Get the schema compiler for the given registry variant, creating it on first use."""
+    compiler = _COMPILERS.get(before_substitution)
+    if compiler is None:
+        compiler = _COMPILERS[before_substitution] = _SchemaCompiler(
+            registry=_get_registry(before_substitution=before_substitution),
+            validator_class=_DefaultFillingValidator,
+        )
+    return compiler
+
+
+def _iter_section_errors(
+    schema: _Literal["main", "local", "cache", "entity", "variables", "changelog", "contributors"],
+    validator: _jsonschema.protocols.Validator,
+    instance,
+    before_substitution: bool,
+    fail_fast: bool = False,
+    max_workers: int | None = 1,
+) -> list[_jsonschema.ValidationError]:
+    """Validate an instance section by section, skipping sections unchanged since their last validation.
+
+    For schemas whose root only constrains the top-level keys (see `_get_section_validator`),
+    the value of each top-level key (section) is independent of the others.
+    Therefore, a digest of each section is recorded after it is validated and filled,
+    and sections with the same digest as the last validated one are skipped.
+    If any error is found, the whole instance is validated again to collect all errors,
+    or, when `fail_fast` is set, only the first error of the first invalid section is returned.
+    When `max_workers` allows, changed sections are first validated in parallel processes
+    (see `_fill_sections_in_processes`); only the sections found invalid there are validated again here.
+    """
+    root_validator = _get_section_validator(schema=schema, before_substitution=before_substitution)
+    if root_validator is None or not isinstance(instance, dict):
+        return _iter_errors(
+            validator=validator, instance=instance, before_substitution=before_substitution, fail_fast=fail_fast
+        )
+    if _iter_errors(validator=root_validator, instance=instance, before_substitution=before_substitution):
+        return _collect_errors(validator=validator, instance=instance, fail_fast=fail_fast)
+    digests = _SECTION_DIGESTS.setdefault((schema, before_substitution), {})
+    changed_keys = [
+        key for key, section in instance.items()
+        if key in validator.schema["properties"] and digests.get(key) != _section_digest(section)
+    ]
+    if max_workers != 1 and len(changed_keys) > 1:
+        changed_keys = _fill_sections_in_processes(
+            schema=schema,
+            before_substitution=before_substitution,
+            instance=instance,
+            keys=changed_keys,
+            max_workers=max_workers,
+        )
+    valid = True
+    for key in changed_keys:
+        section = instance[key]
+        section_validator = _get_subschema_validator(
+            schema=schema, before_substitution=before_substitution, path_parts=[key]
+        )
+        section_errors = _iter_errors(
+            validator=section_validator,
+            instance=section,
+            before_substitution=before_substitution,
+            fail_fast=fail_fast,
+        )
+        if not section_errors:
+            digests[key] = _section_digest(section)
+            continue
+        digests.pop(key, None)
+        if fail_fast:
+            section_errors[0].path.appendleft(key)
+            return section_errors
+        valid = False
+    if valid:
+        return []
+    return list(validator.iter_errors(instance))
+
+
+def _fill_sections_in_processes(
+    schema: _Literal["main", "local", "cache", "entity", "variables", "changelog", "contributors"],
+    before_substitution: bool,
+    instance: dict,
+    keys: list[str],
+    max_workers: int | None,
+) -> list[str]:
+    """Validate top-level sections of an instance in a process pool, and fill their defaults.
+
+    Each section is sent to a worker process, which validates a copy of it and fills its defaults.
+    Results are merged back in the order of `keys`, regardless of the order in which workers finish,
+    by adding the filled defaults into the original objects (see `_merge_filled`),
+    so that references to any part of the section remain valid.
+    Invalid sections are left unchanged, so that their errors can be collected in the current process,
+    with their original paths.
+
+    Returns
+    -------
+    list[str]
+        Keys of the invalid sections, in their original order.
+    """
+    pool = _get_process_pool(max_workers=max_workers)
+    results = [
+        pool.submit(_fill_section, schema, before_substitution, key, instance[key]) for key in keys
+    ]
+    invalid_keys = []
+    for key, result in zip(keys, results):
+        is_valid, filled_section = result.result()
+        if not is_valid:
+            invalid_keys.append(key)
+            continue
+        instance[key] = _merge_filled(instance[key], filled_section)
+        _SECTION_DIGESTS[(schema, before_substitution)][key] = _section_digest(filled_section)
+    return invalid_keys
+
+
+def _get_process_pool(max_workers: int | None) -> _ProcessPoolExecutor:
+    """Get the process pool for validating sections, creating it on first use.
+
+    Only one pool is kept; it is replaced when a different number of workers is requested,
+    and shut down at interpreter exit.
+    Workers are started with the `spawn` method, since forking a process
+    with running threads (e.g., background cache refreshes) can deadlock the workers.
+    """
+    global _PROCESS_POOL
+    if _PROCESS_POOL is not None:
+        pool_max_workers, pool = _PROCESS_POOL
+        if pool_max_workers == max_workers:
+            return pool
+        pool.shutdown()
+    else:
+        _atexit.register(_shutdown_process_pool)
+    pool = _ProcessPoolExecutor(max_workers=max_workers, mp_context=_multiprocessing.get_context("spawn"))
+    _PROCESS_POOL = (max_workers, pool)
+    return pool
+
+
+def _shutdown_process_pool() -> None:
+    global _PROCESS_POOL
+    if _PROCESS_POOL is not None:
+        _PROCESS_POOL[1].shutdown()
+        _PROCESS_POOL = None
+    return
+
+
+def _merge_filled(original, filled):
+    """Add the defaults filled into a copy of an object to the original object, and return the original.
+
+    Filling defaults only adds keys to mappings,
+    so all values of the original are kept, and only missing keys are added from the copy.
+    """
+    if isinstance(original, dict) and isinstance(filled, dict):
+        for key, filled_value in filled.items():
+            original[key] = _merge_filled(original[key], filled_value) if key in original else filled_value
+        return original
+    if isinstance(original, list) and isinstance(filled, list) and len(original) == len(filled):
+        for idx, filled_value in enumerate(filled):
+            original[idx] = _merge_filled(original[idx], filled_value)
+        return original
+    return original
+
+
+def _fill_section(
+    schema: _Literal["main", "local", "cache", "entity", "variables", "changelog", "contributors"],
+    before_substitution: bool,
+    key: str,
+    section,
+) -> tuple[bool, _Any]:
+    """Validate a top-level section and fill its defaults in a worker process.
+
+    Returns
+    -------
+    tuple[bool, Any]
+        Whether the section is valid, and the section with its defaults filled.
+    """
+    validator = _get_subschema_validator(schema=schema, before_substitution=before_substitution, path_parts=[key])
+    compiled = _get_compiler(before_substitution=before_substitution).compile(validator.schema)
+    return compiled(section, False), section
+
+
+def _get_section_validator(
+    schema: _Literal["main", "local", "cache", "entity", "variables", "changelog", "contributors"],
+    before_substitution: bool,
+) -> _jsonschema.protocols.Validator | None:
+    """Get a validator for the root of a schema, excluding its subschemas.
+
+    The validator checks only the top-level keys of the instance and fills their default values,
+    so it is only created for schemas whose root has no keywords other than
+    `type`, `required`, `properties` and a boolean `additionalProperties`.
+    """
+    key = (schema, before_substitution)
+    if key in _SECTION_VALIDATORS:
+        return _SECTION_VALIDATORS[key]
+    schema_dict, _, _ = _get_validator(schema=schema, before_substitution=before_substitution)
+    keywords = set(schema_dict) & set(_DefaultFillingValidator.VALIDATORS)
+    if (
+        "properties" not in keywords
+        or not keywords <= {"type", "required", "properties", "additionalProperties"}
+        or not isinstance(schema_dict.get("additionalProperties", True), bool)
+    ):
+        _SECTION_VALIDATORS[key] = None
+        return
+    root_schema = {
+        keyword: value for keyword, value in schema_dict.items() if keyword != "properties"
+    }
+    root_schema["properties"] = {
+        prop: {"default": subschema["default"]} if isinstance(subschema, dict) and "default" in subschema else {}
+        for prop, subschema in schema_dict["properties"].items()
+    }
+    _SECTION_VALIDATORS[key] = _DefaultFillingValidator(
+        root_schema,
+        registry=_get_registry(before_substitution=before_substitution),
+    )
+    return _SECTION_VALIDATORS[key]
+
+
+def _section_digest(section) -> str:
+    """Get a digest of a section of data, distinguishing the types of non-JSON values."""
+    content = _json.dumps(
+        section,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=lambda obj: f"{type(obj).__module__}.{type(obj).__qualname__}:{obj!r}",
+    )
+    return _hashlib.sha256(content.encode()).hexdigest()
+
+
+def _get_default_plan(before_substitution: bool) -> _DefaultPlan:
+    """Get the default-value plans for the given registry variant, creating them on first use."""
+    plan = _DEFAULT_PLANS.get(before_substitution)
+    if plan is None:
+        plan = _DEFAULT_PLANS[before_substitution] = _DefaultPlan(
+            registry=_get_registry(before_substitution=before_substitution),
+            compiler=_get_compiler(before_substitution=before_substitution),
+        )
+    return plan
+
+
+def _raise_validation_error(
+    errors: list[_jsonschema.ValidationError],
+    data: dict,
+    schema: dict,
+    validator: _jsonschema.protocols.Validator,
+    source: _Literal["source", "compiled"],
+    before_substitution: bool,
+    json_path: str | None = None,
+    fail_fast: bool = False,
+):
+    def make_cause():
+        return _ps.exception.validate.PySerialsJsonSchemaValidationError(
+            causes=errors,
+            data=data,
+            schema=schema,
+            validator=validator,
+            registry=_get_registry(before_substitution=before_substitution),
+        )
+
+    if fail_fast:
+        error = errors[0]
+        raise _exception.load.ControlManSchemaValidationError(
+            source=source,
+            before_substitution=before_substitution,
+            problem=f"Found an error in the data at {error.json_path}: {error.message}",
+            json_path=".".join(str(part) for part in error.absolute_path) or json_path,
+            data=data,
+            cause_factory=make_cause,
+        ) from None
+    raise _exception.load.ControlManSchemaValidationError(
+        source=source,
+        before_substitution=before_substitution,
+        json_path=json_path,
+        data=data,
+        cause_factory=make_cause,
+    ) from None
+
+
+def _subschema_ref(
+    schema: _Literal["main", "local", "cache", "entity", "variables", "changelog", "contributors"],
+    before_substitution: bool,
+    path_parts: list[str | int],
+) -> str:
+    """Get an absolute reference (URI with JSON pointer fragment) to the subschema at a data path."""
+    _, _, schema_id = _get_validator(schema=schema, before_substitution=before_substitution)
+    resolver = _get_registry(before_substitution=before_substitution).resolver()
+    # In the modified registry, the original schema is wrapped in an 'anyOf' clause (see `modify_schema`)
+    location = (schema_id, "/anyOf/0" if before_substitution else "")
+    for part in path_parts:
+        child_location = _find_child_schema(resolver=resolver, location=location, key=part, visited=set())
+        if not child_location:
+            raise ValueError(
+                f"No subschema found for path '{'.'.join(str(part) for part in path_parts)}' "
+                f"in schema '{schema}'."
+            )
+        location = child_location
+    uri, pointer = location
+    return f"{uri}#{pointer}"
+
+
+def _find_child_schema(
+    resolver: _referencing._core.Resolver,
+    location: tuple[str, str],
+    key: str | int,
+    visited: set[tuple[str, str]],
+) -> tuple[str, str] | None:
+    """Find the location of the subschema for a child of the instance described by the schema at `location`."""
+    if location in visited:
+        return
+    visited.add(location)
+    uri, pointer = location
+    node = resolver.lookup(f"{uri}#{pointer}").contents
+    if not isinstance(node, dict):
+        return
+    if isinstance(key, int):
+        if key < len(node.get("prefixItems", [])):
+            return uri, f"{pointer}/prefixItems/{key}"
+        if isinstance(node.get("items"), dict):
+            return uri, f"{pointer}/items"
+    else:
+        if key in node.get("properties", {}):
+            return uri, f"{pointer}/properties/{_escape_pointer_token(key)}"
+        for pattern in node.get("patternProperties", {}):
+            if _re.search(pattern, key):
+                return uri, f"{pointer}/patternProperties/{_escape_pointer_token(pattern)}"
+        if isinstance(node.get("additionalProperties"), dict):
+            return uri, f"{pointer}/additionalProperties"
+    if "$ref" in node:
+        ref_uri, _, ref_pointer = _urlparse.urljoin(uri, node["$ref"]).partition("#")
+        child_location = _find_child_schema(
+            resolver=resolver, location=(ref_uri, ref_pointer), key=key, visited=visited
+        )
+        if child_location:
+            return child_location
+    for keyword in ("allOf", "anyOf", "oneOf"):
+        for idx in range(len(node.get(keyword, []))):
+            child_location = _find_child_schema(
+                resolver=resolver, location=(uri, f"{pointer}/{keyword}/{idx}"), key=key, visited=visited
+            )
+            if child_location:
+                return child_location
+    return
+
+
+def _escape_pointer_token(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _get_validator(
+    schema: _Literal["main", "local", "cache", "entity", "variables", "changelog", "contributors"],
+    before_substitution: bool,
+) -> tuple[dict, _jsonschema.protocols.Validator, str]:
+    """Get the transformed schema, its default-filling validator, and the schema's ID.
+
+    Both are created on first request for each schema variant,
+    and reused for the life of the process.
+    """
+    key = (schema, before_substitution)
+    if key in _VALIDATORS:
+        return _VALIDATORS[key]
+    schema_dict = get_schema(schema=schema)
+    schema_id = schema_dict["$id"]
+    _js.edit.required_last(schema_dict)
+    if schema == "main":
+        _add_custom_keys(schema_dict)
+    if before_substitution:
+        schema_dict = modify_schema(schema_dict)["anyOf"][0]
+    validator = _DefaultFillingValidator(
+        schema_dict,
+        registry=_get_registry(before_substitution=before_substitution),
+    )
+    _VALIDATORS[key] = schema_dict, validator, schema_id
+    return _VALIDATORS[key]
+
+
+def _extend_with_default(validator_class: type[_jsonschema.protocols.Validator]) -> type[_jsonschema.protocols.Validator]:
+    """Extend a validator class to fill in default values from the schema.
+
+    Default values are deep-copied before being added to the instance,
+    since the schemas are shared between all validations in the process.
+    """
+    validate_properties = validator_class.VALIDATORS["properties"]
+
+    def set_defaults(validator, properties, instance, schema):
+        if isinstance(instance, dict):  # The entire dict instance may be templated
+            for prop, subschema in properties.items():
+                if "default" in subschema:
+                    instance.setdefault(prop, copy.deepcopy(subschema["default"]))
+        yield from validate_properties(validator, properties, instance, schema)
+
+    return _jsonschema.validators.extend(validator_class, {"properties": set_defaults})
+
+
+_DefaultFillingValidator = _extend_with_default(_jsonschema.Draft202012Validator)
+
+
 class DataValidator:
+    """Semantic validation of control center data, beyond what the schema can express.
+
+    All cross-references between sections (team members, commits, labels, form elements)
+    are indexed once on initialization, so that each check is a single pass over its section
+    with constant-time lookups.
+    """
+
     def __init__(self, data: dict, source: _Literal["source", "compiled"] = "compiled"):
         self._data = _ps.nested_dict.NestedDict(data)
         self._source = source
+        self._team_ids: set[str] = set(self._data["team"] or {})
+        self._release_commit_ids: set[str] = set(self._data["commit.release"] or {})
+        self._dev_commit_ids: set[str] = set(self._data["commit.dev"] or {})
+        self._label_ids: set[tuple[str, str]] = {
+            (group_id, label_id)
+            for group_id, group_data in (self._data["label"] or {}).items()
+            for label_id in (group_data if group_id == "single" else group_data.get("label", {}))
+        }
         return
 
     def validate(self):
         self.dir_paths()
         self.branch_names()
         self.trove_classifiers()
-        # self.citation()
-        # self.changelogs()
-        # self.commits()
-        # self.issue_forms()
-        # self.labels()
+        self.citation()
+        self.commits()
+        self.issue_forms()
+        self.labels()
         return
 
     def trove_classifiers(self):
@@ -98,57 +774,57 @@ class DataValidator:
     def citation(self):
         """Verify that citation data are correct."""
 
-        def verify_reference(ref: dict, ref_key: str):
-            entity_list_keys = [
-                "authors", "contacts", "editors", "editors-series", "recipients", "senders", "translators"
-            ]
-            entity_keys = ["conference", "database-provider", "institution", "location", "publisher"]
-            for entity_key in entity_keys:
-                entity = ref.get(entity_key)
-                if isinstance(entity, str) and entity not in self._data["team"]:
-                    raise _exception.load.ControlManSchemaValidationError(
-                        source=self._source,
-                        problem=f"Invalid team member ID: {entity}",
-                        json_path=f"citation.{ref_key}.{entity_key}",
-                        data=self._data,
-                    )
-            for entity_list_key in entity_list_keys:
-                for entity_idx, entity in enumerate(ref.get(entity_list_key, [])):
-                    if isinstance(entity, str) and entity not in self._data["team"]:
-                        raise _exception.load.ControlManSchemaValidationError(
-                            source=self._source,
-                            problem=f"Invalid team member ID: {entity}",
-                            json_path=f"citation.{ref_key}.{entity_list_key}[{entity_idx}]",
-                            data=self._data,
-                        )
+        def verify_team_id(member_id: str, json_path: str):
+            if member_id not in self._team_ids:
+                raise _exception.load.ControlManSchemaValidationError(
+                    source=self._source,
+                    problem=f"Invalid team member ID: {member_id}",
+                    json_path=json_path,
+                    data=self._data(),
+                )
             return
 
-        if not self._data["citation"]:
+        def verify_entity_ids(entities: list, json_path: str):
+            # Plain strings may also be contributor IDs,
+            # so only entities explicitly marked as members are looked up in the team.
+            for entity_idx, entity in enumerate(entities or []):
+                if isinstance(entity, dict) and entity.get("member", True):
+                    verify_team_id(entity["id"], f"{json_path}[{entity_idx}].id")
             return
-        # Verify that authors list is not empty
-        if not self._data["citation.authors"]:
-            raise _exception.load.ControlManSchemaValidationError(
-                source=self._source,
-                problem="Citation authors are missing.",
-                json_path="citation.authors",
-                data=self._data,
-            )
-        # Verify that member IDs are valid
-        for key in ("authors", "contacts"):
-            for member_id in self._data.get(f"citation.{key}", []):
-                if member_id not in self._data["team"]:
-                    raise _exception.load.ControlManSchemaValidationError(
-                        source=self._source,
-                        problem=f"Invalid team member ID: {member_id}",
-                        json_path=f"citation.{key}",
-                        data=self._data,
-                    )
 
-        preferred_citation = self._data["citation.preferred_citation"]
-        if preferred_citation:
-            verify_reference(preferred_citation, "preferred_citation")
-        for ref_idx, ref in enumerate(self._data.get("citation.references", [])):
-            verify_reference(ref, f"references[{ref_idx}]")
+        def verify_reference(ref: dict, json_path: str):
+            for entity_key in ("conference", "database-provider", "institution", "location", "publisher"):
+                entity = ref.get(entity_key)
+                if isinstance(entity, str):
+                    verify_team_id(entity, f"{json_path}.{entity_key}")
+            for entity_list_key in (
+                "authors", "contacts", "editors", "editors-series", "recipients", "senders", "translators"
+            ):
+                for entity_idx, entity in enumerate(ref.get(entity_list_key, [])):
+                    if isinstance(entity, str):
+                        verify_team_id(entity, f"{json_path}.{entity_list_key}[{entity_idx}]")
+            return
+
+        cff = self._data["citation.cff"]
+        if cff:
+            if not cff.get("authors"):
+                raise _exception.load.ControlManSchemaValidationError(
+                    source=self._source,
+                    problem="Citation authors are missing.",
+                    json_path="citation.cff.authors",
+                    data=self._data(),
+                )
+            for key in ("authors", "contacts"):
+                verify_entity_ids(cff.get(key), f"citation.cff.{key}")
+            preferred_citation = cff.get("preferred_citation")
+            if preferred_citation:
+                verify_reference(preferred_citation, "citation.cff.preferred_citation")
+            for ref_idx, ref in enumerate(cff.get("references", [])):
+                verify_reference(ref, f"citation.cff.references[{ref_idx}]")
+        zenodo = self._data["citation.zenodo"]
+        if zenodo:
+            for key in ("creators", "contributors"):
+                verify_entity_ids(zenodo.get(key), f"citation.zenodo.{key}")
         return
 
     def dir_paths(self):
@@ -230,134 +906,79 @@ class DataValidator:
         for branch_key, branch_data in self._data["branch"].items():
             branch_keys.append(branch_key)
             branch_names.append(branch_data["name"])
-        for idx, branch_name in enumerate(branch_names):
-            for idx2, branch_name2 in enumerate(branch_names[idx + 1:]):
-                if branch_name.startswith(branch_name2) or branch_name2.startswith(branch_name):
-                    raise _exception.load.ControlManSchemaValidationError(
-                        source=self._source,
-                        problem=f"Branch name '{branch_name}' defined at 'branch.{branch_keys[idx]}' "
-                        f"overlaps with branch name '{branch_name2}' defined at 'branch.{branch_keys[idx + idx2 + 1]}'.",
-                        json_path=branch_keys[idx],
-                        data=self._data(),
-                    )
-        return
-
-    def changelogs(self):
-        """Verify that changelog paths, names and sections are unique."""
-        changelog_paths = []
-        changelog_names = []
-        for changelog_id, changelog_data in self._data["changelog"].items():
-            if changelog_data["path"] in changelog_paths:
-                raise _exception.load.ControlManSchemaValidationError(
-                    source=self._source,
-                    problem=f"The path '{changelog_data['path']}' set for changelog '{changelog_id}' "
-                    f"is already used by another earlier changelog.",
-                    json_path=f"changelog.{changelog_id}.path",
-                    data=self._data,
-                )
-            changelog_paths.append(changelog_data["path"])
-            if changelog_data["name"] in changelog_names:
-                raise _exception.load.ControlManSchemaValidationError(
-                    source=self._source,
-                    problem=f"The name '{changelog_data['name']}' set for changelog '{changelog_id}' "
-                    f"is already used by another earlier changelog.",
-                    json_path=f"changelog.{changelog_id}.name",
-                    data=self._data,
-                )
-            changelog_names.append(changelog_data["name"])
-            # if changelog_id == "package_public_prerelease": #TODO: check package_public_prerelease
-            #     continue
-            section_ids = []
-            for idx, section in enumerate(changelog_data.get("sections", [])):
-                if section["id"] in section_ids:
-                    raise _exception.load.ControlManSchemaValidationError(
-                        source=self._source,
-                        problem=f"The changelog section ID '{section['id']}' set for changelog '{changelog_id}' "
-                        f"is already used by another earlier section.",
-                        json_path=f"changelog.{changelog_id}.sections[{idx}]",
-                        data=self._data,
-                    )
-                section_ids.append(section["id"])
+        for idx, idx2 in _prefix_overlaps(branch_names):
+            raise _exception.load.ControlManSchemaValidationError(
+                source=self._source,
+                problem=f"Branch name '{branch_names[idx]}' defined at 'branch.{branch_keys[idx]}' "
+                f"overlaps with branch name '{branch_names[idx2]}' defined at 'branch.{branch_keys[idx2]}'.",
+                json_path=f"branch.{branch_keys[idx]}",
+                data=self._data(),
+            )
         return
 
     def commits(self):
-        """Verify that commit types are unique, and that subtypes are defined."""
-        commit_types = []
-        for main_type in ("primary", "primary_custom"):
-            for commit_id, commit_data in self._data["commit"][main_type].items():
-                if commit_data["type"] in commit_types:
-                    raise _exception.load.ControlManSchemaValidationError(
-                        source=self._source,
-                        problem=f"The commit type '{commit_data['type']}' set for commit '{main_type}.{commit_id}' "
-                        f"is already used by another earlier commit.",
-                        json_path=f"commit.{main_type}.{commit_id}.type",
-                        data=self._data,
+        """Verify that release and development commit types are unique, and that subtypes are defined."""
+        commit_types = {}
+        for group in ("release", "dev"):
+            for commit_id, commit_data in (self._data[f"commit.{group}"] or {}).items():
+                scope = commit_data.get("scope")
+                commit_type = (commit_data["type"], tuple(scope) if isinstance(scope, list) else scope)
+                if commit_type in commit_types:
+                    _logger.critical(
+                        f"Duplicate commit type: {commit_data['type']}",
+                        f"The type and scope set for commit '{group}.{commit_id}' "
+                        f"are already used by the earlier commit '{commit_types[commit_type]}'.",
                     )
-                commit_types.append(commit_data["type"])
-                for subtype_type, subtypes in commit_data["subtypes"]:
+                else:
+                    commit_types[commit_type] = f"{group}.{commit_id}"
+                if group == "dev":
+                    continue
+                for subtype_type, subtypes in commit_data.get("subtypes", {}).items():
                     for subtype in subtypes:
-                        if subtype not in self._data["commit"]["secondary_custom"]:
+                        if subtype not in self._dev_commit_ids:
                             _logger.critical(
                                 f"Invalid commit subtype: {subtype}",
-                                f"The subtype '{subtype}' set for commit '{main_type}.{commit_id}' "
-                                f"in 'subtypes.{subtype_type}' is not defined in 'commit.secondary_custom'.",
+                                f"The subtype '{subtype}' set for commit 'release.{commit_id}' "
+                                f"in 'subtypes.{subtype_type}' is not defined in 'commit.dev'.",
                             )
-        for commit_id, commit_data in self._data["commit"]["secondary_action"].items():
-            if commit_data["type"] in commit_types:
-                _logger.critical(
-                    f"Duplicate commit type: {commit_data['type']}",
-                    f"The type '{commit_data['type']}' set for commit 'secondary_action.{commit_id}' "
-                    f"is already used by another earlier commit.",
-                )
-            commit_types.append(commit_data["type"])
-        changelog_sections = {}
-        for commit_type, commit_data in self._data["commit"]["secondary_custom"].items():
-            if commit_type in commit_types:
-                _logger.critical(
-                    f"Duplicate commit type: {commit_type}",
-                    f"The type '{commit_type}' set in 'secondary_custom' "
-                    f"is already used by another earlier commit.",
-                )
-            commit_types.append(commit_type)
-            # Verify that linked changelogs are defined
-            changelog_id = commit_data["changelog_id"]
-            if changelog_id not in self._data["changelog"]:
-                _logger.critical(
-                    f"Invalid commit changelog ID: {changelog_id}",
-                    f"The changelog ID '{changelog_id}' set for commit "
-                    f"'secondary_custom.{commit_type}' is not defined in 'changelog'.",
-                )
-            if changelog_id not in changelog_sections:
-                changelog_sections[changelog_id] = [
-                    section["id"] for section in self._data["changelog"][changelog_id]["sections"]
-                ]
-            if commit_data["changelog_section_id"] not in changelog_sections[changelog_id]:
-                _logger.critical(
-                    f"Invalid commit changelog section ID: {commit_data['changelog_section_id']}",
-                    f"The changelog section ID '{commit_data['changelog_section_id']}' set for commit "
-                    f"'secondary_custom.{commit_type}' is not defined in 'changelog.{changelog_id}.sections'.",
-                )
         return
 
     def issue_forms(self):
-        form_ids = []
-        form_identifying_labels = []
-        for form_idx, form in enumerate(self._data["issue"]["forms"]):
+        """Verify that issue forms are unique and only reference defined commits, labels and elements."""
+        form_ids = set()
+        form_id_labels = {}
+        for form_idx, form in enumerate(self._data["issue.forms"] or []):
             if form["id"] in form_ids:
                 _logger.critical(
                     f"Duplicate issue-form ID: {form['id']}",
                     f"The issue-form number {form_idx} has an ID that is already used by another earlier form.",
                 )
-            form_ids.append(form["id"])
-            identifying_labels = (form["primary_type"], form.get("subtype"))
-            if identifying_labels in form_identifying_labels:
+            form_ids.add(form["id"])
+            if form["commit"] not in self._release_commit_ids:
                 _logger.critical(
-                    f"Duplicate issue-form identifying labels: {identifying_labels}",
-                    f"The issue-form number {form_idx} has the same identifying labels as another earlier form.",
+                    f"Unknown issue-form commit: {form['commit']}",
+                    f"The commit ID '{form['commit']}' set for issue-form number {form_idx} "
+                    f"does not exist in 'commit.release'.",
                 )
-            form_identifying_labels.append(identifying_labels)
-            element_ids = []
-            element_labels = []
+            id_labels = frozenset(tuple(label) for label in form["id_labels"])
+            if id_labels in form_id_labels:
+                _logger.critical(
+                    f"Duplicate issue-form identifying labels: {form['id_labels']}",
+                    f"The issue-form number {form_idx} has the same identifying labels "
+                    f"as the earlier form number {form_id_labels[id_labels]}.",
+                )
+            else:
+                form_id_labels[id_labels] = form_idx
+            for label_key in ("id_labels", "labels"):
+                for label in form.get(label_key, []):
+                    if tuple(label) not in self._label_ids:
+                        _logger.critical(
+                            f"Unknown issue-form label: {label}",
+                            f"The label '{label}' set in '{label_key}' of issue-form number {form_idx} "
+                            f"does not exist in 'label'.",
+                        )
+            element_ids = set()
+            element_labels = set()
             for elem_idx, elem in enumerate(form["body"]):
                 if elem["type"] == "markdown":
                     continue
@@ -369,103 +990,103 @@ class DataValidator:
                             f"The element number {elem_idx} has an ID that is "
                             f"already used by another earlier element.",
                         )
-                    else:
-                        element_ids.append(elem["id"])
-                if elem["attributes"]["label"] in element_labels:
+                    element_ids.add(elem_id)
+                elem_label = elem["attributes"]["label"]
+                if elem_label in element_labels:
                     _logger.critical(
-                        f"Duplicate issue-form body-element label: {elem['attributes']['label']}",
+                        f"Duplicate issue-form body-element label: {elem_label}",
                         f"The element number {elem_idx} has a label that is already used by another earlier element.",
                     )
-                element_labels.append(elem["attributes"]["label"])
-            if not any(element_id in ("version", "branch") for element_id in element_ids):
+                element_labels.add(elem_label)
+            if element_ids.isdisjoint(("version", "branch")):
                 _logger.critical(
                     f"Missing issue-form body-element: version or branch",
                     f"The issue-form number {form_idx} is missing a body-element "
                     f"with ID 'version' or 'branch'.",
                 )
-            form_post_process = form.get("post_process")
-            if form_post_process:
-                if form_post_process.get("body"):
-                    pattern = r"{([a-zA-Z_][a-zA-Z0-9_]*)}"
-                    var_names = _re.findall(pattern, form_post_process["body"])
-                    for var_name in var_names:
-                        if var_name not in element_ids:
-                            _logger.critical(
-                                f"Unknown issue-form post-process body variable: {var_name}",
-                                f"The variable '{var_name}' is not a valid element ID within the issue body.",
-                            )
-                assign_creator = form_post_process.get("assign_creator")
-                if assign_creator:
-                    if_checkbox = assign_creator.get("if_checkbox")
-                    if if_checkbox:
-                        if if_checkbox["id"] not in element_ids:
-                            _logger.critical(
-                                f"Unknown issue-form post-process assign_creator if_checkbox ID: {if_checkbox}",
-                                f"The ID '{if_checkbox}' is not a valid element ID within the issue body.",
-                            )
-                        for elem in form["body"]:
-                            elem_id = elem.get("id")
-                            if elem_id and elem_id == if_checkbox["id"]:
-                                if elem["type"] != "checkboxes":
-                                    _logger.critical(
-                                        f"Invalid issue-form post-process assign_creator if_checkbox ID: {if_checkbox}",
-                                        f"The ID '{if_checkbox}' is not a checkbox element.",
-                                    )
-                                if len(elem["attributes"]["options"]) < if_checkbox["number"]:
-                                    _logger.critical(
-                                        f"Invalid issue-form post-process assign_creator if_checkbox number: {if_checkbox}",
-                                        f"The number '{if_checkbox['number']}' is greater than the number of "
-                                        f"checkbox options.",
-                                    )
-                                break
-        # Verify that identifying labels are defined in 'label.group' metadata
-        for primary_type_id, subtype_id in form_identifying_labels:
-            if primary_type_id not in self._data["label"]["group"]["primary_type"]["labels"]:
-                _logger.critical(
-                    f"Unknown issue-form `primary_type`: {primary_type_id}",
-                    f"The ID '{primary_type_id}' does not exist in 'label.group.primary_type.labels'.",
-                )
-            if subtype_id and subtype_id not in self._data["label"]["group"]["subtype"]["labels"]:
-                _logger.critical(
-                    f"Unknown issue-form subtype: {subtype_id}",
-                    f"The ID '{subtype_id}' does not exist in 'label.group.subtype.labels'.",
-                )
+            processed_body = form.get("processed_body")
+            if processed_body:
+                for var_name in _re.findall(r"(?<!{){([a-zA-Z_][a-zA-Z0-9_]*)}(?!})", processed_body):
+                    if var_name not in element_ids:
+                        _logger.critical(
+                            f"Unknown issue-form processed-body variable: {var_name}",
+                            f"The variable '{var_name}' is not a valid element ID within the issue body.",
+                        )
         return
 
     def labels(self):
         """Verify that label names and prefixes are unique."""
+        label_data = self._data["label"] or {}
         labels = []
-        for main_type in ("auto_group", "group", "single"):
-            for label_id, label_data in self._data["label"].get(main_type, {}).items():
-                label = label_data["name"] if main_type == "single" else label_data["prefix"]
-                label_type = "name" if main_type == "single" else "prefix"
-                for set_label in labels:
-                    if set_label.startswith(label) or label.startswith(set_label):
-                        _logger.critical(
-                            f"Ambiguous label {label_type}: {label}",
-                            f"The {label_type} '{label}' set for label '{main_type}.{label_id}' "
-                            f"is ambiguous as it overlaps with the already set name/prefix '{set_label}'.",
-                        )
-                labels.append(label)
-        if len(labels) > 1000:
-            _logger.critical(
-                f"Too many labels: {len(labels)}",
-                f"The maximum number of labels allowed by GitHub is 1000.",
-            )
-        for label_id, label_data in self._data["label"]["group"].items():
+        label_types = []
+        label_paths = []
+        count_labels = 0
+        for group_id, group_data in label_data.items():
+            if group_id == "single":
+                for label_id, single_data in group_data.items():
+                    labels.append(single_data["name"])
+                    label_types.append("name")
+                    label_paths.append(f"single.{label_id}")
+                    count_labels += 1
+                continue
+            labels.append(group_data["prefix"])
+            label_types.append("prefix")
+            label_paths.append(group_id)
             suffixes = []
-            for label_type, suffix_data in label_data["labels"].items():
-                suffix = suffix_data["suffix"]
+            for label_id, element_data in group_data.get("label", {}).items():
+                suffix = element_data["suffix"]
                 if suffix in suffixes:
                     _logger.critical(
                         f"Duplicate label suffix: {suffix}",
-                        f"The suffix '{suffix}' set for label 'group.{label_id}.labels.{label_type}' "
+                        f"The suffix '{suffix}' set for label '{group_id}.label.{label_id}' "
                         f"is already used by another earlier label.",
                     )
                 suffixes.append(suffix)
+                count_labels += 1
+        for set_idx, idx in sorted(_prefix_overlaps(labels), key=lambda pair: (pair[1], pair[0])):
+            _logger.critical(
+                f"Ambiguous label {label_types[idx]}: {labels[idx]}",
+                f"The {label_types[idx]} '{labels[idx]}' set for label '{label_paths[idx]}' "
+                f"is ambiguous as it overlaps with the already set name/prefix '{labels[set_idx]}'.",
+            )
+        if count_labels > 1000:
+            _logger.critical(
+                f"Too many labels: {count_labels}",
+                f"The maximum number of labels allowed by GitHub is 1000.",
+            )
         return
 
 
+def _prefix_overlaps(strings: _Sequence[str]) -> list[tuple[int, int]]:
+    """Find all pairs of strings where one string is a prefix of (or equal to) the other.
+
+    The strings are added to a prefix tree (trie), so that each string is only compared
+    to the strings ending on its path, i.e., its prefixes. This takes time linear in the
+    total length of the strings plus the number of overlapping pairs.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Sorted pairs of indices `(i, j)` with `i < j`
+        for all overlapping pairs of strings.
+    """
+    trie = {}
+    for idx, string in enumerate(strings):
+        node = trie
+        for char in string:
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append(idx)
+    pairs = []
+    for idx, string in enumerate(strings):
+        node = trie
+        for char in string:
+            # Strings ending at an ancestor node are proper prefixes of the current string.
+            pairs.extend((min(idx, other), max(idx, other)) for other in node.get(None, ()))
+            node = node[char]
+        pairs.extend((other, idx) for other in node[None] if other < idx)
+    return sorted(pairs)
+
+
 def modify_schema(schema: dict) -> dict:
     schema.pop("$schema", None)  # see: https://github.com/python-jsonschema/jsonschema/issues/1295
     if "properties" in schema:
@@ -492,32 +1113,170 @@ def modify_schema(schema: dict) -> dict:
     return new_schema
 
 
-def _make_registry():
+def _get_registry(before_substitution: bool = False) -> _referencing.Registry:
+    """Get the schema registry for the given variant, building it on first use.
 
-    def make_resource(
-        schema: dict, spec: _referencing.Specification = _referencing_jsonschema.DRAFT202012
-    ) -> _referencing.Resource:
-        return _referencing.Resource.from_contents(schema, default_specification=spec)
+    The two variants are built independently, so that processes never validating
+    data before template substitution do not pay for the modified registry.
+    """
+    global _REGISTRY_BEFORE, _REGISTRY_AFTER
+    if before_substitution:
+        if _REGISTRY_BEFORE is None:
+            _REGISTRY_BEFORE = _load_registry_snapshot(variant="before")
+        if _REGISTRY_BEFORE is None:
+            _REGISTRY_BEFORE = _make_registry_before(registry_after=_get_registry())
+            _save_registry_snapshot(registry=_REGISTRY_BEFORE, variant="before")
+        return _REGISTRY_BEFORE
+    if _REGISTRY_AFTER is None:
+        _REGISTRY_AFTER = _load_registry_snapshot(variant="after")
+    if _REGISTRY_AFTER is None:
+        _REGISTRY_AFTER = _make_registry_after()
+        _save_registry_snapshot(registry=_REGISTRY_AFTER, variant="after")
+    return _REGISTRY_AFTER
+
+
+def _make_resource(
+    schema: dict, spec: _referencing.Specification = _referencing_jsonschema.DRAFT202012
+) -> _referencing.Resource:
+    return _referencing.Resource.from_contents(schema, default_specification=spec)
 
+
+def _make_registry_after() -> _referencing.Registry:
     resources = []
-    def_schemas_path = _schema_dir_path
-    for schema_filepath in def_schemas_path.glob("**/*.yaml"):
+    for schema_filepath in _schema_dir_path.glob("**/*.yaml"):
         schema_dict = _ps.read.yaml_from_file(path=schema_filepath)
         _js.edit.required_last(schema_dict)
         _add_custom_keys(schema_dict)
-        resources.append(make_resource(schema_dict))
-    registry_after, _ = _mdit_schema.make_registry(dynamic=False, crawl=True, add_resources=resources)
-    resources_before = []
-    for registry_schema_id in registry_after:
-        registry_schema_dict = registry_after[registry_schema_id].contents
+        resources.append(_make_resource(schema_dict))
+    registry, _ = _mdit_schema.make_registry(dynamic=False, crawl=True, add_resources=resources)
+    for registry_schema_id in registry:
+        registry_schema_dict = registry[registry_schema_id].contents
         registry_schema_dict.pop("$schema", None)
         _add_custom_keys(registry_schema_dict)
+    return registry
+
+
+def _make_registry_before(registry_after: _referencing.Registry) -> _referencing.Registry:
+    resources = []
+    for registry_schema_id in registry_after:
+        registry_schema_dict = registry_after[registry_schema_id].contents
         registry_schema_spec = registry_after[registry_schema_id]._specification
         registry_schema_dict_before = modify_schema(copy.deepcopy(registry_schema_dict))
-        resources_before.append(make_resource(registry_schema_dict_before, spec=registry_schema_spec))
+        resources.append(_make_resource(registry_schema_dict_before, spec=registry_schema_spec))
+    return resources @ _referencing.Registry()
+
+
+def schema_fingerprint() -> str:
+    """Get a fingerprint of all schemas used for validation.
+
+    The fingerprint changes whenever the bundled schema files,
+    or the versions of any of the packages providing schemas to the registry change.
+    """
+    global _SCHEMA_FINGERPRINT
+    if _SCHEMA_FINGERPRINT is not None:
+        return _SCHEMA_FINGERPRINT
+    hasher = _hashlib.sha256()
+    for dist_name in _SCHEMA_DISTRIBUTIONS:
+        try:
+            dist_version = _metadata.version(dist_name)
+        except _metadata.PackageNotFoundError:
+            dist_version = ""
+        hasher.update(f"{dist_name}=={dist_version}\n".encode())
+    for schema_filepath in sorted(_schema_dir_path.glob("**/*.yaml")):
+        hasher.update(schema_filepath.relative_to(_schema_dir_path).as_posix().encode())
+        hasher.update(schema_filepath.read_bytes())
+    _SCHEMA_FINGERPRINT = hasher.hexdigest()
+    return _SCHEMA_FINGERPRINT
+
+
+def metadata_fingerprint(data: dict) -> dict:
+    """Create a fingerprint for validated project metadata.
+
+    The fingerprint consists of the current schema fingerprint,
+    and a digest of the data excluding any existing fingerprint at `project.fingerprint`.
+    """
+    return {"schema": schema_fingerprint(), "digest": _metadata_digest(data)}
+
+
+def has_valid_fingerprint(data: dict) -> bool:
+    """Check whether project metadata carries a fingerprint matching the current schemas and its content."""
+    project = data.get("project")
+    fingerprint = project.get("fingerprint") if isinstance(project, dict) else None
+    if not isinstance(fingerprint, dict):
+        return False
+    return (
+        fingerprint.get("schema") == schema_fingerprint()
+        and fingerprint.get("digest") == _metadata_digest(data)
+    )
+
 
-    registry_before = resources_before @ _referencing.Registry()
-    return registry_before, registry_after
+def _metadata_digest(data: dict) -> str:
+    project = data.get("project")
+    if isinstance(project, dict) and "fingerprint" in project:
+        data = data | {"project": {key: value for key, value in project.items() if key != "fingerprint"}}
+    content = _json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return _hashlib.sha256(content.encode()).hexdigest()
+
+
+def _registry_snapshot_path(variant: _Literal["before", "after"]) -> _Path:
+    dirpath = _file_util.get_user_cache_dir() / _const.DIRNAME_USER_CACHE_SCHEMA
+    return dirpath / f"registry-{variant}-{schema_fingerprint()}.pickle"
+
+
+def _load_registry_snapshot(variant: _Literal["before", "after"]) -> _referencing.Registry | None:
+    """Load a processed registry from its on-disk snapshot, if a valid one exists."""
+    path = _registry_snapshot_path(variant=variant)
+    try:
+        with open(path, "rb") as f:
+            snapshot = _pickle.load(f)
+        resources = [
+            (uri, _referencing.Resource(contents=contents, specification=_SPECIFICATIONS[spec_name]))
+            for uri, contents, spec_name in snapshot
+        ]
+    except FileNotFoundError:
+        return
+    except Exception:
+        _logger.info(
+            "Schema Registry Snapshot",
+            f"Failed to load the schema registry snapshot at '{path}'; rebuilding the registry.",
+        )
+        return
+    return _referencing.Registry().with_resources(resources)
+
+
+def _save_registry_snapshot(registry: _referencing.Registry, variant: _Literal["before", "after"]) -> None:
+    """Write a processed registry to disk and remove outdated snapshots of the same variant.
+
+    Failures are logged and otherwise ignored, since the snapshot is only an optimization.
+    """
+    path = _registry_snapshot_path(variant=variant)
+    snapshot = [
+        (uri, _to_builtin(registry[uri].contents), registry[uri]._specification.name)
+        for uri in registry
+    ]
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with _tempfile.NamedTemporaryFile("wb", dir=path.parent, suffix=".tmp", delete=False) as f:
+            _pickle.dump(snapshot, f, protocol=_pickle.HIGHEST_PROTOCOL)
+        _os.replace(f.name, path)
+        for outdated_path in path.parent.glob(f"registry-{variant}-*.pickle"):
+            if outdated_path != path:
+                outdated_path.unlink(missing_ok=True)
+    except Exception:
+        _logger.info(
+            "Schema Registry Snapshot",
+            f"Failed to write the schema registry snapshot to '{path}'.",
+        )
+    return
+
+
+def _to_builtin(data):
+    """Recursively convert YAML mappings and sequences to built-in dicts and lists."""
+    if isinstance(data, dict):
+        return {key: _to_builtin(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_to_builtin(value) for value in data]
+    return data
 
 
 def get_registry():
@@ -544,5 +1303,3 @@ def _add_custom_keys(schema: dict):
     _js.edit.add_property(schema, "__custom_template__", {}, conditioner=conditioner)
     return
 
-
-_registry_before, _registry_after = _make_registry()
@@ -20,6 +20,17 @@ def to_internal(date: _dt.datetime) -> str:
     return date.astimezone(_dt.UTC).strftime(OUTPUT_FORMAT)
 
 
+def to_timestamp(date: _dt.datetime) -> str:
+    """Convert a date to a full-precision ISO 8601 timestamp in UTC."""
+    return date.astimezone(_dt.UTC).isoformat()
+
+
+def from_timestamp(timestamp: str) -> _dt.datetime:
+    """Parse an ISO 8601 timestamp, treating timestamps without timezone (e.g., bare dates) as UTC."""
+    date = _dt.datetime.fromisoformat(timestamp)
+    return date if date.tzinfo else date.replace(tzinfo=_dt.UTC)
+
+
 def to_iso_8601(date: _dt.datetime) -> str:
     return date.strftime("%Y-%m-%d")
 
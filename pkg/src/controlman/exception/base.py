@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING as _TYPE_CHECKING
+from typing import Callable as _Callable, TYPE_CHECKING as _TYPE_CHECKING
 from functools import partial as _partial
 from exceptionman import ReporterException as _ReporterException
 import mdit as _mdit
@@ -10,15 +10,38 @@ if _TYPE_CHECKING:
 
 
 class ControlManException(_ReporterException):
-    """Base class for all exceptions raised by ControlMan."""
-
-    def __init__(self, report: Document):
-        sphinx_config = {"html_title": "ControlMan Error Report"}
-        report.target_configs["sphinx"] = _mdit.target.sphinx(
-            renderer=_partial(
-                _mdit.render.sphinx,
-                config=_mdit.render.get_sphinx_config(sphinx_config)
-            )
-        )
+    """Base class for all exceptions raised by ControlMan.
+
+    The report can also be given as a function creating it.
+    The report, along with its Sphinx target configuration,
+    is then only created when it is first requested (e.g., by `report` or `str()`),
+    so that exceptions which are caught and handled never create their reports.
+    """
+
+    def __init__(self, report: Document | _Callable[[], Document]):
         super().__init__(report=report)
         return
+
+    @property
+    def report(self) -> Document:
+        if self._report is None:
+            report = self._report_factory()
+            sphinx_config = {"html_title": "ControlMan Error Report"}
+            report.target_configs["sphinx"] = _mdit.target.sphinx(
+                renderer=_partial(
+                    _mdit.render.sphinx,
+                    config=_mdit.render.get_sphinx_config(sphinx_config)
+                )
+            )
+            self._report = report
+            self._report_factory = None
+        return self._report
+
+    @report.setter
+    def report(self, value: Document | _Callable[[], Document]):
+        self._report = None
+        self._report_factory = value if callable(value) else lambda: value
+        return
+
+    def __str__(self) -> str:
+        return self.report.source(target="github")
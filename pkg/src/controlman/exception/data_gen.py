@@ -55,6 +55,47 @@ class RemoteGitHubRepoNotFoundError(_ControlManException):
         return
 
 
+class ControlManWebDataUnavailableError(_ControlManException):
+    """Exception raised when web data is requested whose retrieval recently failed.
+
+    Failed retrievals are cached (see `controlman.cache_manager.CacheManager.set_failure`),
+    so that they are not retried on each run until the failure expires.
+    The report is created (and the error logged) when it is first requested.
+    """
+
+    def __init__(self, typ: str, key: str, failure: dict):
+        super().__init__(self._make_report)
+        self.typ = typ
+        self.key = key
+        self.failure = failure
+        return
+
+    def _make_report(self) -> _mdit.Document:
+        intro = _mdit.inline_container(
+            "Failed to retrieve ",
+            _mdit.element.code_span(f"{self.typ}.{self.key}"),
+            " from the web.",
+        )
+        problem = _mdit.inline_container(
+            f"The last attempt at {self.failure['timestamp']} failed with ",
+            _mdit.element.code_span(self.failure["kind"]),
+            f": {self.failure['message']} ",
+            "The request is not retried until this cached failure expires.",
+        )
+        _logger.critical(
+            "Web Data Unavailable",
+            intro,
+            problem,
+        )
+        return _mdit.document(
+            heading="Web Data Error",
+            body={
+                "intro": intro,
+                "problem": problem,
+            },
+        )
+
+
 class ControlManWebsiteError(_ControlManException):
     """Exception raised when issues are encountered with the website."""
 
@@ -1,6 +1,6 @@
 from __future__ import annotations as _annotations
 
-from typing import Literal as _Literal, TYPE_CHECKING as _TYPE_CHECKING
+from typing import Callable as _Callable, Literal as _Literal, TYPE_CHECKING as _TYPE_CHECKING
 from pathlib import Path as _Path
 
 import pyserials as _ps
@@ -11,11 +11,17 @@ from controlman.exception import ControlManException as _ControlManException
 from loggerman import logger as _logger
 
 if _TYPE_CHECKING:
+    from mdit import Document
     from pylinks.exception.api import WebAPIError
 
 
 class ControlManDataReadException(_ControlManException):
-    """Base class for all exceptions raised when a data cannot be read."""
+    """Base class for all exceptions raised when a data cannot be read.
+
+    The data is only held by reference,
+    and only summarized in the report (see `data_summary`);
+    the report and the summary are created when first requested.
+    """
 
     def __init__(
         self,
@@ -25,16 +31,35 @@ class ControlManDataReadException(_ControlManException):
         data: str | dict | None = None,
         cause: Exception | None = None,
     ):
-        report = _mdit.document(
-            heading="Data Read Error",
-            body={"intro": intro, "problem": problem},
-            section=section,
-        )
-        super().__init__(report)
+        self._intro = intro
+        self._problem = problem
+        self._section = section
+        super().__init__(self._make_report)
         self.data = data
         self.cause = cause
+        self._data_summary = None
         return
 
+    @property
+    def data_summary(self) -> str | None:
+        """Short description of the data's type, size and top-level keys."""
+        if self._data_summary is None and self.data is not None:
+            self._data_summary = _summarize_data(self.data)
+        return self._data_summary
+
+    def _make_report(self) -> Document:
+        body = {"intro": self._intro, "problem": self._problem}
+        if self.data_summary:
+            body["data"] = _mdit.inline_container("Data: ", self.data_summary)
+        return _mdit.document(
+            heading="Data Read Error",
+            body=body,
+            section=self._report_section(),
+        )
+
+    def _report_section(self) -> dict | None:
+        return self._section
+
 
 class ControlManConfigFileReadException(ControlManDataReadException):
     """Base class for all exceptions raised when a control center configuration file cannot be read."""
@@ -162,7 +187,13 @@ class ControlManEmptyTagInConfigFileError(ControlManInvalidConfigFileTagExceptio
 
 
 class ControlManUnreachableTagInConfigFileError(ControlManInvalidConfigFileTagException):
-    """Exception raised when a control center configuration file contains an unreachable tag."""
+    """Exception raised when a control center configuration file contains an unreachable tag.
+
+    Either the error raised by the download (`cause`) is given,
+    or the cached failure of a previous download (`failure`; see `controlman.cache_manager.CacheManager.get_failure`)
+    when the download was not retried.
+    The problem description is created (and the error logged) when the report is first requested.
+    """
 
     def __init__(
         self,
@@ -170,32 +201,45 @@ class ControlManUnreachableTagInConfigFileError(ControlManInvalidConfigFileTagEx
         data: str,
         node: _yaml.ScalarNode,
         url: str,
-        cause: WebAPIError,
+        cause: WebAPIError | None = None,
+        failure: dict | None = None,
     ):
-        problem = _mdit.inline_container(
+        super().__init__(
+            filepath=filepath,
+            data=data,
+            problem=None,
+            node=node,
+            cause=cause,
+        )
+        self.url = url
+        self.failure = failure
+        return
+
+    def _make_report(self) -> Document:
+        cause = self.cause
+        self._problem = _mdit.inline_container(
             "Failed to download external configurations from ",
-            _mdit.element.code_span(url),
+            _mdit.element.code_span(self.url),
             " defined in ",
-            _mdit.element.code_span(node.tag),
+            _mdit.element.code_span(self.tag_name),
             " tag at line ",
-            _mdit.element.code_span(str(node.start_mark.line + 1)),
+            _mdit.element.code_span(str(self.start_line)),
             ". ",
-            cause.report.body["intro"].content,
+            cause.report.body["intro"].content if cause else (
+                f"The last attempt at {self.failure['timestamp']} failed with "
+                f"{self.failure['kind']}: {self.failure['message']} "
+                "The download is not retried until this cached failure expires."
+            ),
         )
         _logger.critical(
             "Unreachable Tag in Configuration File",
-            problem,
-            cause.report.section["details"].content,
-        )
-        super().__init__(
-            filepath=filepath,
-            data=data,
-            problem=problem,
-            node=node,
-            cause=cause,
-            section=cause.report.section,
+            self._problem,
+            *([cause.report.section["details"].content] if cause else []),
         )
-        return
+        return super()._make_report()
+
+    def _report_section(self) -> dict | None:
+        return self.cause.report.section if self.cause else None
 
 
 class ControlManInvalidMetadataError(ControlManDataReadException):
@@ -230,7 +274,14 @@ class ControlManInvalidMetadataError(ControlManDataReadException):
 
 
 class ControlManSchemaValidationError(ControlManDataReadException):
-    """Exception raised when a control center file is invalid against its schema."""
+    """Exception raised when a control center file is invalid against its schema.
+
+    When a `cause_factory` is given instead of a `cause`,
+    the cause is only created when the `cause` or the `report` is first requested.
+    Without a `problem`, the problem is taken from the cause when creating the report.
+    The error is logged when its report is created, i.e., when it is reported;
+    errors that are caught and handled are thus not logged.
+    """
 
     def __init__(
         self,
@@ -240,7 +291,9 @@ class ControlManSchemaValidationError(ControlManDataReadException):
         problem: str | None = None,
         json_path: str | None = None,
         data: dict | None = None,
+        cause_factory: _Callable[[], _ps.exception.validate.PySerialsValidateException] | None = None,
     ):
+        self._cause_factory = cause_factory
         intro = _mdit.inline_container(
             "Control center configurations are " if source == "source" else "Project metadata is ",
             "invalid against the schema",
@@ -250,20 +303,54 @@ class ControlManSchemaValidationError(ControlManDataReadException):
                 ".",
             ),
         )
-        problem = problem or cause.report.body["problem"].content if cause else ""
-        _logger.critical(
-            "Schema Validation Error",
-            intro,
-            problem,
-        )
         super().__init__(
             intro=intro,
             problem=problem,
-            section=cause.report.section if cause else None,
-            data=data or cause.data,
+            data=data if data is not None or not cause else cause.data,
             cause=cause,
         )
         self.source = source
         self.before_substitution = before_substitution
         self.key = json_path
         return
+
+    @property
+    def cause(self) -> Exception | None:
+        if self._cause_factory is not None:
+            self._cause = self._cause_factory()
+            self._cause_factory = None
+        return self._cause
+
+    @cause.setter
+    def cause(self, value: Exception | None):
+        self._cause = value
+        return
+
+    def _make_report(self) -> Document:
+        if not self._problem:
+            cause = self.cause
+            self._problem = cause.report.body["problem"].content if cause else ""
+        _logger.critical(
+            "Schema Validation Error",
+            self._intro,
+            self._problem,
+        )
+        return super()._make_report()
+
+    def _report_section(self) -> dict | None:
+        cause = self.cause
+        return cause.report.section if cause else None
+
+
+def _summarize_data(data, max_keys: int = 5) -> str:
+    """Summarize data by its type, size, and first top-level keys."""
+    if isinstance(data, dict):
+        keys = ", ".join(str(key) for key in list(data)[:max_keys])
+        more = ", ..." if len(data) > max_keys else ""
+        return f"Mapping with {len(data)} top-level keys ({keys}{more})."
+    if isinstance(data, (list, tuple)):
+        return f"Sequence with {len(data)} items."
+    if isinstance(data, str):
+        count_lines = data.count("\n") + 1
+        return f"String with {len(data)} characters in {count_lines} lines."
+    return f"Object of type {type(data).__name__}."
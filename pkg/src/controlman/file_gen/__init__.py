@@ -3,6 +3,7 @@ from pathlib import Path as _Path
 import pyserials as _ps
 
 from controlman import datatype as _dtype, const as _const
+from controlman import data_validator as _data_validator
 from controlman.file_gen.config import ConfigFileGenerator as _ConfigFileGenerator
 from controlman.file_gen.forms import FormGenerator as _FormGenerator
 from controlman.file_gen.python import PythonPackageFileGenerator as _PythonPackageFileGenerator
@@ -62,6 +63,7 @@ def generate(
                 raise RuntimeError(f"Duplicate dynamic file subtype: {generated_file.subtype[0]}")
             type_dict[generated_file.subtype[0]] = generated_file.path
     data["project.file"] = data_entry
+    data["project.fingerprint"] = _data_validator.metadata_fingerprint(data())
     metadata_file = _dtype.DynamicFile(
         type=_dtype.DynamicFileType.CONFIG,
         subtype=("meta", "Metadata"),
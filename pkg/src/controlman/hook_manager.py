@@ -136,6 +136,10 @@ class HookManager:
             )
         return
 
+    def has_hook(self, method: str) -> bool:
+        """Whether a staged hook is defined for the given stage."""
+        return bool(self._generator and getattr(self._generator, method, None))
+
     def generate(self, method: str, *args, **kwargs):
         log_title = "Hook Execution"
         if not self._generator:
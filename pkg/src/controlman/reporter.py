@@ -15,10 +15,12 @@ class ControlCenterReporter:
         metadata: list[tuple[str, DynamicFileChangeType]],
         files: list[_GeneratedFile],
         dirs: list[_DynamicDir],
+        cache_stats: dict[str, dict[str, int | float]] | None = None,
     ):
         self.metadata = metadata
         self.files = files
         self.dirs = dirs
+        self.cache_stats = cache_stats
         self.has_changed_metadata = bool(self.metadata)
         self.has_changed_files = any(
             file.change not in (DynamicFileChangeType.DISABLED, DynamicFileChangeType.UNCHANGED)
@@ -53,14 +55,18 @@ class ControlCenterReporter:
         return self._create_document(content=content, section=section)
 
     def _create_document(self, content, section: dict | None = None) -> _mdit.Document:
-        details_section = _mdit.document(
-            heading="Changes",
-            section=section,
-        )
+        sections = {}
+        if section:
+            sections["changes"] = _mdit.document(
+                heading="Changes",
+                section=section,
+            )
+        if self.cache_stats:
+            sections["cache"] = self._report_cache()
         return _mdit.document(
             heading="Control Center Report",
             body={"summary": content},
-            section={"changes": details_section} if section else None,
+            section=sections or None,
         )
 
     def _report_metadata(self):
@@ -151,6 +157,37 @@ class ControlCenterReporter:
         )
         return page
 
+    def _report_cache(self) -> _mdit.Document:
+        rows = [["Type", "Hits", "Misses", "Expired", "Hit Rate", "Sets", "Read", "Written", "Fetch Time"]]
+        for typ, stats in self.cache_stats.items():
+            lookups = stats["hits"] + stats["misses"] + stats["expirations"]
+            rows.append(
+                [
+                    _mdit.element.code_span(typ),
+                    str(stats["hits"]),
+                    str(stats["misses"]),
+                    str(stats["expirations"]),
+                    f"{stats['hits'] / lookups:.0%}" if lookups else "—",
+                    str(stats["sets"]),
+                    f"{stats['bytes_read'] / 1024:.1f} KB",
+                    f"{stats['bytes_written'] / 1024:.1f} KB",
+                    f"{stats['fetch_seconds']:.2f} s",
+                ]
+            )
+        table = _mdit.element.table(
+            rows,
+            caption="📊 Usage of the control center cache per cache type.",
+            align_table="center",
+            align_columns=["left"] + ["right"] * 8,
+            num_rows_header=1,
+            width_columns="auto",
+        )
+        page = _mdit.document(
+            heading="Cache",
+            body={"table": table},
+        )
+        return page
+
     @staticmethod
     def _comma_list(l):
         if len(l) == 1:
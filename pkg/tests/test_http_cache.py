@@ -0,0 +1,98 @@
+"""Tests of `controlman._http_cache` against a local stand-in HTTP server."""
+
+from __future__ import annotations
+
+from http import server as http_server
+import threading
+
+import pytest
+import requests
+from pylinks import http as pylinks_http
+
+from controlman import _cache_backend, _http_cache
+
+
+class _Handler(http_server.BaseHTTPRequestHandler):
+    """Serve a fixed body with an `ETag`, answering matching conditional requests with 304."""
+
+    etag = '"v1"'
+    body = b'{"name": "controlman"}'
+
+    def do_GET(self):
+        self.server.received.append(dict(self.headers))
+        served = str(len(self.server.received))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.send_header("X-Served", served)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.send_header("ETag", self.etag)
+        self.send_header("X-Served", served)
+        self.end_headers()
+        self.wfile.write(self.body)
+        return
+
+    def log_message(self, *args):
+        return
+
+
+@pytest.fixture
+def server():
+    httpd = http_server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.received = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+    thread.join()
+
+
+def _url(server) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}/data"
+
+
+def test_stores_response(server):
+    backend = _cache_backend.DictCacheBackend()
+    with _http_cache.enable(backend):
+        data = pylinks_http.request(_url(server), response_type="json")
+    assert data == {"name": "controlman"}
+    item = backend.get(_http_cache.CACHE_TYPE, _url(server))
+    assert item["data"]["status"] == 200
+    assert item["data"]["headers"]["etag"] == _Handler.etag
+    assert "If-None-Match" not in server.received[0]
+
+
+def test_revalidates_with_not_modified(server):
+    backend = _cache_backend.DictCacheBackend()
+    with _http_cache.enable(backend):
+        pylinks_http.request(_url(server), response_type="json")
+    with _http_cache.enable(backend):
+        response = pylinks_http.request(_url(server))
+    assert server.received[1]["If-None-Match"] == _Handler.etag
+    assert response.status_code == 200
+    assert response.json() == {"name": "controlman"}
+
+
+def test_refreshes_stored_headers(server):
+    backend = _cache_backend.DictCacheBackend()
+    with _http_cache.enable(backend):
+        pylinks_http.request(_url(server))
+        assert backend.get(_http_cache.CACHE_TYPE, _url(server))["data"]["headers"]["x-served"] == "1"
+        pylinks_http.request(_url(server))
+    entry = backend.get(_http_cache.CACHE_TYPE, _url(server))["data"]
+    assert entry["headers"]["x-served"] == "2"
+    assert entry["body"]
+
+
+def test_other_sessions_unaffected(server):
+    backend = _cache_backend.DictCacheBackend()
+    with _http_cache.enable(backend):
+        pylinks_http.request(_url(server))
+        requests.get(_url(server), timeout=10)
+    assert "If-None-Match" not in server.received[1]
+    assert pylinks_http.requests is requests